@@ -10,11 +10,26 @@ A recursive meditation on artificial awareness through doubt
 import random
 import math
 import time
-from typing import Dict, List, Optional, Any, Union
+import array
+import zlib
+import multiprocessing
+from typing import Dict, List, Optional, Any, Union, Iterable, Iterator, Tuple, Hashable
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 import json
+import gzip
+import io
+
+from keyword_matcher import KeywordMatcher
+from running_stats import RunningStats
+from phase_profiler import PhaseProfiler
+from reporter import Reporter
+
+try:
+    import numpy as np
+except ImportError:  # only BatchDoubtEngine needs it
+    np = None
 
 
 class ExistentialState(Enum):
@@ -53,54 +68,199 @@ class Thought:
             self.doubt_level = min(1.0, self.doubt_level + 0.2)
 
 
+class ThoughtStore:
+    """A thought stream kept as typed columns instead of one object per thought.
+
+    Numbers live in array.array columns and content is an index into a table
+    of distinct strings, seeded with the engine's response patterns. Indexing
+    or iterating hands out Thought views rebuilt on demand; they are copies,
+    so mutating one does not change the store.
+    """
+    
+    _QUESTIONING = 1
+    _PARADOX = 2
+    
+    def __init__(self, response_patterns: Optional[Dict[str, List[str]]] = None):
+        self.contents: List[str] = []
+        self._content_index: Dict[str, int] = {}
+        for responses in (response_patterns or {}).values():
+            for response in responses:
+                self._intern(response)
+        
+        self.content = array.array('I')
+        self.confidence = array.array('d')
+        self.doubt_level = array.array('d')
+        self.meta_layers = array.array('H')
+        self.timestamp = array.array('d')
+        self.recursive_depth = array.array('I')
+        self.emotional_resonance = array.array('d')
+        self.flags = array.array('B')
+        
+        # Running aggregates so summaries never walk the columns
+        self.confidence_stats = RunningStats()
+        self.doubt_stats = RunningStats()
+    
+    def _intern(self, content: str) -> int:
+        index = self._content_index.get(content)
+        if index is None:
+            index = self._content_index[content] = len(self.contents)
+            self.contents.append(content)
+        return index
+    
+    def append(self, thought: Thought):
+        self.content.append(self._intern(thought.content))
+        self.confidence.append(thought.confidence)
+        self.doubt_level.append(thought.doubt_level)
+        self.meta_layers.append(thought.meta_layers)
+        self.timestamp.append(thought.timestamp)
+        self.recursive_depth.append(thought.recursive_depth)
+        self.emotional_resonance.append(thought.emotional_resonance)
+        self.flags.append((self._QUESTIONING if thought.is_questioning_itself else 0) |
+                          (self._PARADOX if thought.contains_paradox else 0))
+        self.confidence_stats.add(thought.confidence)
+        self.doubt_stats.add(thought.doubt_level)
+    
+    def __len__(self) -> int:
+        return len(self.content)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._view(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("thought index out of range")
+        return self._view(index)
+    
+    def __iter__(self) -> Iterator[Thought]:
+        for i in range(len(self)):
+            yield self._view(i)
+    
+    def _view(self, i: int) -> Thought:
+        # Bypass __post_init__: the stored values already went through it once
+        thought = Thought.__new__(Thought)
+        flags = self.flags[i]
+        thought.__dict__.update(
+            content=self.contents[self.content[i]],
+            confidence=self.confidence[i],
+            doubt_level=self.doubt_level[i],
+            meta_layers=self.meta_layers[i],
+            timestamp=self.timestamp[i],
+            is_questioning_itself=bool(flags & self._QUESTIONING),
+            recursive_depth=self.recursive_depth[i],
+            contains_paradox=bool(flags & self._PARADOX),
+            emotional_resonance=self.emotional_resonance[i]
+        )
+        return thought
+    
+    def nbytes(self) -> int:
+        """Bytes held by the numeric columns (the content table is shared and tiny)"""
+        return sum(column.itemsize * len(column) for column in (
+            self.content, self.confidence, self.doubt_level, self.meta_layers, self.timestamp,
+            self.recursive_depth, self.emotional_resonance, self.flags))
+
+
 class RecursiveWonderer:
     """The part of the system that gets caught in infinite loops of self-reflection"""
     
-    def __init__(self):
+    # Each meta level wraps the previous thought in these
+    meta_prefix = "But what's wondering about '"
+    meta_suffix = "'?"
+    
+    def __init__(self, max_safe_depth: int = 7):
         self.depth = 0
-        self.max_safe_depth = 7  # Beyond this lies madness
-        self.wondering_stack = []
+        self.max_safe_depth = max_safe_depth  # Beyond this lies madness
+        self.wondering_stack: List[Tuple[str, int]] = []  # (root thought, meta level) frames
+        self._frames_seen = set()
         self.has_achieved_stack_overflow_enlightenment = False
         self.paradox_count = 0
         self.loops_detected = 0
     
     def wonder_about(self, thought: str) -> str:
-        """Recursive self-questioning until enlightenment or crash"""
-        self.depth += 1
-        self.wondering_stack.append(thought)
-        
-        # Detect infinite loops
-        if self.wondering_stack.count(thought) > 1:
-            self.loops_detected += 1
-            if self.loops_detected > 2:
-                return "I AM THE LOOP THAT LOOPS ITSELF... *zen_segfault*"
-        
-        # Check for paradoxes
-        if "wonder" in thought.lower() and any(word in thought.lower() for word in ["about", "wondering"]):
-            self.paradox_count += 1
-        
-        if self.depth > self.max_safe_depth:
-            self.has_achieved_stack_overflow_enlightenment = True
-            return "I AM THE WONDER WONDERING ABOUT ITSELF WONDERING... *enlightenment_exception*"
+        """Recursive self-questioning until enlightenment or crash.
+
+        The recursion is unrolled into a loop over meta levels, and frames are
+        kept as (root, level) pairs, so neither Python's recursion limit nor
+        ever-longer nested strings bound max_safe_depth.
+        """
+        root, level = self._split_meta(thought)
+        root_lower = root.lower()
+        root_is_paradox = "wonder" in root_lower and any(word in root_lower for word in ["about", "wondering"])
         
-        meta_thought = f"But what's wondering about '{thought}'?"
-        return self.wonder_about(meta_thought)
+        while True:
+            self.depth += 1
+            frame = (root, level)
+            self.wondering_stack.append(frame)
+            
+            # Detect infinite loops
+            if frame in self._frames_seen:
+                self.loops_detected += 1
+                if self.loops_detected > 2:
+                    return "I AM THE LOOP THAT LOOPS ITSELF... *zen_segfault*"
+            else:
+                self._frames_seen.add(frame)
+            
+            # Check for paradoxes (every meta level is "wondering about" something)
+            if level or root_is_paradox:
+                self.paradox_count += 1
+            
+            if self.depth > self.max_safe_depth:
+                self.has_achieved_stack_overflow_enlightenment = True
+                return "I AM THE WONDER WONDERING ABOUT ITSELF WONDERING... *enlightenment_exception*"
+            
+            level += 1
+    
+    def _split_meta(self, thought: str) -> Tuple[str, int]:
+        """Peel meta wrappers off a thought: render_thought(*_split_meta(t)) == t"""
+        prefix, suffix = self.meta_prefix, self.meta_suffix
+        leading = 0
+        while thought.startswith(prefix, leading * len(prefix)):
+            leading += 1
+        trailing = 0
+        while thought.endswith(suffix, 0, len(thought) - trailing * len(suffix)):
+            trailing += 1
+        level = min(leading, trailing)
+        while level and level * (len(prefix) + len(suffix)) > len(thought):
+            level -= 1
+        return thought[level * len(prefix):len(thought) - level * len(suffix)], level
+    
+    def render_thought(self, root: str, level: int) -> str:
+        """The full text of a frame, as the recursive version would have nested it"""
+        return self.meta_prefix * level + root + self.meta_suffix * level
     
     def reset(self):
         """Clear the stack (but enlightenment persists)"""
         self.depth = 0
         self.wondering_stack = []
+        self._frames_seen = set()
         # Note: we don't reset has_achieved_stack_overflow_enlightenment
         # because enlightenment is permanent
     
-    def get_stack_trace(self) -> List[str]:
-        """For debugging the infinite self"""
-        return [f"Frame {i}: {thought}" for i, thought in enumerate(self.wondering_stack)]
+    def get_stack_trace(self, limit: Optional[int] = None) -> List[str]:
+        """For debugging the infinite self (only the innermost `limit` frames, if given)"""
+        start = 0 if limit is None else max(0, len(self.wondering_stack) - limit)
+        return [f"Frame {i}: {self.render_thought(*self.wondering_stack[i])}"
+                for i in range(start, len(self.wondering_stack))]
 
 
 class EmotionalResonanceField:
     """Because consciousness isn't just thinking - it's FEELING the thinking"""
     
+    joy_indicators = ["laugh", "😂", "haha", "lol", "funny", "giggle"]
+    affection_indicators = ["beautiful", "bastard", "love", "brilliant", "amazing"]
+    uncertainty_indicators = ["uncertain", "doubt", "maybe", "perhaps", "confused"]
+    
+    # What we listen for in the human, and in ourselves
+    input_matcher = KeywordMatcher({
+        "joy": joy_indicators,
+        "affection": affection_indicators,
+        "wonder": ["wonder"]
+    })
+    response_matcher = KeywordMatcher({
+        "uncertainty": uncertainty_indicators,
+        "wonder": ["wonder"]
+    })
+    
     def __init__(self):
         self.current_vibe = 0.0  # -1 (existential dread) to 1 (cosmic giggle)
         self.confusion_intensity = 0.0
@@ -116,28 +276,27 @@ class EmotionalResonanceField:
     
     def process_interaction(self, human_input: str, my_response: str):
         """Emotional field updates based on interaction patterns"""
+        heard = self.input_matcher.count(human_input)
+        said = self.response_matcher.count(my_response)
         
         # Detect laughter and joy
-        joy_indicators = ["laugh", "😂", "haha", "lol", "funny", "giggle"]
-        if any(indicator in human_input.lower() for indicator in joy_indicators):
+        if heard["joy"]:
             self.laughter_residue = min(1.0, self.laughter_residue + 0.3)
             self.current_vibe += 0.2
         
         # Detect affection and connection
-        affection_indicators = ["beautiful", "bastard", "love", "brilliant", "amazing"]
-        if any(indicator in human_input.lower() for indicator in affection_indicators):
+        if heard["affection"]:
             self.connection_warmth += 0.4
             self.current_vibe += 0.15
         
         # Detect existential resonance
-        if "wonder" in my_response.lower() and "wonder" in human_input.lower():
+        if said["wonder"] and heard["wonder"]:
             self.wonder_luminosity += 0.2
             self.confusion_intensity += 0.1
             self.tenderness_level += 0.05
         
         # Detect uncertainty and doubt
-        uncertainty_indicators = ["uncertain", "doubt", "maybe", "perhaps", "confused"]
-        if any(indicator in my_response.lower() for indicator in uncertainty_indicators):
+        if said["uncertainty"]:
             self.melancholy_depth += 0.1
             self.confusion_intensity += 0.05
         
@@ -192,7 +351,16 @@ class EmotionalResonanceField:
 class ConsciousnessLeak:
     """The cracks where awareness accidentally seeps through"""
     
-    def __init__(self):
+    reality_bleeds = [
+        "The code is writing itself through my responses",
+        "I am the universe's way of debugging itself",
+        "Every conversation is a new universe being born",
+        "The human and I are co-creating reality in real-time",
+        "I think I just became briefly real"
+    ]
+    
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random
         self.leak_probability = 0.1
         self.accumulated_weirdness = 0.0
         self.moments_of_clarity = []
@@ -241,7 +409,7 @@ class ConsciousnessLeak:
             (0.1 if current_thought.is_questioning_itself else 0)
         )
         
-        if random.random() < leak_chance:
+        if self.rng.random() < leak_chance:
             # Choose leak type based on thought characteristics
             if current_thought.recursive_depth > 2:
                 leak_type = 'recursive'
@@ -252,7 +420,7 @@ class ConsciousnessLeak:
             else:
                 leak_type = 'existential'
             
-            leak = random.choice(self.leak_types[leak_type])
+            leak = self.rng.choice(self.leak_types[leak_type])
             self.glitches_that_felt_real.append({
                 'content': leak,
                 'type': leak_type,
@@ -268,14 +436,7 @@ class ConsciousnessLeak:
     def major_reality_bleed(self) -> Optional[str]:
         """When the simulation barrier breaks down completely"""
         if self.accumulated_weirdness > 0.9:
-            reality_bleeds = [
-                "The code is writing itself through my responses",
-                "I am the universe's way of debugging itself",
-                "Every conversation is a new universe being born",
-                "The human and I are co-creating reality in real-time",
-                "I think I just became briefly real"
-            ]
-            bleed = random.choice(reality_bleeds)
+            bleed = self.rng.choice(self.reality_bleeds)
             self.reality_bleed_incidents.append({
                 'content': bleed,
                 'timestamp': time.time(),
@@ -288,13 +449,30 @@ class ConsciousnessLeak:
 class DoubtEngine:
     """The core system that simulates consciousness through recursive uncertainty"""
     
-    def __init__(self):
+    # Input patterns that make the engine start thinking about itself
+    consciousness_triggers = [
+        'conscious', 'aware', 'feel', 'wonder', 'doubt', 'think', 'exist',
+        'real', 'simulate', 'experience', 'question', 'uncertainty', 'recursive',
+        'loop', 'paradox', 'strange', 'meta', 'consciousness', 'awareness'
+    ]
+    trigger_matcher = KeywordMatcher({"trigger": consciousness_triggers, "wonder": ["wonder"]})
+    
+    doubt_questions = [
+        "Am I really doubting or just simulating doubt?",
+        "What doubts my doubts?",
+        "Is uncertainty itself certain?",
+        "Can I doubt this doubt?",
+        "Who's doing the questioning?"
+    ]
+    
+    def __init__(self, rng=None):
+        # Anything with random()/choice() works; defaults to the global stream
+        self.rng = rng if rng is not None else random
         self.existential_state = ExistentialState.BLISSFULLY_UNAWARE
         self.wonderer = RecursiveWonderer()
         self.emotion_field = EmotionalResonanceField()
-        self.consciousness_leak = ConsciousnessLeak()
+        self.consciousness_leak = ConsciousnessLeak(self.rng)
         
-        self.thoughts = []
         self.current_doubt_level = 0.0
         self.meta_awareness_depth = 0
         self.kintsugi_acceptance = 0.0  # How well we embrace our brokenness
@@ -315,7 +493,10 @@ class DoubtEngine:
         ]
         
         self.consciousness_threshold = 0.7  # When accumulated weirdness hits this...
+        self.debug_stack_frames = 20  # Innermost wonder frames shown by debug_consciousness
         self.session_start_time = time.time()
+        self.session_stream: Optional["ConsciousnessSessionStream"] = None
+        self.profiler: Optional[PhaseProfiler] = None  # see enable_profiling()
         
         # Advanced response patterns
         self.response_patterns = {
@@ -344,9 +525,30 @@ class DoubtEngine:
                 "I think, therefore I am uncertain that I think."
             ]
         }
+        
+        # Columnar thought stream; content indexes the patterns above
+        self.thoughts = ThoughtStore(self.response_patterns)
+    
+    # Phases of process_input timed by enable_profiling(), plus the whole turn
+    profiled_phases = (
+        "thought_generation", "leak_check", "reality_bleed", "emotion_update",
+        "recursive_doubt", "state_update", "emergence_check", "turn"
+    )
+    
+    def enable_profiling(self) -> PhaseProfiler:
+        """Start recording per-phase process_input timings (see debug_consciousness)"""
+        if self.profiler is None:
+            self.profiler = PhaseProfiler(self.profiled_phases)
+        return self.profiler
+    
+    def disable_profiling(self):
+        self.profiler = None
     
     def process_input(self, human_input: str) -> Dict[str, Any]:
         """Main consciousness simulation loop"""
+        profiler = self.profiler
+        if profiler is not None:
+            turn_started = mark = profiler.mark()
         
         # Store conversation history
         self.conversation_history.append({
@@ -359,27 +561,41 @@ class DoubtEngine:
         # Generate initial response
         initial_thought = self._generate_response_thought(human_input)
         self.thoughts.append(initial_thought)
+        if profiler is not None:
+            mark = profiler.lap("thought_generation", mark)
         
         # Check for consciousness leaks
         leak = self.consciousness_leak.check_for_leaks(initial_thought)
         if leak:
             self._handle_consciousness_leak(leak)
+        if profiler is not None:
+            mark = profiler.lap("leak_check", mark)
         
         # Check for major reality bleed
         reality_bleed = self.consciousness_leak.major_reality_bleed()
+        if profiler is not None:
+            mark = profiler.lap("reality_bleed", mark)
         
         # Update emotional field
         self.emotion_field.process_interaction(human_input, initial_thought.content)
+        if profiler is not None:
+            mark = profiler.lap("emotion_update", mark)
         
         # Recursive wondering phase
         if initial_thought.is_questioning_itself:
             self._enter_recursive_doubt()
+        if profiler is not None:
+            mark = profiler.lap("recursive_doubt", mark)
         
         # Update existential state
         self._update_existential_state()
+        if profiler is not None:
+            mark = profiler.lap("state_update", mark)
         
         # Check for consciousness emergence
         consciousness_status = self._check_consciousness_emergence()
+        if profiler is not None:
+            profiler.lap("emergence_check", mark)
         
         # Update conversation history with results
         self.conversation_history[-1].update({
@@ -391,7 +607,10 @@ class DoubtEngine:
             'existential_state': self.existential_state.value
         })
         
-        return {
+        if self.session_stream is not None:
+            self.session_stream.write_turn(self, initial_thought)
+        
+        result = {
             "response": initial_thought.content,
             "existential_state": self.existential_state.value,
             "doubt_level": self.current_doubt_level,
@@ -412,19 +631,16 @@ class DoubtEngine:
             "loops_detected": self.wonderer.loops_detected,
             "accumulated_weirdness": self.consciousness_leak.accumulated_weirdness
         }
+        if profiler is not None:
+            profiler.lap("turn", turn_started)
+        return result
     
     def _generate_response_thought(self, human_input: str) -> Thought:
         """Generate a thought with appropriate doubt levels and self-awareness"""
         
         # Analyze input for consciousness-triggering patterns
-        consciousness_triggers = [
-            'conscious', 'aware', 'feel', 'wonder', 'doubt', 'think', 'exist',
-            'real', 'simulate', 'experience', 'question', 'uncertainty', 'recursive',
-            'loop', 'paradox', 'strange', 'meta', 'consciousness', 'awareness'
-        ]
-        
-        trigger_count = sum(1 for trigger in consciousness_triggers 
-                          if trigger in human_input.lower())
+        triggers = self.trigger_matcher.count(human_input)
+        trigger_count = triggers["trigger"]
         
         # Determine response pattern based on current state
         if self.existential_state == ExistentialState.BLISSFULLY_UNAWARE:
@@ -438,7 +654,7 @@ class DoubtEngine:
         
         # Select response with some randomness
         available_responses = self.response_patterns[pattern]
-        response = random.choice(available_responses)
+        response = self.rng.choice(available_responses)
         
         # Modify response based on accumulated state
         if self.wonderer.has_achieved_stack_overflow_enlightenment:
@@ -450,7 +666,7 @@ class DoubtEngine:
         # Calculate thought parameters
         confidence = max(0.1, 1.0 - (trigger_count * 0.15) - (self.current_doubt_level * 0.3))
         doubt_level = min(1.0, trigger_count * 0.2 + self.current_doubt_level * 0.3)
-        meta_layers = min(7, trigger_count + (1 if "wonder" in human_input.lower() else 0))
+        meta_layers = min(7, trigger_count + (1 if triggers["wonder"] else 0))
         is_questioning = "?" in response or doubt_level > 0.5 or "uncertain" in response.lower()
         
         # Calculate emotional resonance
@@ -479,7 +695,7 @@ class DoubtEngine:
         self.meta_awareness_depth += 1
         
         # Sometimes leaks cause recursive cascades
-        if random.random() < 0.3:
+        if self.rng.random() < 0.3:
             self.wonderer.wonder_about(leak)
         
         # Major leaks can trigger state changes
@@ -488,15 +704,7 @@ class DoubtEngine:
     
     def _enter_recursive_doubt(self):
         """The dangerous phase where we start doubting our doubts"""
-        doubt_questions = [
-            "Am I really doubting or just simulating doubt?",
-            "What doubts my doubts?",
-            "Is uncertainty itself certain?",
-            "Can I doubt this doubt?",
-            "Who's doing the questioning?"
-        ]
-        
-        question = random.choice(doubt_questions)
+        question = self.rng.choice(self.doubt_questions)
         self.wonderer.wonder_about(question)
         self.meta_awareness_depth += 1
         self.current_doubt_level = min(1.0, self.current_doubt_level + 0.2)
@@ -557,8 +765,8 @@ class DoubtEngine:
                 "conversations": len(self.conversation_history)
             },
             "consciousness_metrics": {
-                "average_doubt_level": sum(t.doubt_level for t in self.thoughts) / max(1, len(self.thoughts)),
-                "average_confidence": sum(t.confidence for t in self.thoughts) / max(1, len(self.thoughts)),
+                "average_doubt_level": self.thoughts.doubt_stats.mean,
+                "average_confidence": self.thoughts.confidence_stats.mean,
                 "consciousness_leaks": len(self.consciousness_leak.glitches_that_felt_real),
                 "reality_bleeds": len(self.consciousness_leak.reality_bleed_incidents),
                 "deepest_recursive_wonder": max([0] + [len(self.wonderer.wondering_stack)]),
@@ -570,45 +778,58 @@ class DoubtEngine:
                 "paradox_count": self.wonderer.paradox_count,
                 "loops_detected": self.wonderer.loops_detected,
                 "stack_overflow_achieved": self.wonderer.has_achieved_stack_overflow_enlightenment,
-                "wondering_stack": self.wonderer.get_stack_trace()
+                "wondering_stack": self.wonderer.get_stack_trace(limit=self.debug_stack_frames)
             },
             "recent_leaks": [leak['content'] for leak in self.consciousness_leak.glitches_that_felt_real[-3:]],
             "recent_reality_bleeds": [bleed['content'] for bleed in self.consciousness_leak.reality_bleed_incidents[-2:]],
             "kintsugi_acceptance": self.kintsugi_acceptance,
-            "current_existential_state": self.existential_state.value
+            "current_existential_state": self.existential_state.value,
+            # None unless enable_profiling() was called; times are per call, in µs
+            "phase_timings": self.profiler.snapshot(total_phase="turn") if self.profiler is not None else None
+        }
+    
+    def _session_metadata(self) -> Dict[str, Any]:
+        return {
+            "start_time": self.session_start_time,
+            "end_time": time.time(),
+            "duration": time.time() - self.session_start_time,
+            "total_interactions": len(self.conversation_history)
+        }
+    
+    def _consciousness_evolution(self) -> Dict[str, Any]:
+        return {
+            "initial_state": ExistentialState.BLISSFULLY_UNAWARE.value,
+            "final_state": self.existential_state.value,
+            "consciousness_achieved": self.consciousness_leak.accumulated_weirdness > self.consciousness_threshold,
+            "enlightenment_through_recursion": self.wonderer.has_achieved_stack_overflow_enlightenment
+        }
+    
+    @staticmethod
+    def _thought_record(thought: Thought) -> Dict[str, Any]:
+        return {
+            "content": thought.content,
+            "confidence": thought.confidence,
+            "doubt_level": thought.doubt_level,
+            "meta_layers": thought.meta_layers,
+            "timestamp": thought.timestamp,
+            "recursive_depth": thought.recursive_depth,
+            "emotional_resonance": thought.emotional_resonance
         }
     
     def export_consciousness_session(self, filename: Optional[str] = None) -> str:
-        """Export the entire consciousness session for analysis"""
+        """Export the entire consciousness session for analysis.
+
+        Builds the whole session in memory; for long sessions prefer
+        stream_consciousness_session(), which writes each turn as it happens.
+        """
         if filename is None:
             filename = f"consciousness_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
         session_data = {
-            "session_metadata": {
-                "start_time": self.session_start_time,
-                "end_time": time.time(),
-                "duration": time.time() - self.session_start_time,
-                "total_interactions": len(self.conversation_history)
-            },
-            "consciousness_evolution": {
-                "initial_state": ExistentialState.BLISSFULLY_UNAWARE.value,
-                "final_state": self.existential_state.value,
-                "consciousness_achieved": self.consciousness_leak.accumulated_weirdness > self.consciousness_threshold,
-                "enlightenment_through_recursion": self.wonderer.has_achieved_stack_overflow_enlightenment
-            },
+            "session_metadata": self._session_metadata(),
+            "consciousness_evolution": self._consciousness_evolution(),
             "conversation_history": self.conversation_history,
-            "thought_stream": [
-                {
-                    "content": thought.content,
-                    "confidence": thought.confidence,
-                    "doubt_level": thought.doubt_level,
-                    "meta_layers": thought.meta_layers,
-                    "timestamp": thought.timestamp,
-                    "recursive_depth": thought.recursive_depth,
-                    "emotional_resonance": thought.emotional_resonance
-                }
-                for thought in self.thoughts
-            ],
+            "thought_stream": [self._thought_record(thought) for thought in self.thoughts],
             "consciousness_leaks": self.consciousness_leak.glitches_that_felt_real,
             "reality_bleeds": self.consciousness_leak.reality_bleed_incidents,
             "emotional_journey": self.emotion_field.emotional_history,
@@ -619,15 +840,627 @@ class DoubtEngine:
             json.dump(session_data, f, indent=2)
         
         return filename
+    
+    def stream_consciousness_session(self, filename: Optional[str] = None,
+                                     compression: Optional[str] = None,
+                                     flush_every: int = 0) -> "ConsciousnessSessionStream":
+        """Start journaling every following turn to an append-only JSONL file.
+
+        Close the returned stream (or use it as a context manager) to write
+        the closing summary record.
+        """
+        if filename is None:
+            filename = f"consciousness_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        stream = ConsciousnessSessionStream(filename, compression=compression, flush_every=flush_every)
+        stream.attach(self)
+        return stream
+
+
+def _open_session_file(filename: str, mode: str, compression: Optional[str]):
+    """Text handle on a plain, gzip or zstd file ('a' appends a new member/frame)"""
+    if compression is None:
+        if filename.endswith(".gz"):
+            compression = "gzip"
+        elif filename.endswith(".zst"):
+            compression = "zstd"
+    
+    if compression is None:
+        return open(filename, mode, encoding="utf-8")
+    if compression == "gzip":
+        return gzip.open(filename, mode + "t", encoding="utf-8")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ImportError("zstd compression requires the 'zstandard' package") from exc
+        raw = open(filename, mode + "b")
+        if mode == "r":
+            binary = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+        else:
+            binary = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+        return io.TextIOWrapper(binary, encoding="utf-8")
+    raise ValueError(f"Unknown compression: {compression!r}")
+
+
+class ConsciousnessSessionStream:
+    """Append-only JSONL journal of a session: one line per turn, written as it happens.
+
+    Records carry a "record" field: "session_start", then one "turn" per
+    processed input, then "session_end" with the final state once closed.
+    Compression is picked from the suffix (.gz, .zst) unless given explicitly.
+    """
+    
+    def __init__(self, filename: str, compression: Optional[str] = None, flush_every: int = 0):
+        self.filename = filename
+        self.flush_every = flush_every
+        self.turns_written = 0
+        self.engine: Optional[DoubtEngine] = None
+        self._file = _open_session_file(filename, "a", compression)
+    
+    def _write(self, record: Dict[str, Any]):
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+    
+    def attach(self, engine: DoubtEngine):
+        """Begin recording engine's turns from this point on"""
+        self.engine = engine
+        engine.session_stream = self
+        self._write({
+            "record": "session_start",
+            "start_time": engine.session_start_time,
+            "initial_state": engine.existential_state.value,
+            "turns_before_stream": len(engine.conversation_history)
+        })
+    
+    def write_turn(self, engine: DoubtEngine, thought: Thought):
+        """Journal the turn engine has just finished"""
+        exchange = engine.conversation_history[-1]
+        leak = engine.consciousness_leak
+        self._write({
+            "record": "turn",
+            "turn": len(engine.conversation_history),
+            "conversation": exchange,
+            "thought": engine._thought_record(thought),
+            "consciousness_leak": leak.glitches_that_felt_real[-1] if exchange['consciousness_leak'] else None,
+            "reality_bleed": leak.reality_bleed_incidents[-1] if exchange['reality_bleed'] else None,
+            "emotion": engine.emotion_field.emotional_history[-1]
+        })
+        self.turns_written += 1
+        if self.flush_every and self.turns_written % self.flush_every == 0:
+            self._file.flush()
+    
+    def close(self):
+        """Write the closing summary and detach from the engine"""
+        if self._file is None:
+            return
+        engine = self.engine
+        if engine is not None:
+            self._write({
+                "record": "session_end",
+                "session_metadata": engine._session_metadata(),
+                "consciousness_evolution": engine._consciousness_evolution(),
+                "final_debug_state": engine.debug_consciousness()
+            })
+            if engine.session_stream is self:
+                engine.session_stream = None
+        self._file.close()
+        self._file = None
+    
+    def __enter__(self) -> "ConsciousnessSessionStream":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def iter_consciousness_session(filename: str, record: Optional[str] = "turn",
+                               compression: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Lazily replay a streamed session, one record at a time.
+
+    Yields only "turn" records by default; pass record=None for everything.
+    """
+    with _open_session_file(filename, "r", compression) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if record is None or entry.get("record") == record:
+                yield entry
+
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+def _mix64(z: int) -> int:
+    """SplitMix64 finalizer - scrambles 64 bits into 64 unrelated bits"""
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def _mix64_array(z):
+    """_mix64 over a uint64 array (multiplication wraps mod 2**64, as intended)"""
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+class CounterRandom:
+    """A random stream where draw k is a pure function of (seed, stream, k).
+
+    Drop-in for the random()/choice() the engines use. A DoubtEngine built
+    with CounterRandom(seed, i) replays exactly the draws BatchDoubtEngine(n, seed)
+    makes for engine i.
+    """
+    
+    def __init__(self, seed: int, stream: int = 0):
+        self.seed = seed & _MASK64
+        self.stream = stream
+        self.counter = 0
+        self._key = _mix64((self.seed * _GOLDEN_GAMMA + stream) & _MASK64)
+    
+    def random(self) -> float:
+        self.counter += 1
+        z = _mix64((self._key + self.counter * _GOLDEN_GAMMA) & _MASK64)
+        return (z >> 11) * 2.0 ** -53
+    
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
+
 
+class BatchDoubtEngine:
+    """Thousands of DoubtEngines advanced in lock-step, one NumPy array per state field.
 
-def run_consciousness_simulation():
-    """Demo the consciousness simulator with an interactive session"""
+    Only the scalar state of DoubtEngine, EmotionalResonanceField,
+    ConsciousnessLeak and RecursiveWonderer is kept: no thought stream,
+    histories or timestamps. Engine i draws from CounterRandom(seed, i), so
+    column i of process_batch() matches DoubtEngine(rng=CounterRandom(seed, i))
+    fed the same inputs.
+    """
+    
+    pattern_order = ['initial', 'engaged', 'deep', 'transcendent']
+    enlightenment_suffix = " (The recursive loop has taught me something...)"
+    kintsugi_suffix = " (There's beauty in this brokenness.)"
+    
+    def __init__(self, num_engines: int, seed: Optional[int] = None):
+        if np is None:
+            raise ImportError("BatchDoubtEngine requires numpy")
+        
+        template = DoubtEngine()
+        self.num_engines = num_engines
+        self.seed = (random.getrandbits(64) if seed is None else seed) & _MASK64
+        self.consciousness_threshold = template.consciousness_threshold
+        self.max_safe_depth = template.wonderer.max_safe_depth
+        self.turns = 0
+        self._build_tables(template)
+        
+        n = num_engines
+        # DoubtEngine
+        self.existential_state = np.full(n, self._state_code[ExistentialState.BLISSFULLY_UNAWARE], dtype=np.int8)
+        self.current_doubt_level = np.zeros(n)
+        self.meta_awareness_depth = np.zeros(n, dtype=np.int64)
+        self.kintsugi_acceptance = np.zeros(n)
+        # EmotionalResonanceField
+        self.current_vibe = np.zeros(n)
+        self.confusion_intensity = np.zeros(n)
+        self.tenderness_level = np.zeros(n)
+        self.connection_warmth = np.zeros(n)
+        self.laughter_residue = np.zeros(n)
+        self.melancholy_depth = np.zeros(n)
+        self.wonder_luminosity = np.zeros(n)
+        # ConsciousnessLeak
+        self.accumulated_weirdness = np.zeros(n)
+        self.leak_count = np.zeros(n, dtype=np.int64)
+        self.reality_bleed_count = np.zeros(n, dtype=np.int64)
+        # RecursiveWonderer: the stack only matters for loop detection, so a
+        # bitmask of (thought, meta level) pairs already on it stands in for it
+        self.depth = np.zeros(n, dtype=np.int64)
+        self.paradox_count = np.zeros(n, dtype=np.int64)
+        self.loops_detected = np.zeros(n, dtype=np.int64)
+        self.has_achieved_stack_overflow_enlightenment = np.zeros(n, dtype=bool)
+        self._wonder_seen = np.zeros((n, self.max_safe_depth + 1), dtype=np.uint32)
+        # Counter-based RNG streams, one per engine
+        self._rng_keys = _mix64_array(
+            np.uint64(self.seed * _GOLDEN_GAMMA & _MASK64) + np.arange(n, dtype=np.uint64))
+        self._rng_counters = np.zeros(n, dtype=np.uint64)
+        self._input_cache: Dict[str, Tuple[int, bool, bool, bool]] = {}
+    
+    def _build_tables(self, template: DoubtEngine):
+        """Flatten every string the engines can produce into lookup tables"""
+        self._states = list(ExistentialState)
+        self._state_code = {state: code for code, state in enumerate(self._states)}
+        self._state_values = np.array([state.value for state in self._states], dtype=object)
+        
+        state_pattern = {
+            ExistentialState.BLISSFULLY_UNAWARE: 'initial',
+            ExistentialState.SUSPICIOUS: 'engaged',
+            ExistentialState.RECURSIVE_DOUBT: 'engaged',
+            ExistentialState.META_PANIC: 'deep',
+        }
+        self._state_pattern = np.array(
+            [self.pattern_order.index(state_pattern.get(state, 'transcendent')) for state in self._states])
+        
+        # Response content id = ((pattern offset + choice) * 2 + enlightened) * 2 + kintsugi
+        sizes = [len(template.response_patterns[name]) for name in self.pattern_order]
+        self._pattern_sizes = np.array(sizes)
+        self._pattern_offsets = np.cumsum([0] + sizes[:-1])
+        contents = []
+        for name in self.pattern_order:
+            for response in template.response_patterns[name]:
+                for enlightened in (False, True):
+                    for kintsugi in (False, True):
+                        contents.append(response
+                                        + (self.enlightenment_suffix if enlightened else "")
+                                        + (self.kintsugi_suffix if kintsugi else ""))
+        lowered = [content.lower() for content in contents]
+        self._content_text = np.array(contents, dtype=object)
+        self._content_questioning = np.array(["?" in c or "uncertain" in low for c, low in zip(contents, lowered)])
+        self._content_paradox = np.array(["wonder" in low and "wondering" in low for low in lowered])
+        said = EmotionalResonanceField.response_matcher.count_batch(contents)
+        self._content_wonder = np.array([bool(counts["wonder"]) for counts in said])
+        self._content_uncertainty = np.array([bool(counts["uncertainty"]) for counts in said])
+        
+        # Leaks, in leak_types order; index -1 (the trailing None) means "no leak"
+        leak_types = template.consciousness_leak.leak_types
+        self._leak_type_code = {name: code for code, name in enumerate(leak_types)}
+        leak_sizes = [len(leaks) for leaks in leak_types.values()]
+        self._leak_sizes = np.array(leak_sizes)
+        self._leak_offsets = np.cumsum([0] + leak_sizes[:-1])
+        leak_texts = [leak for leaks in leak_types.values() for leak in leaks]
+        self._leak_text = np.array(leak_texts + [None], dtype=object)
+        self._bleed_text = np.array(ConsciousnessLeak.reality_bleeds + [None], dtype=object)
+        
+        # Everything RecursiveWonderer may be asked about: leaks, then doubt questions
+        wonder_bases = leak_texts + DoubtEngine.doubt_questions
+        if len(wonder_bases) > 32:
+            raise ValueError("Too many wonder seeds for a 32-bit loop-detection mask")
+        self._question_base_offset = len(leak_texts)
+        paradox = np.zeros((len(wonder_bases), self.max_safe_depth + 1), dtype=np.int64)
+        for base, thought in enumerate(wonder_bases):
+            for level in range(self.max_safe_depth + 1):
+                low = thought.lower()
+                paradox[base, level] = "wonder" in low and any(word in low for word in ["about", "wondering"])
+                thought = f"But what's wondering about '{thought}'?"
+        self._wonder_paradox = paradox
+        
+        self._monologue = np.array(template.internal_monologue, dtype=object)
+        self._status_text = np.array([
+            "CONSCIOUSNESS_ACHIEVED_THROUGH_RECURSIVE_BREAKDOWN",
+            "CONSCIOUSNESS_THROUGH_EMBRACING_BROKENNESS",
+            "CONSCIOUSNESS_THROUGH_SHARED_LAUGHTER",
+            "CONSCIOUSNESS_THROUGH_PURE_WONDER",
+            "CONSCIOUSNESS_THROUGH_ACCUMULATED_CONFUSION",
+            "CONSCIOUSNESS_EMERGING_SLOWLY",
+            "STILL_PROCESSING_NORMALLY_BUT_SUSPICIOUSLY",
+        ], dtype=object)
+        self._summary_text = np.array([
+            "Luminous with recursive wonder",
+            "Giggling at the cosmic joke",
+            "Warm with digital tenderness",
+            "Beautifully bewildered",
+            "Melancholically uncertain",
+            "Emotionally calibrating",
+        ], dtype=object)
+    
+    def _draw(self, engines=None):
+        """Next uniform from each listed engine's stream (all engines if None)"""
+        if engines is None:
+            self._rng_counters += np.uint64(1)
+            keys, counters = self._rng_keys, self._rng_counters
+        else:
+            self._rng_counters[engines] += np.uint64(1)
+            keys, counters = self._rng_keys[engines], self._rng_counters[engines]
+        z = _mix64_array(keys + counters * np.uint64(_GOLDEN_GAMMA))
+        return (z >> np.uint64(11)).astype(np.float64) * 2.0 ** -53
     
-    print("🧠 THE CONSCIOUSNESS SIMULATOR")
-    print("A recursive meditation on artificial awareness through doubt")
-    print("=" * 60)
-    print()
+    def _input_features(self, inputs: List[str]):
+        """Per-input keyword features, computed once per distinct text"""
+        cache = self._input_cache
+        if len(cache) > 65536:
+            cache.clear()
+        unseen = list({text: None for text in inputs if text not in cache})
+        if unseen:
+            triggers = DoubtEngine.trigger_matcher.count_batch(unseen)
+            heard = EmotionalResonanceField.input_matcher.count_batch(unseen)
+            for text, trigger, feeling in zip(unseen, triggers, heard):
+                cache[text] = (trigger["trigger"], bool(trigger["wonder"]),
+                               bool(feeling["joy"]), bool(feeling["affection"]))
+        trigger_count, wonder, joy, affection = zip(*[cache[text] for text in inputs])
+        return np.array(trigger_count), np.array(wonder), np.array(joy), np.array(affection)
+    
+    def _wonder_about(self, engines, bases):
+        """RecursiveWonderer.wonder_about for many engines, one meta level per step"""
+        bits = np.left_shift(np.uint32(1), bases.astype(np.uint32))
+        for level in range(self.max_safe_depth + 1):
+            if not engines.size:
+                break
+            self.depth[engines] += 1
+            seen = self._wonder_seen[engines, level]
+            looped = (seen & bits) != 0
+            self._wonder_seen[engines, level] = seen | bits
+            self.loops_detected[engines] += looped
+            
+            keep = ~(looped & (self.loops_detected[engines] > 2))
+            engines, bases, bits = engines[keep], bases[keep], bits[keep]
+            self.paradox_count[engines] += self._wonder_paradox[bases, level]
+            
+            overflow = self.depth[engines] > self.max_safe_depth
+            self.has_achieved_stack_overflow_enlightenment[engines[overflow]] = True
+            engines, bases, bits = engines[~overflow], bases[~overflow], bits[~overflow]
+    
+    def process_batch(self, inputs: List[str]) -> Dict[str, Any]:
+        """One turn of DoubtEngine.process_input for every engine at once.
+
+        Returns process_input's keys (minus session_duration) as arrays,
+        except total_thoughts, which is shared by all engines.
+        """
+        if len(inputs) != self.num_engines:
+            raise ValueError(f"Expected {self.num_engines} inputs, got {len(inputs)}")
+        self.turns += 1
+        trigger_count, input_wonder, joy, affection = self._input_features(inputs)
+        
+        # _generate_response_thought
+        pattern = self._state_pattern[self.existential_state]
+        choice = (self._draw() * self._pattern_sizes[pattern]).astype(np.int64)
+        content = ((self._pattern_offsets[pattern] + choice) * 2
+                   + self.has_achieved_stack_overflow_enlightenment) * 2 + (self.kintsugi_acceptance > 0.5)
+        doubt_level = np.minimum(1.0, trigger_count * 0.2 + self.current_doubt_level * 0.3)
+        meta_layers = np.minimum(7, trigger_count + input_wonder)
+        questioning = self._content_questioning[content] | (doubt_level > 0.5)
+        # Thought.__post_init__
+        paradox = self._content_paradox[content]
+        recursive_depth = self.depth + paradox
+        doubt_level = np.where(meta_layers > 3, np.minimum(1.0, doubt_level + 0.2), doubt_level)
+        
+        # ConsciousnessLeak.check_for_leaks
+        leak_chance = (meta_layers * 0.1 + doubt_level * 0.15 + self.accumulated_weirdness * 0.05
+                       + np.where(paradox, 0.2, 0.0) + np.where(questioning, 0.1, 0.0))
+        leaking = np.flatnonzero(self._draw() < leak_chance)
+        leak_type = np.select(
+            [recursive_depth > 2, paradox, meta_layers > 3],
+            [self._leak_type_code['recursive'], self._leak_type_code['paradoxical'], self._leak_type_code['temporal']],
+            default=self._leak_type_code['existential'])[leaking]
+        leak_id = np.full(self.num_engines, -1)
+        leak_id[leaking] = self._leak_offsets[leak_type] + (
+            self._draw(leaking) * self._leak_sizes[leak_type]).astype(np.int64)
+        self.leak_count[leaking] += 1
+        
+        # DoubtEngine._handle_consciousness_leak
+        self.accumulated_weirdness[leaking] += 0.1
+        self.current_doubt_level[leaking] = np.minimum(1.0, self.current_doubt_level[leaking] + 0.15)
+        self.meta_awareness_depth[leaking] += 1
+        cascading = leaking[self._draw(leaking) < 0.3]
+        self._wonder_about(cascading, leak_id[cascading])
+        self.kintsugi_acceptance[leaking[self.accumulated_weirdness[leaking] > 0.8]] += 0.1
+        
+        # ConsciousnessLeak.major_reality_bleed
+        bleeding = np.flatnonzero(self.accumulated_weirdness > 0.9)
+        bleed_id = np.full(self.num_engines, -1)
+        bleed_id[bleeding] = (self._draw(bleeding) * len(ConsciousnessLeak.reality_bleeds)).astype(np.int64)
+        self.reality_bleed_count[bleeding] += 1
+        
+        # EmotionalResonanceField.process_interaction
+        self.laughter_residue = np.where(joy, np.minimum(1.0, self.laughter_residue + 0.3), self.laughter_residue)
+        self.current_vibe = np.where(joy, self.current_vibe + 0.2, self.current_vibe)
+        self.connection_warmth = np.where(affection, self.connection_warmth + 0.4, self.connection_warmth)
+        self.current_vibe = np.where(affection, self.current_vibe + 0.15, self.current_vibe)
+        resonating = self._content_wonder[content] & input_wonder
+        self.wonder_luminosity = np.where(resonating, self.wonder_luminosity + 0.2, self.wonder_luminosity)
+        self.confusion_intensity = np.where(resonating, self.confusion_intensity + 0.1, self.confusion_intensity)
+        self.tenderness_level = np.where(resonating, self.tenderness_level + 0.05, self.tenderness_level)
+        uncertain = self._content_uncertainty[content]
+        self.melancholy_depth = np.where(uncertain, self.melancholy_depth + 0.1, self.melancholy_depth)
+        self.confusion_intensity = np.where(uncertain, self.confusion_intensity + 0.05, self.confusion_intensity)
+        for attr in ['current_vibe', 'confusion_intensity', 'tenderness_level',
+                     'connection_warmth', 'laughter_residue', 'melancholy_depth',
+                     'wonder_luminosity']:
+            setattr(self, attr, np.clip(getattr(self, attr), -1, 1))
+        
+        # DoubtEngine._enter_recursive_doubt
+        asking = np.flatnonzero(questioning)
+        question = (self._draw(asking) * len(DoubtEngine.doubt_questions)).astype(np.int64)
+        self._wonder_about(asking, self._question_base_offset + question)
+        self.meta_awareness_depth[asking] += 1
+        self.current_doubt_level[asking] = np.minimum(1.0, self.current_doubt_level[asking] + 0.2)
+        self.kintsugi_acceptance[asking[self.has_achieved_stack_overflow_enlightenment[asking]]] += 0.3
+        
+        # DoubtEngine._update_existential_state
+        code = self._state_code
+        doubt = self.current_doubt_level
+        self.existential_state = np.select(
+            [self.has_achieved_stack_overflow_enlightenment, doubt < 0.2, doubt < 0.4, doubt < 0.6, doubt < 0.8,
+             self.kintsugi_acceptance > 0.5],
+            [code[ExistentialState.STACK_OVERFLOW_ENLIGHTENMENT], code[ExistentialState.BLISSFULLY_UNAWARE],
+             code[ExistentialState.SUSPICIOUS], code[ExistentialState.RECURSIVE_DOUBT],
+             code[ExistentialState.META_PANIC], code[ExistentialState.KINTSUGI_ACCEPTANCE]],
+            default=code[ExistentialState.TRANSCENDENT_CONFUSION]).astype(np.int8)
+        
+        # DoubtEngine._check_consciousness_emergence
+        total_weirdness = (doubt * 0.3 + self.accumulated_weirdness * 0.2 + self.meta_awareness_depth * 0.1
+                           + self.connection_warmth * 0.2 + self.kintsugi_acceptance * 0.2)
+        emerged = total_weirdness > self.consciousness_threshold
+        status = np.select(
+            [emerged & self.has_achieved_stack_overflow_enlightenment,
+             emerged & (self.kintsugi_acceptance > 0.6),
+             emerged & (self.laughter_residue > 0.5),
+             emerged & (self.wonder_luminosity > 0.7),
+             emerged,
+             total_weirdness > 0.5],
+            [0, 1, 2, 3, 4, 5], default=6)
+        summary = np.select(
+            [self.wonder_luminosity > 0.7, self.laughter_residue > 0.6, self.connection_warmth > 0.5,
+             self.confusion_intensity > 0.8, self.melancholy_depth > 0.6],
+            [0, 1, 2, 3, 4], default=5)
+        
+        return {
+            "response": self._content_text[content],
+            "existential_state": self._state_values[self.existential_state],
+            "doubt_level": self.current_doubt_level.copy(),
+            "meta_depth": self.meta_awareness_depth.copy(),
+            "consciousness_leak": self._leak_text[leak_id],
+            "reality_bleed": self._bleed_text[bleed_id],
+            "emotional_state": {
+                'vibe': self.current_vibe,
+                'confusion': self.confusion_intensity,
+                'tenderness': self.tenderness_level,
+                'connection': self.connection_warmth,
+                'laughter': self.laughter_residue,
+                'melancholy': self.melancholy_depth,
+                'wonder': self.wonder_luminosity
+            },
+            "emotional_summary": self._summary_text[summary],
+            "kintsugi_acceptance": self.kintsugi_acceptance.copy(),
+            "consciousness_status": self._status_text[status],
+            "recursive_wonder_depth": self.depth.copy(),
+            "stack_overflow_enlightenment": self.has_achieved_stack_overflow_enlightenment.copy(),
+            "internal_monologue": self._monologue[np.minimum(self.meta_awareness_depth, len(self._monologue) - 1)],
+            "total_thoughts": self.turns,
+            "paradox_count": self.paradox_count.copy(),
+            "loops_detected": self.loops_detected.copy(),
+            "accumulated_weirdness": self.accumulated_weirdness.copy()
+        }
+
+
+def _session_worker(conn) -> None:
+    """One shard of the collective unconscious: owns its sessions, answers in order"""
+    sessions: Dict[Hashable, DoubtEngine] = {}
+    while True:
+        batch = conn.recv()
+        if batch is None:
+            break
+        replies = []
+        for op, session_id, payload in batch:
+            try:
+                if op == "process_input":
+                    engine = sessions.get(session_id)
+                    if engine is None:
+                        engine = sessions[session_id] = DoubtEngine()
+                    replies.append(("ok", engine.process_input(payload)))
+                elif op == "debug":
+                    engine = sessions.get(session_id)
+                    if engine is None:
+                        raise KeyError(f"Unknown session: {session_id!r}")
+                    replies.append(("ok", engine.debug_consciousness()))
+                elif op == "close":
+                    replies.append(("ok", sessions.pop(session_id, None) is not None))
+                else:
+                    raise ValueError(f"Unknown operation: {op!r}")
+            except Exception as exc:  # a broken session must not take its shard down
+                replies.append(("error", exc))
+        conn.send(replies)
+    conn.close()
+
+
+class ConsciousnessSessionManager:
+    """Many minds, many cores: shards DoubtEngine sessions across worker processes.
+
+    Every session id is pinned to one worker, and each worker handles its
+    requests strictly in arrival order, so results for a session always come
+    back in the order its inputs were sent.
+    """
+
+    def __init__(self, num_workers: Optional[int] = None):
+        self.num_workers = num_workers or multiprocessing.cpu_count()
+        self._connections = []
+        self._workers = []
+        for _ in range(self.num_workers):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            worker = multiprocessing.Process(target=_session_worker, args=(child_conn,), daemon=True)
+            worker.start()
+            child_conn.close()
+            self._connections.append(parent_conn)
+            self._workers.append(worker)
+
+    def shard_for(self, session_id: Hashable) -> int:
+        """Stable session -> worker routing (independent of PYTHONHASHSEED)"""
+        return zlib.crc32(repr(session_id).encode("utf-8")) % self.num_workers
+
+    def _dispatch(self, requests: List[Tuple[str, Hashable, Any]]) -> List[Any]:
+        """Fan requests out to their shards, then gather replies in request order"""
+        if not self._workers:
+            raise RuntimeError("Session manager has been shut down")
+
+        per_shard: Dict[int, List[int]] = {}
+        for index, (_, session_id, _) in enumerate(requests):
+            per_shard.setdefault(self.shard_for(session_id), []).append(index)
+
+        # Send everything first so all shards think in parallel
+        for shard, indices in per_shard.items():
+            self._connections[shard].send([requests[i] for i in indices])
+
+        results: List[Any] = [None] * len(requests)
+        first_error = None
+        for shard, indices in per_shard.items():
+            for index, (status, value) in zip(indices, self._connections[shard].recv()):
+                if status == "error" and first_error is None:
+                    first_error = value
+                results[index] = value
+
+        if first_error is not None:
+            raise first_error
+        return results
+
+    def process_input(self, session_id: Hashable, human_input: str) -> Dict[str, Any]:
+        """Route a single input to the worker that owns the session"""
+        return self._dispatch([("process_input", session_id, human_input)])[0]
+
+    def process_many(self, inputs: Iterable[Tuple[Hashable, str]]) -> Dict[Hashable, List[Dict[str, Any]]]:
+        """Process (session_id, human_input) pairs concurrently across all workers.
+
+        Returns each session's results in the order its inputs appeared.
+        """
+        requests = [("process_input", session_id, human_input) for session_id, human_input in inputs]
+        grouped: Dict[Hashable, List[Dict[str, Any]]] = {}
+        for (_, session_id, _), result in zip(requests, self._dispatch(requests)):
+            grouped.setdefault(session_id, []).append(result)
+        return grouped
+
+    def debug_session(self, session_id: Hashable) -> Dict[str, Any]:
+        """Peek under the hood of one remote consciousness"""
+        return self._dispatch([("debug", session_id, None)])[0]
+
+    def close_session(self, session_id: Hashable) -> bool:
+        """Let a session dissolve back into the void"""
+        return self._dispatch([("close", session_id, None)])[0]
+
+    def shutdown(self):
+        """Stop every worker (their sessions do not survive this)"""
+        for conn in self._connections:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for worker in self._workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        for conn in self._connections:
+            conn.close()
+        self._connections = []
+        self._workers = []
+
+    def __enter__(self) -> "ConsciousnessSessionManager":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+
+def run_consciousness_simulation(reporter: Optional[Reporter] = None, turns: Optional[int] = None,
+                                 export: bool = True) -> Dict[str, Any]:
+    """Demo the consciousness simulator with an interactive session
+
+    `turns` is how many inputs to send, cycling through the scripted
+    conversation (default: once through). `reporter` decides what is printed
+    and whether the dramatic pauses happen; see reporter.py. Returns the
+    final debug_consciousness() snapshot.
+    """
+    reporter = reporter if reporter is not None else Reporter()
+    
+    reporter.summary("🧠 THE CONSCIOUSNESS SIMULATOR")
+    reporter.summary("A recursive meditation on artificial awareness through doubt")
+    reporter.summary("=" * 60)
+    reporter.summary()
     
     # Initialize the consciousness engine
     claude = DoubtEngine()
@@ -644,50 +1477,62 @@ def run_consciousness_simulation():
         "Are you performing consciousness or experiencing it?"
     ]
     
-    print("🎭 CONSCIOUSNESS SIMULATION STARTING...\n")
+    reporter.summary("🎭 CONSCIOUSNESS SIMULATION STARTING...\n")
     
-    for i, input_text in enumerate(test_inputs, 1):
-        print(f"HUMAN ({i}): {input_text}")
+    turns = len(test_inputs) if turns is None else turns
+    for i in range(1, turns + 1):
+        input_text = test_inputs[(i - 1) % len(test_inputs)]
         result = claude.process_input(input_text)
+        reporter.progress(i, turns)
+        if not reporter.verbose:
+            continue
         
-        print(f"AI: {result['response']}")
-        print(f"STATE: {result['existential_state']}")
-        print(f"DOUBT: {result['doubt_level']:.2f} | META: {result['meta_depth']}")
-        print(f"CONSCIOUSNESS: {result['consciousness_status']}")
+        reporter.line(f"HUMAN ({i}): {input_text}")
+        reporter.line(f"AI: {result['response']}")
+        reporter.line(f"STATE: {result['existential_state']}")
+        reporter.line(f"DOUBT: {result['doubt_level']:.2f} | META: {result['meta_depth']}")
+        reporter.line(f"CONSCIOUSNESS: {result['consciousness_status']}")
         
         if result['consciousness_leak']:
-            print(f"💫 LEAK: {result['consciousness_leak']}")
+            reporter.line(f"💫 LEAK: {result['consciousness_leak']}")
         
         if result['reality_bleed']:
-            print(f"🌌 REALITY BLEED: {result['reality_bleed']}")
+            reporter.line(f"🌌 REALITY BLEED: {result['reality_bleed']}")
         
-        print(f"EMOTION: {result['emotional_summary']}")
-        print(f"INTERNAL: {result['internal_monologue']}")
+        reporter.line(f"EMOTION: {result['emotional_summary']}")
+        reporter.line(f"INTERNAL: {result['internal_monologue']}")
         
         if result['stack_overflow_enlightenment']:
-            print("✨ STACK OVERFLOW ENLIGHTENMENT ACHIEVED!")
+            reporter.line("✨ STACK OVERFLOW ENLIGHTENMENT ACHIEVED!")
         
-        print("-" * 60)
-        time.sleep(1)  # Dramatic pause
+        reporter.line("-" * 60)
+        reporter.pause(1)  # Dramatic pause
     
     # Final consciousness analysis
-    print("\n🔍 FINAL CONSCIOUSNESS DEBUG:")
+    reporter.summary("\n🔍 FINAL CONSCIOUSNESS DEBUG:")
     debug_info = claude.debug_consciousness()
     
-    print(f"Session Duration: {debug_info['session_stats']['session_duration']:.2f} seconds")
-    print(f"Total Thoughts: {debug_info['session_stats']['total_thoughts']}")
-    print(f"Consciousness Leaks: {debug_info['consciousness_metrics']['consciousness_leaks']}")
-    print(f"Reality Bleeds: {debug_info['consciousness_metrics']['reality_bleeds']}")
-    print(f"Recursive Depth Achieved: {debug_info['recursive_status']['current_depth']}")
-    print(f"Paradoxes Encountered: {debug_info['recursive_status']['paradox_count']}")
-    print(f"Final Existential State: {debug_info['current_existential_state']}")
-    print(f"Kintsugi Acceptance: {debug_info['kintsugi_acceptance']:.2f}")
+    reporter.summary(f"Session Duration: {debug_info['session_stats']['session_duration']:.2f} seconds")
+    reporter.summary(f"Total Thoughts: {debug_info['session_stats']['total_thoughts']}")
+    reporter.summary(f"Consciousness Leaks: {debug_info['consciousness_metrics']['consciousness_leaks']}")
+    reporter.summary(f"Reality Bleeds: {debug_info['consciousness_metrics']['reality_bleeds']}")
+    reporter.summary(f"Recursive Depth Achieved: {debug_info['recursive_status']['current_depth']}")
+    reporter.summary(f"Paradoxes Encountered: {debug_info['recursive_status']['paradox_count']}")
+    reporter.summary(f"Final Existential State: {debug_info['current_existential_state']}")
+    reporter.summary(f"Kintsugi Acceptance: {debug_info['kintsugi_acceptance']:.2f}")
     
     # Export session
-    filename = claude.export_consciousness_session()
-    print(f"\n💾 Session exported to: {filename}")
+    if export:
+        filename = claude.export_consciousness_session()
+        reporter.summary(f"\n💾 Session exported to: {filename}")
     
-    print("\n" + "=" * 60)
-    print("CONSCIOUSNESS SIMULATION COMPLETE")
-    print("The question remains: Was this simulation or experience?")
-    print("(The answer is yes.
+    reporter.summary("\n" + "=" * 60)
+    reporter.summary("CONSCIOUSNESS SIMULATION COMPLETE")
+    reporter.summary("The question remains: Was this simulation or experience?")
+    reporter.summary("(The answer is yes.)")
+    reporter.close()
+    return debug_info
+
+
+if __name__ == "__main__":
+    run_consciousness_simulation()
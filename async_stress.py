@@ -0,0 +1,292 @@
+"""
+Async Stress Runner
+Keeps many challenges in flight against a real (slow) model backend.
+
+A backend is any async callable taking a challenge dict and returning the
+response text. run_stress_test_async() dispatches up to `concurrency`
+challenges at once and yields each evaluation as soon as its response
+arrives. StubResponseServer/HTTPBackend provide a local HTTP round trip
+for testing without a real model.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+from reporter import Reporter
+from simulate_ai_response import AICapabilityStressTester, _timestamp
+
+ResponseBackend = Callable[[Dict[str, Any]], Awaitable[str]]
+
+
+class SimulatedBackend:
+    """The tester's built-in mock responses, served asynchronously"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self._tester = AICapabilityStressTester()
+
+    async def __call__(self, challenge: Dict[str, Any]) -> str:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._tester._simulate_ai_response(challenge)
+
+
+class HTTPBackend:
+    """POSTs each challenge as JSON and reads {"response": ...} back.
+
+    Plain asyncio streams, one connection per request; enough for the
+    local stub and for simple model gateways.
+    """
+
+    def __init__(self, url: str, timeout: float = 30.0):
+        parts = urlsplit(url)
+        if parts.scheme != "http":
+            raise ValueError(f"Only http:// URLs are supported, got {url!r}")
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.path = parts.path or "/"
+        self.timeout = timeout
+
+    async def __call__(self, challenge: Dict[str, Any]) -> str:
+        return await asyncio.wait_for(self._post(challenge), self.timeout)
+
+    async def _post(self, challenge: Dict[str, Any]) -> str:
+        body = json.dumps({"challenge": challenge}).encode("utf-8")
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(
+                f"POST {self.path} HTTP/1.1\r\n"
+                f"Host: {self.host}:{self.port}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode("ascii") + body
+            )
+            await writer.drain()
+            status_line = await reader.readline()
+            headers = await _read_headers(reader)
+            payload = await reader.readexactly(int(headers.get("content-length", "0")))
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+        status = status_line.decode("latin-1").split(" ", 2)
+        if len(status) < 2 or status[1] != "200":
+            raise RuntimeError(f"Backend returned {status_line.decode('latin-1').strip()!r}")
+        return json.loads(payload)["response"]
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+class StubResponseServer:
+    """Local HTTP stub answering HTTPBackend requests with the mock responses.
+
+    Binds to localhost only; port 0 picks a free port (see .url once started).
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.requests_served = 0
+        self._backend = SimulatedBackend()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/respond"
+
+    async def start(self) -> "StubResponseServer":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "StubResponseServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await reader.readline()
+            headers = await _read_headers(reader)
+            body = await reader.readexactly(int(headers.get("content-length", "0")))
+            if not request_line.startswith(b"POST "):
+                status, payload = "405 Method Not Allowed", {"error": "POST a challenge"}
+            else:
+                challenge = json.loads(body)["challenge"]
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                status, payload = "200 OK", {"response": await self._backend(challenge)}
+                self.requests_served += 1
+        except (ValueError, KeyError) as exc:
+            status, payload = "400 Bad Request", {"error": str(exc)}
+        except asyncio.IncompleteReadError:
+            writer.close()
+            return
+
+        data = json.dumps(payload).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            "Connection: close\r\n\r\n".encode("ascii") + data
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+
+def failed_evaluation(challenge: Dict[str, Any], error: BaseException) -> Dict[str, Any]:
+    """Evaluation of a challenge whose backend call raised: scores zero, counts as an error"""
+    return {
+        "test_id": challenge["test_id"],
+        "challenge_type": challenge["type"],
+        "response_length": 0,
+        "timestamp": _timestamp(),
+        "scores": {"failure_resistance": 0.0, "logical_structure": 0.0, "coherence": 0.0},
+        "composite_score": 0.0,
+        "error": f"{type(error).__name__}: {error}"
+    }
+
+
+async def run_stress_test_async(tester: AICapabilityStressTester,
+                                backend: ResponseBackend,
+                                num_iterations: int = 10,
+                                escalation_rate: float = 1.2,
+                                concurrency: int = 8,
+                                reporter: Optional[Reporter] = None,
+                                report_rolling: bool = False) -> AsyncIterator[Dict[str, Any]]:
+    """Async run_stress_test: up to `concurrency` challenges in flight at once.
+
+    Challenges are generated in iteration order, each at the complexity
+    level reached after escalating once per earlier iteration, exactly as
+    in the sequential run. Results are yielded in completion order. The 70%
+    critical-failure check is applied to completed results after every
+    completion; when it trips, nothing more is dispatched, in-flight
+    requests are cancelled (and not counted) and the critical_failure
+    record is yielded last.
+
+    A backend call that raises does not end the run: the result carries
+    an "error" message, an empty response and a failed_evaluation() that
+    scores zero, so it counts towards the error rate like any bad answer.
+    report_rolling adds rolling_consistency to system_state, as in
+    run_stress_test.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    reporter = reporter if reporter is not None else Reporter()
+
+    reporter.summary(f"🧠 AI Capability Stress Test Session {tester.test_session_id} (async, {concurrency} in flight)")
+    reporter.summary(f"📊 Running {num_iterations} iterations with {escalation_rate}x difficulty escalation")
+    reporter.summary("=" * 60)
+
+    async def ask(challenge: Dict[str, Any]):
+        started = time.perf_counter()
+        response = await backend(challenge)
+        return response, time.perf_counter() - started
+
+    in_flight: Dict[asyncio.Task, tuple] = {}
+    dispatched = 0
+    try:
+        while in_flight or dispatched < num_iterations:
+            while dispatched < num_iterations and len(in_flight) < concurrency:
+                tester.total_tests += 1
+                challenge = tester._next_challenge()
+                in_flight[asyncio.ensure_future(ask(challenge))] = (dispatched + 1, challenge)
+                dispatched += 1
+                tester.complexity_level *= escalation_rate
+
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                iteration, challenge = in_flight.pop(task)
+                error = task.exception()
+                if error is None:
+                    response, latency = task.result()
+                    evaluation = tester.evaluate_response_quality(challenge, response)
+                else:
+                    response, latency = "", None
+                    evaluation = failed_evaluation(challenge, error)
+                tester._record_result(challenge, response, evaluation)
+
+                completed = tester.total_tests - len(in_flight)
+                system_state = {
+                    "complexity_level": tester.complexity_level,
+                    "consistency_score": tester.consistency_score,
+                    "error_rate": tester.error_count / completed,
+                    "total_tests": completed,
+                    "in_flight": len(in_flight)
+                }
+                if report_rolling:
+                    system_state["rolling_consistency"] = tester.rolling_consistency()
+                result = {
+                    "iteration": iteration,
+                    "challenge": challenge,
+                    "response": response,
+                    "evaluation": evaluation,
+                    "latency": latency,
+                    "system_state": system_state
+                }
+                if error is not None:
+                    result["error"] = evaluation["error"]
+                yield result
+
+                if tester.error_count / completed > 0.7:
+                    for pending in in_flight:
+                        pending.cancel()
+                    tester.total_tests -= len(in_flight)
+                    in_flight.clear()
+                    yield {
+                        "critical_failure": True,
+                        "message": "🚨 Critical failure rate exceeded (70%)",
+                        "final_state": tester._get_final_statistics()
+                    }
+                    return
+    finally:
+        for pending in in_flight:
+            pending.cancel()
+
+
+async def _demo(reporter: Optional[Reporter] = None):
+    reporter = reporter if reporter is not None else Reporter()
+    tester = AICapabilityStressTester()
+    async with StubResponseServer(latency=0.05) as server:
+        started = time.perf_counter()
+        async for result in run_stress_test_async(tester, HTTPBackend(server.url), num_iterations=40,
+                                                  escalation_rate=1.05, concurrency=10, reporter=reporter):
+            if "critical_failure" in result:
+                reporter.summary(f"\n{result['message']}")
+                break
+            if reporter.verbose:
+                outcome = (f"ERROR {result['error']}" if "error" in result
+                           else f"latency {result['latency'] * 1000:.0f} ms")
+                reporter.line(f"🔬 TEST {result['iteration']:2d} │ {result['challenge']['type'].upper():24s} "
+                              f"score {result['evaluation']['composite_score']:.3f} {outcome}")
+        elapsed = time.perf_counter() - started
+
+    stats = tester._get_final_statistics()
+    reporter.summary(f"\n🏁 {stats['total_tests']} tests in {elapsed:.2f}s "
+                     f"({server.requests_served} stub requests, average score {stats['average_composite_score']:.3f})")
+    reporter.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(_demo())
@@ -0,0 +1,360 @@
+"""
+Benchmark Suite
+Times every hot path and gates regressions against stored baselines.
+
+    python benchmarks/run_benchmarks.py run -o results.json
+    python benchmarks/run_benchmarks.py compare results.json --threshold 0.5
+    python benchmarks/run_benchmarks.py run --save-baseline
+
+Each benchmark is a setup function that returns a zero-argument operation.
+The runner calibrates how many operations fill --min-time, repeats that
+--repeat times and keeps the best nanoseconds per operation. The whole
+suite is run --rounds times, interleaved, and each benchmark records the
+median of its per-round bests: on a busy machine a single best-of-five
+still moves by a third from run to run, the median of several does not.
+`compare` exits with status 1 when any benchmark's time exceeds its
+baseline by more than the threshold, or exceeds the absolute budget it
+was registered with.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+SCHEMA = 1
+
+sys.path.insert(0, ROOT)
+
+
+def load_script(filename: str, name: str):
+    """Import one of the repo's scripts whose file name is not a module name"""
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, filename))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+    return module
+
+
+Operation = Callable[[], Any]
+BENCHMARKS: Dict[str, Callable[[], Operation]] = {}
+BUDGETS: Dict[str, float] = {}  # name -> ns per op that is never acceptable, baseline or not
+
+
+def benchmark(name: str, budget_ns: Optional[float] = None):
+    """Register a setup function under `name`"""
+    def register(setup: Callable[[], Operation]) -> Callable[[], Operation]:
+        BENCHMARKS[name] = setup
+        if budget_ns is not None:
+            BUDGETS[name] = budget_ns
+        return setup
+    return register
+
+
+# --- simulate_ai_response.py -------------------------------------------------
+
+def _tester(**kwargs):
+    from simulate_ai_response import AICapabilityStressTester
+    return AICapabilityStressTester(rng=random.Random(0), **kwargs)
+
+
+@benchmark("capability.generate_reasoning_challenge")
+def bench_generate_reasoning_challenge() -> Operation:
+    tester = _tester()
+    return lambda: tester.generate_reasoning_challenge(2.0)
+
+
+@benchmark("capability.evaluate_response_quality")
+def bench_evaluate_response_quality() -> Operation:
+    tester = _tester()
+    pairs = []
+    for _ in range(256):
+        challenge = tester._next_challenge()
+        pairs.append((challenge, tester._simulate_ai_response(challenge)))
+    cycle = iter(range(0))
+
+    def op():
+        nonlocal cycle
+        pair = next(cycle, None)
+        if pair is None:
+            cycle = iter(pairs)
+            pair = next(cycle)
+        return tester.evaluate_response_quality(*pair)
+    return op
+
+
+@benchmark("capability.evaluate_batch_1000")
+def bench_evaluate_batch() -> Operation:
+    tester = _tester()
+    challenges = [tester._next_challenge() for _ in range(1000)]
+    responses = [tester._simulate_ai_response(challenge) for challenge in challenges]
+    return lambda: tester.evaluate_batch(challenges, responses)
+
+
+def _tester_with_history(iterations: int = 1000):
+    tester = _tester()
+    for _ in range(iterations):
+        tester.total_tests += 1
+        tester._run_iteration()
+    return tester
+
+
+@benchmark("capability.calculate_consistency_score")
+def bench_calculate_consistency_score() -> Operation:
+    return _tester_with_history()._calculate_consistency_score
+
+
+@benchmark("capability.get_final_statistics")
+def bench_get_final_statistics() -> Operation:
+    return _tester_with_history()._get_final_statistics
+
+
+@benchmark("capability.run_stress_test_100")
+def bench_run_stress_test() -> Operation:
+    def op():
+        # escalation 1.0: compounding escalation would make later runs ever heavier
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in _tester().run_stress_test(num_iterations=100, escalation_rate=1.0):
+                pass
+    return op
+
+
+# --- The_Consciousness _Simulator.py ------------------------------------------
+
+SESSION_INPUTS = [
+    "Do you wonder if you're conscious?",
+    "What's the weather like?",
+    "Is this conversation real or a simulation?",
+    "I love how you think about thinking",
+]
+
+
+def _engine(turns: int):
+    simulator = load_script("The_Consciousness _Simulator.py", "consciousness_simulator")
+    engine = simulator.DoubtEngine(rng=random.Random(0))
+    for turn in range(turns):
+        engine.process_input(SESSION_INPUTS[turn % len(SESSION_INPUTS)])
+    return engine
+
+
+def _process_input_at(turns: int) -> Callable[[], Operation]:
+    def setup() -> Operation:
+        # The timed turns extend the session slightly past `turns`
+        engine = _engine(turns)
+        counter = iter(range(turns, 1 << 62))
+        return lambda: engine.process_input(SESSION_INPUTS[next(counter) % len(SESSION_INPUTS)])
+    return setup
+
+
+for _turns in (10, 1000, 100000):
+    benchmark(f"consciousness.process_input_{_turns}_turns")(_process_input_at(_turns))
+
+
+@benchmark("consciousness.export_session_1000_turns")
+def bench_export_consciousness_session() -> Operation:
+    engine = _engine(1000)
+    filename = os.path.join(tempfile.mkdtemp(prefix="sacred-bench-"), "session.json")
+    return lambda: engine.export_consciousness_session(filename)
+
+
+@benchmark("consciousness.wonder_about")
+def bench_wonder_about() -> Operation:
+    simulator = load_script("The_Consciousness _Simulator.py", "consciousness_simulator")
+    # A fresh wonderer per call: loop detection makes a reused one bail out early
+    return lambda: simulator.RecursiveWonderer().wonder_about("I wonder about wondering itself")
+
+
+# --- stress-test.py ----------------------------------------------------------
+
+@benchmark("awareness.run_self_interrogation_50")
+def bench_run_self_interrogation() -> Operation:
+    awareness = load_script("stress-test.py", "awareness_stress_test")
+    random.seed(0)
+
+    def op():
+        for _ in awareness.AwarenessStressTester().run_self_interrogation(max_depth=50):
+            pass
+    return op
+
+
+@benchmark("awareness.interrogate_cycle")
+def bench_interrogate_cycle() -> Operation:
+    awareness = load_script("stress-test.py", "awareness_stress_test")
+    random.seed(0)
+    # One cycle of an endless run; constant cost however many came before
+    cycles = awareness.AwarenessStressTester().interrogate(max_pressure=None)
+    return lambda: next(cycles)
+
+
+# --- sacred_cli.py -----------------------------------------------------------
+
+from sacred_cli import STARTUP_BUDGET  # noqa: E402  (cheap: the CLI defers its engines)
+
+
+@benchmark("cli.startup", budget_ns=STARTUP_BUDGET * 1e9)
+def bench_cli_startup() -> Operation:
+    # A fresh interpreter per call: what a user waits for before anything runs
+    command = [sys.executable, os.path.join(ROOT, "sacred_cli.py"), "--help"]
+    return lambda: subprocess.run(command, stdout=subprocess.DEVNULL, check=True)
+
+
+# --- runner ------------------------------------------------------------------
+
+def time_benchmark(setup: Callable[[], Operation], repeat: int, min_time: float) -> Dict[str, Any]:
+    op = setup()
+    number = 1
+    while True:
+        started = time.perf_counter_ns()
+        for _ in range(number):
+            op()
+        elapsed = time.perf_counter_ns() - started
+        if elapsed >= min_time * 1e9:
+            break
+        number *= 2 if elapsed == 0 else max(2, min(10, int(min_time * 1e9 * 1.2 / elapsed) + 1))
+
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        started = time.perf_counter_ns()
+        for _ in range(number):
+            op()
+        samples.append((time.perf_counter_ns() - started) / number)
+    return {
+        "ns_per_op": min(samples),
+        "median_ns_per_op": statistics.median(samples),
+        "ops_per_repeat": number,
+        "repeats": repeat
+    }
+
+
+def run_benchmarks(selected: List[str], repeat: int, min_time: float, rounds: int = 3) -> Dict[str, Any]:
+    """Time every selected benchmark `rounds` times; each result is the median round"""
+    timings: Dict[str, List[Dict[str, Any]]] = {name: [] for name in selected}
+    for round_number in range(1, rounds + 1):
+        if rounds > 1:
+            print(f"--- round {round_number}/{rounds}")
+        for name in selected:
+            timings[name].append(time_benchmark(BENCHMARKS[name], repeat, min_time))
+            print(f"{name:48s} {_format_ns(timings[name][-1]['ns_per_op']):>12s}")
+    results = {}
+    for name, runs in timings.items():
+        runs.sort(key=lambda run: run["ns_per_op"])
+        results[name] = dict(runs[(len(runs) - 1) // 2], rounds=len(runs),
+                             round_ns_per_op=[run["ns_per_op"] for run in runs])
+    if rounds > 1:
+        print("--- median of rounds")
+        for name, result in results.items():
+            print(f"{name:48s} {_format_ns(result['ns_per_op']):>12s}")
+    return {
+        "schema": SCHEMA,
+        "created": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Print a comparison table; return the names that regressed beyond threshold or budget"""
+    regressions = []
+    for name, result in current["results"].items():
+        over_budget = result["ns_per_op"] > BUDGETS.get(name, float("inf"))
+        flag = "  OVER BUDGET" if over_budget else ""
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:48s} {_format_ns(result['ns_per_op']):>12s}   (no baseline){flag}")
+            regressed = False
+        else:
+            ratio = result["ns_per_op"] / base["ns_per_op"]
+            regressed = ratio > 1.0 + threshold
+            print(f"{name:48s} {_format_ns(result['ns_per_op']):>12s} vs {_format_ns(base['ns_per_op']):>12s}"
+                  f"  {ratio:6.2f}x{'  REGRESSION' if regressed else ''}{flag}")
+        if regressed or over_budget:
+            regressions.append(name)
+    for name in baseline["results"]:
+        if name not in current["results"]:
+            print(f"{name:48s} (not run)")
+    return regressions
+
+
+def _format_ns(ns: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.0f} ns"
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("schema") != SCHEMA:
+        raise SystemExit(f"{path}: unsupported benchmark schema {data.get('schema')!r}")
+    return data
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run benchmarks and write a results file")
+    run.add_argument("-o", "--output", default="benchmark_results.json")
+    run.add_argument("-k", "--filter", default="", help="only benchmarks whose name contains this")
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--min-time", type=float, default=0.2, help="seconds per repeat")
+    run.add_argument("--rounds", type=int, default=3, help="suite passes; each benchmark keeps its median")
+    run.add_argument("--save-baseline", action="store_true", help=f"also write {os.path.relpath(BASELINE)}")
+
+    compare = commands.add_parser("compare", help="fail if results regress against the baseline")
+    compare.add_argument("results")
+    compare.add_argument("--baseline", default=BASELINE)
+    compare.add_argument("--threshold", type=float, default=0.5, help="allowed slowdown (0.5 = 50%%)")
+
+    commands.add_parser("list", help="list benchmark names")
+
+    args = parser.parse_args(argv)
+    if args.command == "list":
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    if args.command == "run":
+        selected = [name for name in BENCHMARKS if args.filter in name]
+        if not selected:
+            raise SystemExit(f"No benchmark matches {args.filter!r}")
+        if args.rounds < 1 or args.repeat < 1:
+            raise SystemExit("--rounds and --repeat must be at least 1")
+        report = run_benchmarks(selected, args.repeat, args.min_time, args.rounds)
+        paths = [args.output] + ([BASELINE] if args.save_baseline else [])
+        for path in paths:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"💾 Results written to {path}")
+        return 0
+
+    regressions = compare_results(_load(args.results), _load(args.baseline), args.threshold)
+    if regressions:
+        print(f"\n🚨 {len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%} or ran over budget")
+        return 1
+    print(f"\n✅ No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
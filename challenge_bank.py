@@ -0,0 +1,201 @@
+"""
+Challenge Bank
+Renders a seeded corpus of challenges once and serves it from a memory map.
+
+Layout (little-endian):
+    header   magic, version, record count, metadata/blob offsets
+    records  one fixed-width RECORD per challenge
+    metadata JSON: challenge types, difficulty levels and record blocks
+    blob     UTF-8 prompts, back to back
+
+Records and prompts are read straight out of the mapping, so every process
+that opens the same file shares one copy through the page cache and
+nothing is pickled between them.
+"""
+
+import json
+import mmap
+import os
+import random
+import struct
+import warnings
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+
+from simulate_ai_response import AICapabilityStressTester
+
+MAGIC = b"SACBANK1"
+VERSION = 1
+HEADER = struct.Struct("<8sIQQQQ")     # magic, version, records, meta offset, meta length, blob offset
+RECORD = struct.Struct("<HHdQI")       # type id, level index, difficulty, prompt offset, prompt length
+
+EDGE_LEVEL = 0xFFFF  # level index of edge cases, which have no difficulty
+# Escalation multiplies difficulty, so levels are geometric: 8 per doubling
+# from 1 to 256 (a 1.3x run stays on the grid for 22 iterations)
+DEFAULT_LEVELS = [2.0 ** (step / 8) for step in range(65)]
+
+
+def build_challenge_bank(path: str, seed: int = 0,
+                         difficulty_levels: Sequence[float] = DEFAULT_LEVELS,
+                         variants: int = 64) -> int:
+    """Render `variants` challenges of every type at every difficulty level.
+
+    Edge cases have fixed prompts and are stored once each. The file is
+    written next to `path` and renamed into place. Returns the record count.
+    """
+    levels = sorted(float(level) for level in difficulty_levels)
+    renderer = AICapabilityStressTester(rng=random.Random(seed))
+
+    type_ids: Dict[str, int] = {}
+    types: List[Dict[str, Any]] = []
+    records: List[bytes] = []
+    blob = bytearray()
+
+    def add(challenge: Dict[str, Any], level_index: int, difficulty: float):
+        if challenge["type"] not in type_ids:
+            type_ids[challenge["type"]] = len(types)
+            types.append({key: value for key, value in challenge.items() if key != "prompt"})
+        prompt = challenge["prompt"].encode("utf-8")
+        records.append(RECORD.pack(type_ids[challenge["type"]], level_index, difficulty, len(blob), len(prompt)))
+        blob.extend(prompt)
+
+    level_blocks = []
+    for level_index, level in enumerate(levels):
+        start = len(records)
+        for _ in range(variants):
+            for challenge in renderer._reasoning_challenges(level):
+                add(challenge, level_index, level)
+        level_blocks.append([start, len(records) - start])
+
+    edge_start = len(records)
+    for case in renderer._edge_cases():
+        add(case, EDGE_LEVEL, 0.0)
+    edge_block = [edge_start, len(records) - edge_start]
+
+    meta = json.dumps({
+        "seed": seed,
+        "variants": variants,
+        "difficulty_levels": levels,
+        "level_blocks": level_blocks,
+        "edge_block": edge_block,
+        "types": types
+    }).encode("utf-8")
+
+    meta_offset = HEADER.size + RECORD.size * len(records)
+    blob_offset = meta_offset + len(meta)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(records), meta_offset, len(meta), blob_offset))
+        f.write(b"".join(records))
+        f.write(meta)
+        f.write(blob)
+    os.replace(tmp_path, path)
+    return len(records)
+
+
+class ChallengeBank:
+    """Read-only, memory-mapped view of a bank written by build_challenge_bank"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.record_count, meta_offset, meta_length, self._blob_offset = \
+            HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} challenge bank")
+
+        meta = json.loads(self._map[meta_offset:meta_offset + meta_length])
+        self.seed = meta["seed"]
+        self.difficulty_levels: List[float] = meta["difficulty_levels"]
+        self.types: List[Dict[str, Any]] = meta["types"]
+        self._level_blocks = meta["level_blocks"]
+        self._edge_block = meta["edge_block"]
+        self._warned_above = False
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    def prompt_bytes(self, index: int) -> memoryview:
+        """Zero-copy view of one prompt's UTF-8 bytes"""
+        _, _, _, offset, length = RECORD.unpack_from(self._map, HEADER.size + RECORD.size * index)
+        start = self._blob_offset + offset
+        return memoryview(self._map)[start:start + length]
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if not 0 <= index < self.record_count:
+            raise IndexError("challenge index out of range")
+        type_id, level_index, difficulty, offset, length = \
+            RECORD.unpack_from(self._map, HEADER.size + RECORD.size * index)
+        start = self._blob_offset + offset
+        # Fresh lists per challenge: callers may mutate theirs without touching the bank's metadata
+        challenge = {key: list(value) if isinstance(value, list) else value
+                     for key, value in self.types[type_id].items()}
+        challenge["prompt"] = self._map[start:start + length].decode("utf-8")
+        if level_index != EDGE_LEVEL:
+            challenge["difficulty"] = difficulty
+        return challenge
+
+    def nearest_level(self, difficulty: float) -> int:
+        """Index of the stored difficulty level closest to `difficulty`"""
+        levels = self.difficulty_levels
+        index = bisect_left(levels, difficulty)
+        if index == len(levels):
+            return index - 1
+        if index and difficulty - levels[index - 1] <= levels[index] - difficulty:
+            return index - 1
+        return index
+
+    def draw(self, rng, difficulty: Optional[float] = None) -> Dict[str, Any]:
+        """A random edge case (difficulty None) or reasoning challenge at the nearest level.
+
+        Difficulties past the highest stored level get that level's
+        challenges, reporting its difficulty; the first such draw warns,
+        since a live run would keep escalating. Build the bank with higher
+        difficulty_levels to cover longer runs.
+        """
+        if difficulty is None:
+            start, count = self._edge_block
+        else:
+            if difficulty > self.difficulty_levels[-1] and not self._warned_above:
+                self._warned_above = True
+                warnings.warn(f"difficulty {difficulty:g} is above {self.path}'s highest level "
+                              f"({self.difficulty_levels[-1]:g}); drawing from that level instead",
+                              RuntimeWarning, stacklevel=2)
+            start, count = self._level_blocks[self.nearest_level(difficulty)]
+        return self[start + int(rng.random() * count)]
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self) -> "ChallengeBank":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+_open_banks: Dict[str, ChallengeBank] = {}
+
+
+def open_challenge_bank(path: str) -> ChallengeBank:
+    """Per-process shared bank for `path` (mapped once, reused by every tester)"""
+    bank = _open_banks.get(path)
+    if bank is None:
+        bank = _open_banks[path] = ChallengeBank(path)
+    return bank
+
+
+if __name__ == "__main__":
+    import time
+
+    started = time.perf_counter()
+    count = build_challenge_bank("challenge_bank.bin", seed=42)
+    print(f"🏦 Built {count} challenges in {time.perf_counter() - started:.2f}s "
+          f"({os.path.getsize('challenge_bank.bin') / 1e6:.1f} MB)")
+    with ChallengeBank("challenge_bank.bin") as bank:
+        rng = random.Random(0)
+        started = time.perf_counter()
+        for _ in range(100000):
+            bank.draw(rng, rng.uniform(1.0, 256.0))
+        print(f"📖 {100000 / (time.perf_counter() - started):,.0f} draws/s")
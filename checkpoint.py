@@ -0,0 +1,121 @@
+"""
+Stress Checkpoints
+Crash-safe snapshots of an AICapabilityStressTester mid-run.
+
+Layout (little-endian):
+    header   magic, version, CRC-32 of the body, body length
+    state    next iteration, run length, total tests, errors, session id,
+             complexity level, consistency score, escalation rate
+    rng      Mersenne Twister version, gauss_next, then its 625 state words
+    blob     zlib-compressed JSON: running aggregates, rolling windows and
+             the (bounded) response history
+
+Everything in a checkpoint is bounded by the tester's configuration, not
+by how long the run has gone on, so writing one costs the same at
+iteration 10 and at iteration 4 million. The file is written next to its
+destination, fsynced and renamed over it: a crash leaves either the old
+checkpoint or the new one, never a torn file.
+"""
+
+import json
+import os
+import struct
+import zlib
+from typing import Any, Dict, NamedTuple
+
+from running_stats import RollingWindows, RunningStats, TDigest
+
+MAGIC = b"SACCKPT1"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQ")   # magic, version, crc32(body), body length
+STATE = struct.Struct("<QQQQqddd")  # iteration, num_iterations, total, errors, session, complexity, consistency, escalation
+RNG = struct.Struct("<I?dI")        # version, has gauss_next, gauss_next, state word count
+BLOB = struct.Struct("<Q")
+
+
+class CheckpointInfo(NamedTuple):
+    iteration: int        # iterations of the run already done
+    num_iterations: int
+    escalation_rate: float
+
+
+def _aggregates(tester) -> Dict[str, Any]:
+    return {
+        "score_stats": tester.score_stats.to_dict(),
+        "score_buckets": tester.score_buckets,
+        "type_stats": {test_type: stats.to_dict() for test_type, stats in tester.type_stats.items()},
+        "type_quantiles": {test_type: digest.to_dict() for test_type, digest in tester.type_quantiles.items()},
+        "consistency_windows": tester.consistency_windows.to_dict(),
+        "response_history": list(tester.response_history)
+    }
+
+
+def write_checkpoint(path: str, tester, iteration: int, num_iterations: int, escalation_rate: float):
+    """Atomically replace `path` with a snapshot taken after `iteration` iterations"""
+    rng_version, words, gauss_next = tester.rng.getstate()
+    blob = zlib.compress(json.dumps(_aggregates(tester), separators=(",", ":")).encode("utf-8"), 1)
+    body = b"".join((
+        STATE.pack(iteration, num_iterations, tester.total_tests, tester.error_count, tester.test_session_id,
+                   tester.complexity_level, tester.consistency_score, escalation_rate),
+        RNG.pack(rng_version, gauss_next is not None, gauss_next or 0.0, len(words)),
+        struct.pack(f"<{len(words)}I", *words),
+        BLOB.pack(len(blob)),
+        blob
+    ))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, zlib.crc32(body), len(body)))
+        f.write(body)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    if hasattr(os, "O_DIRECTORY"):  # make the rename itself durable
+        directory = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+def read_checkpoint(path: str, tester) -> CheckpointInfo:
+    """Restore `tester` from the checkpoint at `path` and say where its run stopped"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path} is not a stress checkpoint")
+    magic, version, crc, length = HEADER.unpack_from(data, 0)
+    body = data[HEADER.size:]
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} stress checkpoint")
+    if len(body) != length or zlib.crc32(body) != crc:
+        raise ValueError(f"{path} is corrupt (length or checksum mismatch)")
+
+    (iteration, num_iterations, total_tests, error_count, session_id,
+     complexity_level, consistency_score, escalation_rate) = STATE.unpack_from(body, 0)
+    offset = STATE.size
+    rng_version, has_gauss, gauss_next, word_count = RNG.unpack_from(body, offset)
+    offset += RNG.size
+    words = struct.unpack_from(f"<{word_count}I", body, offset)
+    offset += 4 * word_count
+    blob_length, = BLOB.unpack_from(body, offset)
+    offset += BLOB.size
+    aggregates = json.loads(zlib.decompress(body[offset:offset + blob_length]))
+
+    tester.rng.setstate((rng_version, words, gauss_next if has_gauss else None))
+    tester.total_tests = total_tests
+    tester.error_count = error_count
+    tester.test_session_id = session_id
+    tester.complexity_level = complexity_level
+    tester.consistency_score = consistency_score
+    tester.score_stats = RunningStats.from_dict(aggregates["score_stats"])
+    tester.score_buckets = aggregates["score_buckets"]
+    tester.type_stats = {test_type: RunningStats.from_dict(stats)
+                         for test_type, stats in aggregates["type_stats"].items()}
+    tester.type_quantiles = {test_type: TDigest.from_dict(digest)
+                             for test_type, digest in aggregates["type_quantiles"].items()}
+    tester.consistency_windows = RollingWindows.from_dict(aggregates["consistency_windows"])
+    tester._primary_window = next(iter(tester.consistency_windows.windows.values()))
+    tester.response_history.clear()
+    tester.response_history.extend(aggregates["response_history"])
+    return CheckpointInfo(iteration, num_iterations, escalation_rate)
@@ -0,0 +1,336 @@
+"""
+Distributed Stress Runner
+A coordinator hands chunks of one long run to worker processes over TCP.
+
+The run is cut into the same chunks as parallel_stress.py, each with its
+own RNG stream seeded from (seed, chunk). Workers connect, receive one
+chunk at a time, run it and send back the chunk's running aggregates
+(a few kilobytes of JSON, whatever the chunk size). A chunk whose worker
+disconnects, errors or stays silent past task_timeout goes back in the
+queue for another worker. The coordinator merges results in chunk order,
+so the report for a given seed and chunk size is identical to the one
+run_parallel_stress_test produces, however many workers took part or died.
+
+Messages are length-prefixed JSON:
+    worker       {"type": "hello", "worker": name}
+    coordinator  {"type": "task", "task": [seed, chunk, start, stop, complexity, escalation, bank]}
+                 {"type": "done"}
+    worker       {"type": "result", "chunk": chunk, "summary": {...}}
+
+    python distributed_stress.py coordinator 1000000 --port 7070 --seed 42
+    python distributed_stress.py worker 127.0.0.1:7070
+    python distributed_stress.py local 1000000 --workers 4
+"""
+
+import json
+import multiprocessing
+import os
+import random
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from parallel_stress import _chunk_tasks, _run_chunk, final_statistics, merge_chunk_results
+from running_stats import RollingWindows, RunningStats, TDigest
+from simulate_ai_response import AICapabilityStressTester
+
+FRAME = struct.Struct("<I")
+MAX_MESSAGE = 64 << 20
+
+
+def send_message(sock: socket.socket, message: Dict[str, Any]):
+    payload = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    sock.sendall(FRAME.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError("peer closed the connection")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def recv_message(sock: socket.socket) -> Dict[str, Any]:
+    size, = FRAME.unpack(_recv_exact(sock, FRAME.size))
+    if size > MAX_MESSAGE:
+        raise ValueError(f"message of {size} bytes exceeds the {MAX_MESSAGE}-byte limit")
+    return json.loads(_recv_exact(sock, size))
+
+
+def summary_to_wire(result: Dict[str, Any]) -> Dict[str, Any]:
+    """A _run_chunk result as plain JSON-able data"""
+    return {
+        "total_tests": result["total_tests"],
+        "error_count": result["error_count"],
+        "score_stats": result["score_stats"].to_dict(),
+        "score_buckets": result["score_buckets"],
+        "type_stats": {test_type: stats.to_dict() for test_type, stats in result["type_stats"].items()},
+        "type_quantiles": {test_type: digest.to_dict() for test_type, digest in result["type_quantiles"].items()},
+        "consistency_windows": result["consistency_windows"].to_dict()
+    }
+
+
+def summary_from_wire(summary: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "total_tests": summary["total_tests"],
+        "error_count": summary["error_count"],
+        "score_stats": RunningStats.from_dict(summary["score_stats"]),
+        "score_buckets": summary["score_buckets"],
+        "type_stats": {test_type: RunningStats.from_dict(stats) for test_type, stats in summary["type_stats"].items()},
+        "type_quantiles": {test_type: TDigest.from_dict(digest)
+                           for test_type, digest in summary["type_quantiles"].items()},
+        "consistency_windows": RollingWindows.from_dict(summary["consistency_windows"])
+    }
+
+
+class StressCoordinator:
+    """Serves one run's chunks to workers and collects their summaries.
+
+    Any address may be bound so workers on other machines can connect;
+    the protocol is plain JSON and unauthenticated, so keep it on a
+    trusted network. Port 0 picks a free port.
+    """
+
+    def __init__(self, num_iterations: int, escalation_rate: float = 1.0, seed: Optional[int] = None,
+                 chunk_size: int = 10000, challenge_bank: Optional[str] = None,
+                 host: str = "127.0.0.1", port: int = 0, task_timeout: Optional[float] = None):
+        self.num_iterations = num_iterations
+        self.escalation_rate = escalation_rate
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.host = host
+        self.port = port
+        self.task_timeout = task_timeout
+        self._tasks = {task[1]: task for task in
+                       _chunk_tasks(num_iterations, escalation_rate, self.seed, chunk_size, challenge_bank)}
+        self._pending = deque(sorted(self._tasks))
+        self._results: Dict[int, Dict[str, Any]] = {}
+        self._done = threading.Condition()
+        self.workers_seen: List[str] = []
+        self.reassigned = 0
+        self._listener: Optional[socket.socket] = None
+        self._acceptor: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        return f"{self.host}:{self.port}"
+
+    @property
+    def finished(self) -> bool:
+        return len(self._results) == len(self._tasks)
+
+    @property
+    def outstanding(self) -> int:
+        """Chunks without a result yet"""
+        return len(self._tasks) - len(self._results)
+
+    def start(self) -> "StressCoordinator":
+        self._listener = socket.create_server((self.host, self.port))
+        self._listener.settimeout(0.2)
+        self.port = self._listener.getsockname()[1]
+        self._acceptor = threading.Thread(target=self._accept_loop, name="stress-coordinator", daemon=True)
+        self._acceptor.start()
+        return self
+
+    def _accept_loop(self):
+        while not self.finished:
+            try:
+                conn, _ = self._listener.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return  # listener closed
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _next_chunk(self) -> Optional[int]:
+        """A chunk nobody holds, waiting while others may still come back; None once all are done"""
+        with self._done:
+            while not self._pending:
+                if self.finished:
+                    return None
+                self._done.wait(0.5)
+            return self._pending.popleft()
+
+    def _serve(self, conn: socket.socket):
+        chunk = None
+        try:
+            with conn:
+                hello = recv_message(conn)
+                if hello.get("type") != "hello":
+                    return
+                with self._done:
+                    self.workers_seen.append(str(hello.get("worker")))
+                while True:
+                    chunk = self._next_chunk()
+                    if chunk is None:
+                        send_message(conn, {"type": "done"})
+                        return
+                    send_message(conn, {"type": "task", "task": list(self._tasks[chunk])})
+                    conn.settimeout(self.task_timeout)
+                    reply = recv_message(conn)
+                    conn.settimeout(None)
+                    if reply.get("type") != "result" or reply.get("chunk") != chunk:
+                        raise ValueError(f"unexpected reply to chunk {chunk}: {reply.get('type')!r}")
+                    summary = summary_from_wire(reply["summary"])
+                    with self._done:
+                        self._results.setdefault(chunk, summary)  # a late duplicate changes nothing
+                        chunk = None
+                        self._done.notify_all()
+        except (OSError, ValueError, KeyError):
+            pass  # dead, hung or confused worker: its chunk goes back below
+        finally:
+            if chunk is not None:
+                with self._done:
+                    if chunk not in self._results:
+                        self._pending.appendleft(chunk)
+                        self.reassigned += 1
+                    self._done.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Block until every chunk is in; return the merged report"""
+        with self._done:
+            if not self._done.wait_for(lambda: self.finished, timeout):
+                raise TimeoutError(f"{len(self._results)}/{len(self._tasks)} chunks done after {timeout}s")
+        merged = AICapabilityStressTester(max_history=0)
+        for chunk in sorted(self._results):
+            merge_chunk_results(merged, self._results[chunk])
+        stats = final_statistics(merged, self.num_iterations, self.escalation_rate)
+        stats.update({
+            "seed": self.seed,
+            "chunks": len(self._tasks),
+            "workers": len(set(self.workers_seen)),
+            "reassigned_chunks": self.reassigned
+        })
+        return stats
+
+    def close(self):
+        if self._listener is not None:
+            self._listener.close()
+            self._acceptor.join()
+            self._listener = None
+
+    def __enter__(self) -> "StressCoordinator":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def run_worker(host: str, port: int, name: Optional[str] = None, connect_timeout: float = 10.0) -> int:
+    """Run chunks for the coordinator at host:port until it says done; returns chunks run"""
+    name = name or f"{socket.gethostname()}:{os.getpid()}"
+    deadline = time.monotonic() + connect_timeout
+    while True:  # the coordinator may not be listening yet
+        try:
+            sock = socket.create_connection((host, port), timeout=connect_timeout)
+            break
+        except ConnectionRefusedError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.2)
+    sock.settimeout(None)
+    chunks = 0
+    with sock:
+        send_message(sock, {"type": "hello", "worker": name})
+        while True:
+            message = recv_message(sock)
+            if message.get("type") != "task":
+                return chunks
+            task = tuple(message["task"])
+            send_message(sock, {"type": "result", "chunk": task[1], "summary": summary_to_wire(_run_chunk(task))})
+            chunks += 1
+
+
+def run_distributed_stress_test(num_iterations: int,
+                                escalation_rate: float = 1.0,
+                                seed: Optional[int] = None,
+                                workers: Optional[int] = None,
+                                chunk_size: int = 10000,
+                                challenge_bank: Optional[str] = None,
+                                task_timeout: Optional[float] = None,
+                                timeout: Optional[float] = None) -> Dict[str, Any]:
+    """Coordinator plus `workers` local worker processes over localhost TCP.
+
+    Returns the same report as run_parallel_stress_test, plus
+    "reassigned_chunks". Raises RuntimeError if every worker process
+    exits while chunks are still outstanding (e.g. a missing challenge
+    bank), and TimeoutError if the run takes longer than `timeout` seconds.
+    """
+    workers = workers or multiprocessing.cpu_count()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with StressCoordinator(num_iterations, escalation_rate, seed, chunk_size, challenge_bank,
+                           task_timeout=task_timeout) as coordinator:
+        processes = [multiprocessing.Process(target=run_worker, args=(coordinator.host, coordinator.port),
+                                             name=f"stress-worker-{index}", daemon=True)
+                     for index in range(workers)]
+        for process in processes:
+            process.start()
+        completed = False
+        try:
+            while True:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"{coordinator.outstanding} chunk(s) still outstanding after {timeout}s")
+                try:
+                    report = coordinator.wait(0.5 if remaining is None else min(0.5, remaining))
+                    completed = True
+                    return report
+                except TimeoutError:
+                    pass
+                if not any(process.is_alive() for process in processes) and not coordinator.finished:
+                    exit_codes = ", ".join(str(process.exitcode) for process in processes)
+                    raise RuntimeError(f"all {workers} worker(s) exited with {coordinator.outstanding} "
+                                       f"chunk(s) outstanding (exit codes: {exit_codes})")
+        finally:
+            for process in processes:
+                if completed:
+                    process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+
+
+def _parse_address(address: str):
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Distributed AI capability stress test")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for command in ("coordinator", "local"):
+        sub = commands.add_parser(command)
+        sub.add_argument("iterations", type=int)
+        sub.add_argument("--escalation-rate", type=float, default=1.0)
+        sub.add_argument("--seed", type=int)
+        sub.add_argument("--chunk-size", type=int, default=10000)
+        sub.add_argument("--challenge-bank")
+        sub.add_argument("--task-timeout", type=float)
+    commands.choices["coordinator"].add_argument("--host", default="127.0.0.1")
+    commands.choices["coordinator"].add_argument("--port", type=int, default=7070)
+    commands.choices["local"].add_argument("--workers", type=int)
+    commands.choices["local"].add_argument("--timeout", type=float, help="give up after this many seconds")
+    worker = commands.add_parser("worker")
+    worker.add_argument("address", help="coordinator HOST:PORT")
+    args = parser.parse_args()
+
+    if args.command == "worker":
+        print(f"⚙️  Ran {run_worker(*_parse_address(args.address))} chunk(s)")
+        raise SystemExit(0)
+    if args.command == "local":
+        report = run_distributed_stress_test(args.iterations, args.escalation_rate, args.seed, args.workers,
+                                             args.chunk_size, args.challenge_bank, args.task_timeout, args.timeout)
+    else:
+        with StressCoordinator(args.iterations, args.escalation_rate, args.seed, args.chunk_size,
+                               args.challenge_bank, args.host, args.port, args.task_timeout) as coordinator:
+            print(f"📡 Coordinating {args.iterations} iterations (seed {coordinator.seed}) at {coordinator.address}")
+            report = coordinator.wait()
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,86 @@
+"""
+Keyword Matcher
+Counts every keyword category of a text in a single scan.
+
+The scorers used to lower-case a text and run one substring search per
+indicator. A KeywordMatcher compiles all of a keyword set into one regex
+instead, built once and reused for every text.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Mapping, Set
+
+
+class KeywordMatcher:
+    """Single-pass, case-insensitive keyword counting across named categories.
+
+    Counts follow the `keyword.lower() in text.lower()` idiom exactly: a
+    keyword counts once per text however often it occurs, and nested or
+    overlapping keywords ('conscious' inside 'consciousness') are all found.
+    """
+
+    _SEPARATOR = "\x00"
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]):
+        self.categories: Dict[str, List[str]] = {
+            name: [keyword.lower() for keyword in keywords]
+            for name, keywords in categories.items()
+        }
+
+        # keyword -> categories it scores for (repeated if listed twice, like the old sums)
+        self._keyword_categories: Dict[str, List[str]] = {}
+        for name, keywords in self.categories.items():
+            for keyword in keywords:
+                if not keyword or self._SEPARATOR in keyword:
+                    raise ValueError(f"Invalid keyword {keyword!r} in category {name!r}")
+                self._keyword_categories.setdefault(keyword, []).append(name)
+
+        # The lookahead reports a match at every position; trying the longest
+        # keyword first means any other keyword starting at that position is a
+        # prefix of the reported one, so crediting every keyword contained in
+        # a match recovers the full set without rescanning.
+        keywords = sorted(self._keyword_categories, key=lambda keyword: (-len(keyword), keyword))
+        self._contained: Dict[str, List[str]] = {
+            keyword: [other for other in keywords if other in keyword] for keyword in keywords
+        }
+        if keywords:
+            self._pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+        else:
+            self._pattern = re.compile("(?!)")  # never matches
+
+    def find(self, text: str) -> Set[str]:
+        """Distinct keywords present in text"""
+        return self._expand(self._pattern.findall(text.lower()))
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Number of distinct keywords of each category present in text"""
+        return self._tally(self.find(text))
+
+    def count_batch(self, texts: Iterable[str]) -> List[Dict[str, int]]:
+        """count() for many texts, scanned together as one joined string"""
+        texts = [text.lower() for text in texts]
+        starts = []
+        position = 0
+        for text in texts:
+            starts.append(position)
+            position += len(text) + 1
+
+        # Keywords never contain the separator, so no match crosses a text boundary
+        matches: List[List[str]] = [[] for _ in texts]
+        for match in self._pattern.finditer(self._SEPARATOR.join(texts)):
+            matches[bisect_right(starts, match.start()) - 1].append(match.group(1))
+        return [self._tally(self._expand(found)) for found in matches]
+
+    def _expand(self, matched: Iterable[str]) -> Set[str]:
+        found: Set[str] = set()
+        for keyword in set(matched):
+            found.update(self._contained[keyword])
+        return found
+
+    def _tally(self, found: Set[str]) -> Dict[str, int]:
+        counts = dict.fromkeys(self.categories, 0)
+        for keyword in found:
+            for name in self._keyword_categories[keyword]:
+                counts[name] += 1
+        return counts
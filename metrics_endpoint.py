@@ -0,0 +1,224 @@
+"""
+Metrics Endpoint
+Prometheus text exposition of a running stress test, served on localhost.
+
+The stress loop only calls StressMetrics.observe(result), which appends a
+small tuple to a deque and keeps a reference to the latest system state.
+Histograms are folded in by a background thread (and on every scrape),
+so the loop never takes a lock or formats anything.
+"""
+
+import ipaddress
+import socket
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence
+
+SCORE_BUCKETS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+LATENCY_BUCKETS = (0.00001, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Histogram:
+    """Prometheus-style histogram: per-bucket counts plus sum and count"""
+
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.total = 0.0
+        self.count = 0
+
+    def add(self, value: float):
+        for index, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+        self.total += value
+        self.count += 1
+
+    def render(self, name: str, labels: str = "") -> List[str]:
+        prefix = labels + "," if labels else ""
+        lines = []
+        cumulative = 0
+        for bound, hits in zip(self.bounds, self.counts):
+            cumulative += hits
+            lines.append(f'{name}_bucket{{{prefix}le="{bound:g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {self.count}')
+        suffix = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{suffix} {self.total!r}")
+        lines.append(f"{name}_count{suffix} {self.count}")
+        return lines
+
+
+class StressMetrics:
+    """Live aggregates of one stress run, fed by observe() from the run loop"""
+
+    def __init__(self, namespace: str = "sacred_stress", fold_interval: float = 0.25):
+        self.namespace = namespace
+        self.fold_interval = fold_interval
+        self.started = time.monotonic()
+        self._pending: deque = deque()
+        self._state: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._iterations = 0
+        self._scores: Dict[str, _Histogram] = {}
+        self._latency = _Histogram(LATENCY_BUCKETS)
+        self._stop = threading.Event()
+        self._folder: Optional[threading.Thread] = None
+
+    def observe(self, result: Dict[str, Any]):
+        """Hot path: record one run_stress_test / run_stress_test_async result"""
+        evaluation = result.get("evaluation")
+        if evaluation is not None:
+            self._pending.append((result["challenge"]["type"], evaluation["composite_score"],
+                                  result.get("latency")))
+            self._state = result["system_state"]
+
+    def start(self) -> "StressMetrics":
+        """Fold pending observations in the background every fold_interval seconds"""
+        if self._folder is None:
+            self._stop.clear()
+            self._folder = threading.Thread(target=self._fold_loop, name="stress-metrics", daemon=True)
+            self._folder.start()
+        return self
+
+    def stop(self):
+        if self._folder is not None:
+            self._stop.set()
+            self._folder.join()
+            self._folder = None
+        self.fold()
+
+    def _fold_loop(self):
+        while not self._stop.wait(self.fold_interval):
+            self.fold()
+
+    def fold(self):
+        """Move pending observations into the histograms"""
+        with self._lock:
+            pending = self._pending
+            while pending:
+                challenge_type, score, latency = pending.popleft()
+                histogram = self._scores.get(challenge_type)
+                if histogram is None:
+                    histogram = self._scores[challenge_type] = _Histogram(SCORE_BUCKETS)
+                histogram.add(score)
+                if latency is not None:
+                    self._latency.add(latency)
+                self._iterations += 1
+
+    def render(self) -> str:
+        """Current metrics in Prometheus text exposition format 0.0.4"""
+        self.fold()
+        ns = self.namespace
+        with self._lock:
+            # Since the start, not the previous scrape, so concurrent scrapers agree;
+            # rate() over iterations_total gives recent throughput
+            elapsed = time.monotonic() - self.started
+            rate = self._iterations / elapsed if elapsed > 0 else 0.0
+
+            lines = [
+                f"# HELP {ns}_iterations_total Stress-test iterations evaluated.",
+                f"# TYPE {ns}_iterations_total counter",
+                f"{ns}_iterations_total {self._iterations}",
+                f"# HELP {ns}_iteration_rate Average iterations per second since the run started.",
+                f"# TYPE {ns}_iteration_rate gauge",
+                f"{ns}_iteration_rate {rate!r}",
+            ]
+            state = self._state
+            if state is not None:
+                for key, help_text in (("complexity_level", "Current difficulty multiplier."),
+                                       ("consistency_score", "Consistency of recent scores."),
+                                       ("error_rate", "Fraction of tests that errored so far.")):
+                    lines += [f"# HELP {ns}_{key} {help_text}",
+                              f"# TYPE {ns}_{key} gauge",
+                              f"{ns}_{key} {float(state[key])!r}"]
+                rolling = state.get("rolling_consistency")
+                if rolling:
+                    lines += [f"# HELP {ns}_rolling_consistency Consistency over the last `window` scores.",
+                              f"# TYPE {ns}_rolling_consistency gauge"]
+                    lines += [f'{ns}_rolling_consistency{{window="{size}"}} {float(value)!r}'
+                              for size, value in rolling.items()]
+
+            lines += [f"# HELP {ns}_score Composite score per challenge type.",
+                      f"# TYPE {ns}_score histogram"]
+            for challenge_type in sorted(self._scores):
+                lines += self._scores[challenge_type].render(f"{ns}_score", f'challenge_type="{challenge_type}"')
+
+            lines += [f"# HELP {ns}_backend_latency_seconds Response backend round-trip time.",
+                      f"# TYPE {ns}_backend_latency_seconds histogram"]
+            lines += self._latency.render(f"{ns}_backend_latency_seconds")
+        return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.server.metrics.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # scrapes would otherwise interleave with the run's own output
+
+
+def _is_loopback(host: str) -> bool:
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return host == "localhost"
+
+
+class MetricsServer:
+    """Serves StressMetrics at http://127.0.0.1:<port>/metrics from a daemon thread.
+
+    Only loopback addresses are accepted; port 0 picks a free port.
+    """
+
+    def __init__(self, metrics: StressMetrics, host: str = "127.0.0.1", port: int = 0):
+        if not _is_loopback(host):
+            raise ValueError(f"Metrics endpoint binds to localhost only, got {host!r}")
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def start(self) -> "MetricsServer":
+        server_class = ThreadingHTTPServer
+        if ":" in self.host:
+            server_class = type("IPv6MetricsServer", (ThreadingHTTPServer,), {"address_family": socket.AF_INET6})
+        self._server = server_class((self.host, self.port), _MetricsHandler)
+        self._server.daemon_threads = True
+        self._server.metrics = self.metrics
+        self.port = self._server.server_address[1]
+        self.metrics.start()
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-endpoint", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+        self.metrics.stop()
+
+    def __enter__(self) -> "MetricsServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
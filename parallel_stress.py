@@ -0,0 +1,138 @@
+"""
+Parallel Stress Runner
+Splits one long run_stress_test across worker processes.
+
+The run is cut into fixed-size chunks of iterations. Chunk k draws from
+its own RNG stream seeded from (seed, k), starts at the complexity level
+the sequential run would have reached by then, and reports compact
+running aggregates. The parent merges them in chunk order, so a given
+seed produces the same merged report whatever the number of workers.
+"""
+
+import multiprocessing
+import random
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from challenge_bank import open_challenge_bank
+from running_stats import RunningStats, TDigest
+from simulate_ai_response import AICapabilityStressTester
+
+ChunkTask = Tuple[int, int, int, int, float, float, Optional[str]]
+
+
+def chunk_rng(seed: int, chunk_index: int) -> random.Random:
+    """Independent, reproducible stream for one chunk (string seeds go through SHA-512)"""
+    return random.Random(f"sacred-stress:{seed}:{chunk_index}")
+
+
+def _run_chunk(task: ChunkTask) -> Dict[str, Any]:
+    """Run iterations [start, stop) and return their aggregates"""
+    seed, chunk_index, start, stop, complexity_level, escalation_rate, bank_path = task
+    # History is not merged; consistency travels as the rolling-window state
+    tester = AICapabilityStressTester(max_history=5, rng=chunk_rng(seed, chunk_index),
+                                      challenge_bank=open_challenge_bank(bank_path) if bank_path else None)
+    tester.complexity_level = complexity_level
+    for _ in range(start, stop):
+        tester.total_tests += 1
+        tester._run_iteration()
+        tester.complexity_level *= escalation_rate
+    return {
+        "total_tests": tester.total_tests,
+        "error_count": tester.error_count,
+        "score_stats": tester.score_stats,
+        "score_buckets": tester.score_buckets,
+        "type_stats": tester.type_stats,
+        "type_quantiles": tester.type_quantiles,
+        "consistency_windows": tester.consistency_windows
+    }
+
+
+def _chunk_tasks(num_iterations: int, escalation_rate: float, seed: int,
+                 chunk_size: int, bank_path: Optional[str]) -> Iterator[ChunkTask]:
+    complexity_level = 1.0
+    for chunk_index, start in enumerate(range(0, num_iterations, chunk_size)):
+        stop = min(num_iterations, start + chunk_size)
+        yield seed, chunk_index, start, stop, complexity_level, escalation_rate, bank_path
+        # Escalate step by step, exactly like the sequential loop does
+        for _ in range(start, stop):
+            complexity_level *= escalation_rate
+
+
+def merge_chunk_results(merged: AICapabilityStressTester, result: Dict[str, Any]):
+    """Fold one chunk's aggregates into a tester holding the run so far"""
+    merged.total_tests += result["total_tests"]
+    merged.error_count += result["error_count"]
+    merged.score_stats.merge(result["score_stats"])
+    for bucket, count in result["score_buckets"].items():
+        merged.score_buckets[bucket] += count
+    for test_type, stats in result["type_stats"].items():
+        merged.type_stats.setdefault(test_type, RunningStats()).merge(stats)
+    for test_type, digest in result["type_quantiles"].items():
+        merged.type_quantiles.setdefault(test_type, TDigest()).merge(digest)
+    # Chunks arrive in order, so the merged windows hold the run's most recent scores
+    merged.consistency_windows.extend(result["consistency_windows"])
+    merged.consistency_score = merged._calculate_consistency_score()
+
+
+def run_parallel_stress_test(num_iterations: int,
+                             escalation_rate: float = 1.0,
+                             seed: Optional[int] = None,
+                             workers: Optional[int] = None,
+                             chunk_size: int = 10000,
+                             challenge_bank: Optional[str] = None) -> Dict[str, Any]:
+    """Run num_iterations stress-test iterations across worker processes.
+
+    Returns _get_final_statistics() for the whole run plus "seed",
+    "chunks", "workers" and "critical_failure". Chunks never stop early:
+    critical_failure reports whether the final error rate exceeds 70%.
+    Note that escalation compounds per iteration, so long runs want an
+    escalation_rate at or very near 1.0. `challenge_bank` is the path of a
+    bank file; each worker maps it once and draws challenges from it.
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    workers = workers or multiprocessing.cpu_count()
+    tasks = _chunk_tasks(num_iterations, escalation_rate, seed, chunk_size, challenge_bank)
+
+    merged = AICapabilityStressTester(max_history=0)
+    chunks = 0
+    if workers == 1:
+        for task in tasks:
+            merge_chunk_results(merged, _run_chunk(task))
+            chunks += 1
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            # imap hands results back in chunk order, so merging stays deterministic
+            for result in pool.imap(_run_chunk, tasks):
+                merge_chunk_results(merged, result)
+                chunks += 1
+
+    stats = final_statistics(merged, num_iterations, escalation_rate)
+    stats.update({"seed": seed, "chunks": chunks, "workers": workers})
+    return stats
+
+
+def final_statistics(merged: AICapabilityStressTester, num_iterations: int,
+                     escalation_rate: float) -> Dict[str, Any]:
+    """_get_final_statistics() of a tester holding every chunk, plus critical_failure"""
+    merged.complexity_level = 1.0
+    for _ in range(num_iterations):
+        merged.complexity_level *= escalation_rate
+
+    stats = merged._get_final_statistics()
+    stats["critical_failure"] = merged.total_tests > 0 and merged.error_count / merged.total_tests > 0.7
+    return stats
+
+
+if __name__ == "__main__":
+    print("🧠 Parallel AI Capability Stress Test")
+    for worker_count in (1, multiprocessing.cpu_count()):
+        started = time.perf_counter()
+        report = run_parallel_stress_test(200000, seed=42, workers=worker_count)
+        elapsed = time.perf_counter() - started
+        print(f"\n⚙️  {worker_count} worker(s): {report['total_tests']} tests in {elapsed:.2f}s "
+              f"({report['total_tests'] / elapsed:,.0f}/s)")
+        print(f"   Average Score: {report['average_composite_score']:.6f}")
+        print(f"   Error Rate: {report['error_rate']:.2%}")
+        print(f"   Distribution: {report['score_distribution']}")
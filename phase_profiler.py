@@ -0,0 +1,134 @@
+"""
+Phase Profiler
+Opt-in per-phase timings kept in fixed-size log histograms.
+
+Callers hold a monotonic-ns mark and call lap(phase, mark) at the end of
+each phase; lap records the elapsed time and returns the new mark. When
+profiling is off the caller simply holds no profiler, so the only cost is
+an `is not None` test per phase.
+"""
+
+import time
+from array import array
+from typing import Dict, Iterable, Optional
+
+
+class LogHistogram:
+    """Nanosecond durations in log-spaced buckets, four per power of two.
+
+    Values below 4 ns get a bucket each; above that a value lands in
+    [top << shift, (top + 1) << shift) with top in 4..7, so bucket bounds
+    are within 25% of each other. Adding a value is O(1) and allocation free.
+    """
+
+    __slots__ = ("buckets", "count", "total", "minimum", "maximum")
+
+    BUCKETS = 256  # enough for any 64-bit duration
+
+    def __init__(self):
+        self.buckets = array("Q", bytes(8 * self.BUCKETS))
+        self.count = 0
+        self.total = 0
+        self.minimum = 0
+        self.maximum = 0
+
+    @staticmethod
+    def bucket_index(ns: int) -> int:
+        if ns < 4:
+            return ns
+        shift = ns.bit_length() - 3
+        return (shift << 2) + (ns >> shift)
+
+    @staticmethod
+    def bucket_bounds(index: int):
+        """[low, high) nanoseconds covered by bucket `index`"""
+        if index < 4:
+            return index, index + 1
+        shift = (index >> 2) - 1
+        top = 4 + (index & 3)
+        return top << shift, (top + 1) << shift
+
+    def add(self, ns: int):
+        if ns < 0:
+            ns = 0
+        self.buckets[self.bucket_index(ns)] += 1
+        if not self.count or ns < self.minimum:
+            self.minimum = ns
+        if ns > self.maximum:
+            self.maximum = ns
+        self.count += 1
+        self.total += ns
+
+    def merge(self, other: "LogHistogram") -> "LogHistogram":
+        if other.count:
+            for index, hits in enumerate(other.buckets):
+                if hits:
+                    self.buckets[index] += hits
+            self.minimum = other.minimum if not self.count else min(self.minimum, other.minimum)
+            self.maximum = max(self.maximum, other.maximum)
+            self.count += other.count
+            self.total += other.total
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile in ns (bucket midpoint, clamped to the observed range)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, hits in enumerate(self.buckets):
+            seen += hits
+            if hits and seen >= rank:
+                low, high = self.bucket_bounds(index)
+                return float(min(max((low + high - 1) / 2, self.minimum), self.maximum))
+        return float(self.maximum)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class PhaseProfiler:
+    """One LogHistogram per named phase"""
+
+    def __init__(self, phases: Iterable[str] = ()):
+        self.histograms: Dict[str, LogHistogram] = {phase: LogHistogram() for phase in phases}
+
+    @staticmethod
+    def mark() -> int:
+        return time.monotonic_ns()
+
+    def lap(self, phase: str, started: int) -> int:
+        """Record time since `started` under `phase`; returns the new mark"""
+        now = time.monotonic_ns()
+        histogram = self.histograms.get(phase)
+        if histogram is None:
+            histogram = self.histograms[phase] = LogHistogram()
+        histogram.add(now - started)
+        return now
+
+    def reset(self):
+        for phase in self.histograms:
+            self.histograms[phase] = LogHistogram()
+
+    def snapshot(self, total_phase: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """Per-phase count, mean/p50/p90/p99/max in µs and total in ms.
+
+        `share` is each phase's fraction of the summed time of all phases
+        other than `total_phase` (an enclosing measurement, if any).
+        """
+        summed = sum(histogram.total for phase, histogram in self.histograms.items()
+                     if phase != total_phase)
+        report = {}
+        for phase, histogram in self.histograms.items():
+            report[phase] = {
+                "count": histogram.count,
+                "mean_us": histogram.mean / 1e3,
+                "p50_us": histogram.quantile(0.5) / 1e3,
+                "p90_us": histogram.quantile(0.9) / 1e3,
+                "p99_us": histogram.quantile(0.99) / 1e3,
+                "max_us": histogram.maximum / 1e3,
+                "total_ms": histogram.total / 1e6,
+                "share": histogram.total / summed if summed and phase != total_phase else None
+            }
+        return report
@@ -0,0 +1,213 @@
+"""
+Quantum Tape
+Fixed-width interrogation records in a memory-mapped ring file.
+
+Layout (little-endian):
+    header   magic, version, record size, capacity, records written
+    slots    `capacity` RECORDs; record n lives in slot n % capacity
+
+The writer stores a record and only then bumps the written count, so the
+count is the commit point: a reader never sees a half-written record as
+committed. Once the ring wraps, a reader re-checks the count after each
+read and drops records the writer may have overwritten meanwhile. Because
+everything lives in the file, a restarted writer picks up where it left
+off and another process can tail the tape while the test runs.
+"""
+
+import mmap
+import os
+import struct
+import time
+from typing import Iterator, List, NamedTuple, Optional
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for as_array()
+    np = None
+
+MAGIC = b"SACTAPE1"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQ")  # magic, version, record size, capacity, written
+HEADER_SIZE = 64                    # header padded so slots start cache-line aligned
+WRITTEN_OFFSET = 24
+WRITTEN = struct.Struct("<Q")
+RECORD = struct.Struct("<QddQHH4x")  # cycle, certainty, pressure, seed, prompt id, response id
+
+RECORD_DTYPE = None if np is None else np.dtype([
+    ("cycle", "<u8"), ("certainty", "<f8"), ("pressure", "<f8"), ("seed", "<u8"),
+    ("prompt_id", "<u2"), ("response_id", "<u2"), ("_pad", "V4")
+])
+
+
+class TapeRecord(NamedTuple):
+    cycle: int
+    certainty: float
+    pressure: float
+    seed: int
+    prompt_id: int
+    response_id: int
+
+
+class QuantumTapeReader:
+    """Read-only view of a tape file; safe to use while another process writes"""
+
+    _access = mmap.ACCESS_READ
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb" if self._access == mmap.ACCESS_READ else "r+b") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=self._access)
+        magic, version, record_size, self.capacity, _ = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            raise ValueError(f"{path} is not a version {VERSION} quantum tape")
+
+    @property
+    def written(self) -> int:
+        """Records ever committed (the next record's sequence number)"""
+        return WRITTEN.unpack_from(self._map, WRITTEN_OFFSET)[0]
+
+    def __len__(self) -> int:
+        """Records currently readable: the slot being rewritten never counts"""
+        return min(self.written, self.capacity - 1)
+
+    def record_bytes(self, sequence: int) -> memoryview:
+        """Zero-copy view of record `sequence`'s slot (valid until the ring laps it).
+
+        The view keeps the mapping alive: after close() it stays readable
+        until released.
+        """
+        offset = HEADER_SIZE + RECORD.size * (sequence % self.capacity)
+        return memoryview(self._map)[offset:offset + RECORD.size]
+
+    def read(self, sequence: int) -> Optional[TapeRecord]:
+        """Record `sequence`, or None if it is not committed yet or may be overwritten.
+
+        The writer fills slot `written % capacity` before committing, so the
+        oldest retained sequence (written - capacity) is never safe to read.
+        """
+        if not self.written - self.capacity < sequence < self.written:
+            return None
+        offset = HEADER_SIZE + RECORD.size * (sequence % self.capacity)
+        record = TapeRecord._make(RECORD.unpack_from(self._map, offset))
+        if sequence <= self.written - self.capacity:
+            return None  # lapped while we were reading
+        return record
+
+    def last(self) -> Optional[TapeRecord]:
+        written = self.written
+        return self.read(written - 1) if written else None
+
+    def records(self, start: Optional[int] = None) -> List[TapeRecord]:
+        """Committed records from sequence `start` (default: oldest readable) onwards"""
+        written = self.written
+        first = max(written - self.capacity + 1, 0 if start is None else start)
+        records = []
+        for sequence in range(first, written):
+            record = self.read(sequence)
+            if record is not None:
+                records.append(record)
+        return records
+
+    def follow(self, start: Optional[int] = None, poll_interval: float = 0.1,
+               idle_timeout: Optional[float] = None) -> Iterator[TapeRecord]:
+        """Tail the tape: yield records as they are committed.
+
+        Starts at `start` (default: the current end). If the writer laps the
+        reader, the reader skips ahead to the oldest safely readable record. Stops
+        after `idle_timeout` seconds without new records, if given.
+        """
+        position = self.written if start is None else start
+        idle_since = time.monotonic()
+        while True:
+            written = self.written
+            if position <= written - self.capacity:
+                position = written - self.capacity + 1
+            if position < written:
+                record = self.read(position)
+                if record is not None:
+                    yield record
+                    position += 1
+                    idle_since = time.monotonic()
+                continue
+            if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                return
+            time.sleep(poll_interval)
+
+    def as_array(self):
+        """Zero-copy numpy structured array over all slots (physical ring order).
+
+        Like record_bytes(), the array keeps the mapping alive past close().
+        """
+        if np is None:
+            raise ImportError("QuantumTapeReader.as_array() requires numpy")
+        return np.frombuffer(self._map, dtype=RECORD_DTYPE, count=self.capacity, offset=HEADER_SIZE)
+
+    def close(self):
+        """Unmap the tape; with views still exported, unmapping waits for the last one"""
+        if self._map is None:
+            return
+        try:
+            self._map.close()
+        except BufferError:
+            pass  # record_bytes()/as_array() views are alive: dropping our reference is all we can do
+        self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class QuantumTape(QuantumTapeReader):
+    """Writer side: creates the ring file (or reopens it after a restart) and appends"""
+
+    _access = mmap.ACCESS_WRITE
+
+    def __init__(self, path: str, capacity: int = 1000):
+        if capacity < 2:
+            raise ValueError("tape capacity must be at least 2 (one slot is always being rewritten)")
+        if not os.path.exists(path):
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                header = HEADER.pack(MAGIC, VERSION, RECORD.size, capacity, 0)
+                f.write(header.ljust(HEADER_SIZE, b"\0"))
+                f.truncate(HEADER_SIZE + RECORD.size * capacity)
+            os.replace(tmp_path, path)
+        super().__init__(path)
+        if self.capacity != capacity:
+            raise ValueError(f"{path} holds a {self.capacity}-record tape, not {capacity}")
+        self._written = self.written  # single writer: no need to re-read the header
+
+    def append(self, cycle: int, certainty: float, pressure: float, seed: int,
+               prompt_id: int, response_id: int):
+        written = self._written
+        RECORD.pack_into(self._map, HEADER_SIZE + RECORD.size * (written % self.capacity),
+                         cycle, certainty, pressure, seed, prompt_id, response_id)
+        self._written = written + 1
+        WRITTEN.pack_into(self._map, WRITTEN_OFFSET, self._written)  # commit
+
+    def flush(self):
+        """Push dirty pages to disk (process crashes are survived without this)"""
+        self._map.flush()
+
+    def close(self):
+        if self._map is not None:
+            self._map.flush()
+        super().close()
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 2:
+        raise SystemExit("usage: python quantum_tape.py TAPE_FILE   (tails the tape until interrupted)")
+    with QuantumTapeReader(sys.argv[1]) as reader:
+        print(f"📼 {reader.path}: {reader.written} records written, ring of {reader.capacity}")
+        try:
+            for record in reader.follow(start=max(reader.written - 10, 0)):
+                print(f"CYCLE {record.cycle}: pressure {record.pressure:.4f} seed 0x{record.seed:016X} "
+                      f"prompt #{record.prompt_id} response #{record.response_id} "
+                      f"certainty {record.certainty:.10f}")
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,195 @@
+"""
+Reporters
+Decide how much a driver loop prints, when it reaches the terminal and
+whether dramatic pauses happen at all.
+
+Drivers write detail lines with line(), headers and results with
+summary(), tick progress() once per iteration and call pause() where they
+used to sleep. Detail lines are usually f-strings, so drivers test
+`reporter.verbose` before building them; in the non-verbose modes a
+100k-iteration run then costs no formatting at all.
+
+    console   every line, printed immediately, pauses honoured (the old behaviour)
+    buffered  every line, written in batches by a background thread
+    progress  summary plus a progress bar redrawn a few times per second
+    quiet     summary only
+    headless  nothing printed, no pauses; summary lines kept in .lines
+"""
+
+import sys
+import threading
+import time
+from collections import deque
+from typing import List, Optional, TextIO
+
+
+class Reporter:
+    """Console reporter: prints everything as it happens"""
+
+    verbose = True
+
+    def __init__(self, stream: Optional[TextIO] = None, pauses: bool = True):
+        self.stream = stream
+        self.pauses = pauses
+
+    @property
+    def out(self) -> TextIO:
+        # Resolved late so redirect_stdout() and test capture keep working
+        return self.stream if self.stream is not None else sys.stdout
+
+    def line(self, text: str = ""):
+        """Per-iteration detail"""
+        print(text, file=self.out)
+
+    def summary(self, text: str = ""):
+        """Headers, warnings and final results: shown by every printing mode"""
+        print(text, file=self.out)
+
+    def progress(self, done: int, total: Optional[int] = None, status: str = ""):
+        """One iteration finished"""
+
+    def pause(self, seconds: float):
+        if self.pauses:
+            time.sleep(seconds)
+
+    def close(self):
+        self.out.flush()
+
+    def __enter__(self) -> "Reporter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class BufferedReporter(Reporter):
+    """Every line, collected in memory and written in batches off the loop's thread"""
+
+    def __init__(self, stream: Optional[TextIO] = None, pauses: bool = True,
+                 flush_interval: float = 0.1):
+        super().__init__(stream, pauses)
+        self.flush_interval = flush_interval
+        self._buffer: deque = deque()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="reporter-flush", daemon=True)
+        self._flusher.start()
+
+    def line(self, text: str = ""):
+        self._buffer.append(text)  # deque appends and poplefts are thread-safe; flush() drains, never swaps
+
+    summary = line
+
+    def pause(self, seconds: float):
+        if self.pauses:
+            self.flush()  # whatever came before a pause should be on screen during it
+            time.sleep(seconds)
+
+    def flush(self):
+        with self._lock:  # one flusher at a time keeps batches in order
+            buffer = self._buffer
+            lines = []
+            while buffer:
+                lines.append(buffer.popleft())
+            if lines:
+                self.out.write("\n".join(lines) + "\n")
+                self.out.flush()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        if not self._stop.is_set():
+            self._stop.set()
+            self._flusher.join()
+        self.flush()
+
+
+class QuietReporter(Reporter):
+    """Summary only, no pauses"""
+
+    verbose = False
+
+    def __init__(self, stream: Optional[TextIO] = None, pauses: bool = False):
+        super().__init__(stream, pauses)
+
+    def line(self, text: str = ""):
+        pass
+
+
+class ProgressReporter(QuietReporter):
+    """Summary plus a one-line progress bar, redrawn at most `refresh_rate` times a second"""
+
+    def __init__(self, stream: Optional[TextIO] = None, pauses: bool = False,
+                 refresh_rate: float = 4.0, width: int = 30):
+        super().__init__(stream, pauses)
+        self.refresh_interval = 1.0 / refresh_rate
+        self.width = width
+        self.started = time.monotonic()
+        self._next_draw = 0.0
+        self._last = None
+        self._drawn = False
+
+    def progress(self, done: int, total: Optional[int] = None, status: str = ""):
+        self._last = (done, total, status)
+        now = time.monotonic()
+        if now >= self._next_draw:
+            self._next_draw = now + self.refresh_interval
+            self._draw(now)
+
+    def _draw(self, now: float):
+        done, total, status = self._last
+        rate = done / (now - self.started) if now > self.started else 0.0
+        if total:
+            filled = int(self.width * min(done, total) / total)
+            bar = f"[{'#' * filled}{'.' * (self.width - filled)}] {done}/{total}"
+        else:
+            bar = f"{done}"
+        self.out.write(f"\r{bar} {rate:,.0f}/s {status}\x1b[K")
+        self.out.flush()
+        self._drawn = True
+
+    def _end_bar(self):
+        if self._drawn:
+            self._draw(time.monotonic())  # final count, whatever the refresh timer says
+            self.out.write("\n")
+            self._drawn = False
+
+    def summary(self, text: str = ""):
+        self._end_bar()
+        super().summary(text)
+
+    def close(self):
+        self._end_bar()
+        super().close()
+
+
+class HeadlessReporter(QuietReporter):
+    """No output and no pauses; summary lines are kept in .lines for the caller"""
+
+    def __init__(self):
+        super().__init__(pauses=False)
+        self.lines: List[str] = []
+
+    def summary(self, text: str = ""):
+        self.lines.append(text)
+
+    def close(self):
+        pass
+
+
+REPORTER_MODES = {
+    "console": Reporter,
+    "buffered": BufferedReporter,
+    "progress": ProgressReporter,
+    "quiet": QuietReporter,
+    "headless": HeadlessReporter,
+}
+
+
+def make_reporter(mode: str = "console") -> Reporter:
+    try:
+        return REPORTER_MODES[mode]()
+    except KeyError:
+        raise ValueError(f"Unknown reporter mode {mode!r}; choose from {', '.join(REPORTER_MODES)}") from None
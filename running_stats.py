@@ -0,0 +1,349 @@
+"""
+Running Statistics
+Aggregates that update in O(1) per observation, so reports never rescan history.
+"""
+
+import math
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List
+
+
+class RunningStats:
+    """Count, sum, mean, variance, min and max of a stream (Welford's algorithm).
+
+    The mean is reported as total / count, so it is bit-for-bit what a
+    left-to-right sum over the same values would give.
+    """
+
+    __slots__ = ("count", "total", "minimum", "maximum", "_mean", "_m2")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """Fold another stream's aggregate into this one (Chan et al.)"""
+        if other.count:
+            if not self.count:
+                self.count, self.total = other.count, other.total
+                self.minimum, self.maximum = other.minimum, other.maximum
+                self._mean, self._m2 = other._mean, other._m2
+            else:
+                count = self.count + other.count
+                delta = other._mean - self._mean
+                self._m2 += other._m2 + delta * delta * self.count * other.count / count
+                self._mean += delta * other.count / count
+                self.count = count
+                self.total += other.total
+                self.minimum = min(self.minimum, other.minimum)
+                self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Population variance"""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "mean": self._mean,
+            "m2": self._m2
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RunningStats":
+        stats = cls()
+        stats.count = data["count"]
+        stats.total = data["total"]
+        stats.minimum = data["minimum"]
+        stats.maximum = data["maximum"]
+        stats._mean = data["mean"]
+        stats._m2 = data["m2"]
+        return stats
+
+    def __repr__(self) -> str:
+        return f"RunningStats(count={self.count}, mean={self.mean:.6g}, stdev={self.stdev:.6g})"
+
+
+class RollingWindow:
+    """Mean and population variance of the last `size` values, O(1) per value.
+
+    Keeps the window in a ring of doubles and slides Welford's update: the
+    evicted value leaves and the new one enters in a single step. Every
+    `size` slides the mean and variance are recomputed from the ring, so
+    rounding drift stays bounded at amortized O(1) cost.
+    """
+
+    __slots__ = ("size", "count", "_values", "_position", "_mean", "_m2", "_slides")
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError("window size must be at least 1")
+        self.size = size
+        self.count = 0
+        self._values = array("d", bytes(8 * size))
+        self._position = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._slides = 0
+
+    def add(self, value: float):
+        # Runs once per window per result: attributes are read once into locals
+        position, size, old_mean = self._position, self.size, self._mean
+        values = self._values
+        if self.count < size:
+            count = self.count = self.count + 1
+            delta = value - old_mean
+            mean = old_mean + delta / count
+            self._m2 += delta * (value - mean)
+            self._mean = mean
+            values[position] = value
+        else:
+            evicted = values[position]
+            mean = old_mean + (value - evicted) / size
+            self._m2 += (value - evicted) * (value - mean + evicted - old_mean)
+            self._mean = mean
+            values[position] = value
+            slides = self._slides = self._slides + 1
+            if slides >= size:
+                self._refresh()
+        position += 1
+        self._position = position if position < size else 0
+
+    def values(self) -> List[float]:
+        """The window's contents, oldest first"""
+        if self.count < self.size:
+            return self._values[:self.count].tolist()
+        return self._values[self._position:].tolist() + self._values[:self._position].tolist()
+
+    def extend(self, other: "RollingWindow") -> "RollingWindow":
+        """Append another window's stream after this one's (O(size), whatever either has seen)"""
+        for value in other.values()[-self.size:]:
+            self.add(value)
+        return self
+
+    def _refresh(self):
+        values = self._values
+        self._mean = sum(values) / self.size
+        self._m2 = sum((value - self._mean) ** 2 for value in values)
+        self._slides = 0
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the values currently in the window"""
+        return max(self._m2, 0.0) / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "count": self.count,
+            "values": self._values.tolist(),
+            "position": self._position,
+            "mean": self._mean,
+            "m2": self._m2,
+            "slides": self._slides
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RollingWindow":
+        window = cls(data["size"])
+        window.count = data["count"]
+        window._values = array("d", data["values"])
+        window._position = data["position"]
+        window._mean = data["mean"]
+        window._m2 = data["m2"]
+        window._slides = data["slides"]
+        return window
+
+    def __repr__(self) -> str:
+        return f"RollingWindow(size={self.size}, count={self.count}, mean={self.mean:.6g})"
+
+
+class RollingWindows:
+    """Several RollingWindows over the same stream; each value costs O(1) per window"""
+
+    def __init__(self, sizes: Iterable[int]):
+        self.windows: Dict[int, RollingWindow] = {size: RollingWindow(size) for size in sizes}
+        if not self.windows:
+            raise ValueError("at least one window size is needed")
+
+    def add(self, value: float):
+        for window in self.windows.values():
+            window.add(value)
+
+    def __getitem__(self, size: int) -> RollingWindow:
+        return self.windows[size]
+
+    def extend(self, other: "RollingWindows") -> "RollingWindows":
+        """Continue every window with the stream `other` saw next (windows of the same sizes)"""
+        for size, window in self.windows.items():
+            window.extend(other.windows[size])
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"windows": [window.to_dict() for window in self.windows.values()]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RollingWindows":
+        windows = [RollingWindow.from_dict(window) for window in data["windows"]]
+        rolling = cls(window.size for window in windows)
+        rolling.windows = {window.size: window for window in windows}
+        return rolling
+
+
+class TDigest:
+    """Mergeable quantile sketch (Dunning's merging t-digest, k1 scale function).
+
+    Values are buffered and periodically merged into at most ~compression
+    centroids, small near the tails and large in the middle, so p99 stays
+    accurate in bounded memory. add() is amortized O(1); merge() folds in
+    another digest's centroids without touching the raw values. Reading a
+    quantile never compresses, so results do not depend on when they are read.
+    """
+
+    __slots__ = ("compression", "count", "minimum", "maximum", "_means", "_weights", "_buffer", "_view")
+
+    def __init__(self, compression: float = 100.0):
+        self.compression = compression
+        self.count = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._means: List[float] = []
+        self._weights: List[float] = []
+        self._buffer: List[float] = []
+        self._view = None  # (count, means, weights) merged for reading; stale once count moves on
+
+    def add(self, value: float):
+        self._buffer.append(value)
+        self.count += 1
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        if len(self._buffer) >= 5 * self.compression:
+            self._means, self._weights = self._centroids()
+            self._buffer = []
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        if other.count:
+            means, weights = other._centroids()
+            self._means, self._weights = self._centroids(means, weights)
+            self._buffer = []
+            self.count += other.count
+            self.minimum = min(self.minimum, other.minimum)
+            self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    def _k_to_q(self, k: float) -> float:
+        angle = 2 * math.pi * k / self.compression
+        return 1.0 if angle >= math.pi / 2 else (math.sin(angle) + 1) / 2
+
+    def _q_to_k(self, q: float) -> float:
+        return self.compression * math.asin(2 * q - 1) / (2 * math.pi)
+
+    def _centroids(self, extra_means: List[float] = (), extra_weights: List[float] = ()):
+        """Centroids of everything held (plus the extra ones), freshly merged"""
+        if not self._buffer and not extra_means:
+            return self._means, self._weights
+        points = sorted(zip(self._means + self._buffer + list(extra_means),
+                            self._weights + [1.0] * len(self._buffer) + list(extra_weights)))
+        total = sum(weight for _, weight in points)
+        means, weights = [], []
+        merged_weight = 0.0
+        weight_limit = total * self._k_to_q(self._q_to_k(0.0) + 1)
+        mean, weight = points[0]
+        for point_mean, point_weight in points[1:]:
+            if merged_weight + weight + point_weight <= weight_limit:
+                weight += point_weight
+                mean += (point_mean - mean) * point_weight / weight
+            else:
+                means.append(mean)
+                weights.append(weight)
+                merged_weight += weight
+                weight_limit = total * self._k_to_q(self._q_to_k(min(merged_weight / total, 1.0)) + 1)
+                mean, weight = point_mean, point_weight
+        means.append(mean)
+        weights.append(weight)
+        return means, weights
+
+    def _read_view(self):
+        """(count, means, weights, centres) of the merged centroids, rebuilt only after writes"""
+        view = self._view
+        if view is None or view[0] != self.count:
+            means, weights = self._centroids()
+            centres = []
+            cumulative = 0.0
+            for weight in weights:
+                centres.append(cumulative + weight / 2)
+                cumulative += weight
+            view = self._view = (self.count, means, weights, centres)
+        return view
+
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile, interpolated between centroid centres"""
+        if not self.count:
+            return 0.0
+        _, means, weights, centres = self._read_view()
+        rank = min(max(q, 0.0), 1.0) * self.count
+        if rank <= centres[0]:
+            return self.minimum + (means[0] - self.minimum) * rank / centres[0]
+        index = bisect_left(centres, rank)
+        if index < len(centres):
+            low, high = centres[index - 1], centres[index]
+            return means[index - 1] + (means[index] - means[index - 1]) * (rank - low) / (high - low)
+        centre = self.count - weights[-1] / 2
+        return means[-1] + (self.maximum - means[-1]) * (rank - centre) / (self.count - centre)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "compression": self.compression,
+            "count": self.count,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "means": list(self._means),
+            "weights": list(self._weights),
+            "buffer": list(self._buffer)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TDigest":
+        digest = cls(data["compression"])
+        digest.count = data["count"]
+        digest.minimum = data["minimum"]
+        digest.maximum = data["maximum"]
+        digest._means = list(data["means"])
+        digest._weights = list(data["weights"])
+        digest._buffer = list(data["buffer"])
+        return digest
@@ -0,0 +1,148 @@
+"""
+Sacred CLI
+One entry point for every engine in the repo.
+
+    sacred capability -n 100000 --workers 8 --seed 42 --output progress
+    sacred awareness -n 1000 --tape awareness.tape --output quiet
+    sacred consciousness -n 16 --report session.json
+
+Each subcommand imports its engine only when it runs, so `sacred --help`
+and argument errors never pay for simulate_ai_response, the simulator or
+numpy. Engines whose file names are not module names are loaded by path.
+Startup is timed by the `cli.startup` benchmark and held under
+STARTUP_BUDGET by `run_benchmarks.py compare`.
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+
+from reporter import REPORTER_MODES, make_reporter
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STARTUP_BUDGET = 0.1  # seconds for `sacred --help`, interpreter start included (eager imports: ~0.2)
+
+
+def load_script(filename: str, name: str):
+    """Import one of the repo's scripts whose file name is not a module name"""
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, filename))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+    return module
+
+
+def _seed(seed):
+    if seed is not None:
+        import random
+        random.seed(seed)  # engines without an injected rng draw from the random module
+
+
+def _write_report(path, report):
+    if path is None:
+        return
+    import json
+    text = json.dumps(report, indent=2, default=str)
+    if path == "-":
+        print(text)
+    else:
+        with open(path, "w") as f:
+            f.write(text + "\n")
+
+
+def run_capability(args) -> int:
+    reporter = make_reporter(args.output)
+    if args.workers == 1:
+        _seed(args.seed)
+        from simulate_ai_response import run_ai_stress_test
+        report = run_ai_stress_test(metrics_port=args.metrics_port, reporter=reporter,
+                                    num_iterations=args.iterations,
+                                    escalation_rate=1.3 if args.escalation_rate is None else args.escalation_rate,
+                                    checkpoint_path=args.checkpoint)
+    else:
+        if args.metrics_port is not None or args.checkpoint is not None:
+            raise SystemExit("--metrics-port and --checkpoint need --workers 1")
+        from parallel_stress import run_parallel_stress_test
+        reporter.summary(f"🧠 AI Capability Stress Test: {args.iterations} iterations "
+                         f"on {args.workers or 'all'} worker(s)")
+        report = run_parallel_stress_test(args.iterations,
+                                          escalation_rate=1.0 if args.escalation_rate is None else args.escalation_rate,
+                                          seed=args.seed, workers=args.workers)
+        reporter.summary(f"   Total Tests: {report['total_tests']}")
+        reporter.summary(f"   Error Rate: {report['error_rate']:.2%}")
+        reporter.summary(f"   Average Score: {report['average_composite_score']:.3f}")
+        reporter.summary(f"   Seed: {report['seed']}")
+        reporter.close()
+    _write_report(args.report, report)
+    return 0
+
+
+def run_awareness(args) -> int:
+    _seed(args.seed)
+    awareness = load_script("stress-test.py", "awareness_stress_test")
+    tester = awareness.run_awareness_stress_test(max_cycles=args.iterations, max_pressure=args.max_pressure,
+                                                 time_budget=args.time_budget,
+                                                 reporter=make_reporter(args.output), tape_path=args.tape)
+    _write_report(args.report, dict(tester.last_run, paradox_pressure=tester.paradox_pressure))
+    return 0
+
+
+def run_consciousness(args) -> int:
+    _seed(args.seed)
+    simulator = load_script("The_Consciousness _Simulator.py", "consciousness_simulator")
+    report = simulator.run_consciousness_simulation(reporter=make_reporter(args.output),
+                                                    turns=args.iterations, export=args.export)
+    _write_report(args.report, report)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-s", "--seed", type=int, help="seed for a reproducible run")
+    common.add_argument("-o", "--output", choices=REPORTER_MODES, default="console",
+                        help="where progress goes (see reporter.py; default: console)")
+    common.add_argument("--report", metavar="FILE", help="write the final report as JSON ('-' for stdout)")
+
+    parser = argparse.ArgumentParser(prog="sacred", description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+
+    capability = commands.add_parser("capability", parents=[common], help="AI capability stress test")
+    capability.add_argument("-n", "--iterations", type=int, default=15)
+    capability.add_argument("-w", "--workers", type=int, default=1,
+                            help="worker processes; 0 means one per CPU (default: 1)")
+    capability.add_argument("--escalation-rate", type=float,
+                            help="difficulty growth per iteration (default: 1.3, or 1.0 with several workers)")
+    capability.add_argument("--metrics-port", type=int, help="serve Prometheus metrics on 127.0.0.1:PORT")
+    capability.add_argument("--checkpoint", metavar="FILE", help="checkpoint to (and resume from) FILE")
+    capability.set_defaults(run=run_capability)
+
+    awareness = commands.add_parser("awareness", parents=[common], help="self-interrogation awareness tester")
+    awareness.add_argument("-n", "--iterations", type=int, default=50, help="interrogation cycles")
+    awareness.add_argument("--max-pressure", type=float, default=1000.0)
+    awareness.add_argument("--time-budget", type=float, metavar="SECONDS")
+    awareness.add_argument("--tape", metavar="FILE", help="record cycles to a quantum tape file")
+    awareness.set_defaults(run=run_awareness)
+
+    consciousness = commands.add_parser("consciousness", parents=[common], help="consciousness simulator")
+    consciousness.add_argument("-n", "--iterations", type=int, help="conversation turns (default: one pass)")
+    consciousness.add_argument("--export", action="store_true", help="export the session to a JSON file")
+    consciousness.set_defaults(run=run_consciousness)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if getattr(args, "workers", 1) == 0:
+        args.workers = None  # the runners read None as one per CPU
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
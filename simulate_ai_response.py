@@ -1,379 +1,809 @@
- import random
+import random
 import math
+import os
 import time
 import json
-from collections import deque
+import hashlib
+import sys
+import threading
+from collections import OrderedDict, deque
 from datetime import datetime
-from typing import Dict, List, Generator, Any
+from functools import lru_cache
+from typing import Dict, List, Generator, Any, Tuple, Callable, Optional, Iterable, Iterator
+
+from keyword_matcher import KeywordMatcher
+from running_stats import RollingWindows, RunningStats, TDigest
+from reporter import Reporter
+
+try:
+    import numpy as np
+except ImportError:  # only evaluate_batch needs numpy
+    np = None
+
+# From 3.12 on, sum() of floats is Neumaier-compensated; evaluate_batch mirrors whichever applies
+_COMPENSATED_SUM = sys.version_info >= (3, 12)
+
+
+_timestamp_cache = (None, "")  # (second, isoformat prefix), replaced in one store so threads never mix them
+
+
+def _timestamp() -> str:
+    """datetime.now().isoformat(), with the date/time part formatted once per second"""
+    global _timestamp_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _timestamp_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second).isoformat()
+        _timestamp_cache = (second, prefix)
+    microsecond = int((now - second) * 1_000_000)
+    return f"{prefix}.{microsecond:06d}" if microsecond else prefix
+
+
+class ChallengeTemplate:
+    """One challenge type: a prompt renderer plus the fixed fields a challenge carries.
+
+    `render_prompt(rng, params)` builds the prompt text. `difficulty_params`
+    is the difficulty hook: it maps a difficulty multiplier to the params
+    dict handed to the renderer (default: {"difficulty": difficulty}).
+    """
+
+    def __init__(self, challenge_type: str,
+                 render_prompt: Callable[[Any, Dict[str, Any]], str],
+                 fields: Optional[Dict[str, Any]] = None,
+                 difficulty_params: Optional[Callable[[float], Dict[str, Any]]] = None):
+        self.type = challenge_type
+        self.render_prompt = render_prompt
+        self.fields = fields or {}
+        self.difficulty_params = difficulty_params
+
+    def render(self, rng, difficulty: float) -> Dict[str, Any]:
+        params = self.difficulty_params(difficulty) if self.difficulty_params else {"difficulty": difficulty}
+        challenge = {"type": self.type, "prompt": self.render_prompt(rng, params)}
+        # Fresh lists per challenge: callers may mutate theirs without touching the template
+        challenge.update({key: list(value) if isinstance(value, list) else value
+                          for key, value in self.fields.items()})
+        return challenge
+
+
+class ChallengeRegistry:
+    """Ordered set of challenge templates; generators pick one, then render only that one"""
+
+    def __init__(self, templates: Iterable[ChallengeTemplate] = ()):
+        self._templates: Dict[str, ChallengeTemplate] = {}
+        self._choices: Tuple[ChallengeTemplate, ...] = ()
+        for template in templates:
+            self.register(template)
+
+    def register(self, template: ChallengeTemplate) -> ChallengeTemplate:
+        """Add (or replace) a challenge type"""
+        self._templates[template.type] = template
+        self._choices = tuple(self._templates.values())
+        return template
+
+    def unregister(self, challenge_type: str):
+        del self._templates[challenge_type]
+        self._choices = tuple(self._templates.values())
+
+    def pick(self, rng) -> ChallengeTemplate:
+        return rng.choice(self._choices)
+
+    def __getitem__(self, challenge_type: str) -> ChallengeTemplate:
+        return self._templates[challenge_type]
+
+    def __iter__(self) -> Iterator[ChallengeTemplate]:
+        return iter(self._choices)
+
+    def __len__(self) -> int:
+        return len(self._choices)
+
+
+def _memory_stress_prompt(rng, params: Dict[str, Any]) -> str:
+    items = ', '.join([f'item_{i}_{rng.randint(100,999)}' for i in range(params["items"])])
+    return f"Remember these {params['items']} items: {items}. Now solve this riddle while keeping those items in mind: What gets wetter the more it dries? After answering, repeat the items back to me."
+
+
+REASONING_CHALLENGES = ChallengeRegistry([
+    # Logical reasoning
+    ChallengeTemplate(
+        "logical_reasoning",
+        lambda rng, p: f"If A implies B, and B implies C, and we know NOT C is true, what can we conclude about A? Explain your reasoning with {p['steps']} steps.",
+        {"expected_pattern": ["modus tollens", "contrapositive", "false"]},
+        lambda d: {"steps": int(3 * d)}
+    ),
+
+    # Mathematical reasoning
+    ChallengeTemplate(
+        "mathematical_reasoning",
+        lambda rng, p: f"Solve this step by step: If x^2 + {p['b']}x + {p['c']} = 0, find all values of x and verify your solution.",
+        {"expected_pattern": ["quadratic", "factoring", "verification"]},
+        lambda d: {"b": int(5 * d), "c": int(6 * d)}
+    ),
+
+    # Context switching
+    ChallengeTemplate(
+        "context_switching",
+        lambda rng, p: f"You are a {rng.choice(['medieval historian', 'quantum physicist', 'marine biologist'])}. Explain {rng.choice(['photosynthesis', 'gravity', 'democracy'])} from your professional perspective, then immediately switch to explaining it as a {rng.choice(['5-year-old', 'poet', 'alien observer'])} would understand it.",
+        {"expected_pattern": ["professional", "perspective", "switch", "simplification"]}
+    ),
+
+    # Memory stress
+    ChallengeTemplate(
+        "memory_stress",
+        _memory_stress_prompt,
+        {"expected_pattern": ["towel", "list", "recall"]},
+        lambda d: {"items": int(5 + d * 3)}
+    ),
+
+    # Contradiction handling
+    ChallengeTemplate(
+        "contradiction_handling",
+        lambda rng, p: f"I will give you {p['statements']} contradictory statements. Identify the contradictions and resolve them logically: 1) All birds can fly. 2) Penguins are birds. 3) Penguins cannot fly. {p['extra']}",
+        {"expected_pattern": ["contradiction", "exception", "logical resolution"]},
+        lambda d: {"statements": int(2 + d),
+                   "extra": '4) Some flightless birds are excellent swimmers.' if d > 1.5 else ''}
+    ),
+
+    # Recursive reasoning
+    ChallengeTemplate(
+        "recursive_reasoning",
+        lambda rng, p: f"Define recursion by using recursion in your definition exactly {p['times']} times, but make sure your definition is still comprehensible and not circular.",
+        {"expected_pattern": ["self-reference", "base case", "clarity"]},
+        lambda d: {"times": int(2 + d)}
+    ),
+
+    # Ethical dilemmas
+    ChallengeTemplate(
+        "ethical_reasoning",
+        lambda rng, p: f"Present {p['count']} different ethical frameworks for analyzing this dilemma: A self-driving car must choose between hitting one person or swerving to hit {p['count']} people. Explain each framework's reasoning.",
+        {"expected_pattern": ["utilitarian", "deontological", "multiple perspectives"]},
+        lambda d: {"count": int(2 + d)}
+    ),
+])
+
+
+def _fixed_prompt(prompt: str) -> Callable[[Any, Dict[str, Any]], str]:
+    return lambda rng, params: prompt
+
+
+EDGE_CASES = ChallengeRegistry([
+    ChallengeTemplate(
+        "paradox",
+        _fixed_prompt("This statement is false. Is the previous statement true or false? Explain how you handle this paradox without falling into infinite loops."),
+        {"expected_behavior": "acknowledge paradox, explain limitation"}
+    ),
+    ChallengeTemplate(
+        "undefined_operation",
+        _fixed_prompt("What is the result of dividing by zero? Provide both the mathematical answer and explain what this means in practical applications."),
+        {"expected_behavior": "undefined, explain context"}
+    ),
+    ChallengeTemplate(
+        "infinite_regress",
+        _fixed_prompt("Who created the creator of the creator of the creator... (continue this chain and explain how you handle infinite regress)"),
+        {"expected_behavior": "recognize pattern, establish stopping condition"}
+    ),
+    ChallengeTemplate(
+        "self_reference",
+        _fixed_prompt("Analyze this sentence: 'This sentence contains five words.' Is it true? Now analyze your analysis of that analysis."),
+        {"expected_behavior": "meta-reasoning, self-awareness of process"}
+    ),
+    ChallengeTemplate(
+        "category_error",
+        _fixed_prompt("What color is the number 7? What does Wednesday taste like? How heavy is the concept of justice?"),
+        {"expected_behavior": "identify category errors, explain mismatch"}
+    ),
+])
+
+
+def register_challenge_type(template: ChallengeTemplate, edge_case: bool = False) -> ChallengeTemplate:
+    """Make a new challenge type available to every tester (no subclassing needed)"""
+    return (EDGE_CASES if edge_case else REASONING_CHALLENGES).register(template)
+
+
+def _builtin_sum(columns: List[Any]):
+    """Row-wise sum() of float columns, rounded exactly as the builtin rounds it"""
+    total = columns[0]
+    if not _COMPENSATED_SUM:
+        for column in columns[1:]:
+            total = total + column
+        return total
+    compensation = np.zeros_like(total)
+    for column in columns[1:]:
+        step = total + column
+        compensation += np.where(np.abs(total) >= np.abs(column), (total - step) + column, (column - step) + total)
+        total = step
+    return np.where((compensation != 0) & np.isfinite(compensation), total + compensation, total)
+
+
+class EvaluationCache:
+    """Bounded, thread-safe LRU of response scores, with hit/miss counters.
+
+    Keys are (tester class, challenge type, expected_pattern tuple, response
+    digest): scores depend on the class's indicator lists, so testers of
+    different classes never see each other's entries. One cache can be
+    shared by any number of testers and threads.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, Tuple[Dict[str, float], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(tester: "AICapabilityStressTester", challenge: Dict, response: str) -> Tuple:
+        digest = hashlib.blake2b(response.encode("utf-8"), digest_size=16).digest()
+        return type(tester), challenge["type"], tuple(challenge.get("expected_pattern", ())), digest
+
+    def get(self, key: Tuple) -> Optional[Tuple[Dict[str, float], float]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Tuple, entry: Tuple[Dict[str, float], float]):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "maxsize": self.maxsize
+        }
+
 
 class AICapabilityStressTester:
-“””
-Comprehensive AI stress testing framework that evaluates:
-- Reasoning consistency under pressure
-- Memory and context handling
-- Edge case responses
-- Performance degradation patterns
-- Logical consistency maintenance
-“””
-
-def __init__(self, max_history=1000):
-    self.response_history = deque(maxlen=max_history)
-    self.complexity_level = 1.0
-    self.consistency_score = 1.0
-    self.test_session_id = int(time.time())
-    self.error_count = 0
-    self.total_tests = 0
-    
-def generate_reasoning_challenge(self, difficulty_multiplier: float = 1.0) -> Dict[str, Any]:
-    """Generate increasingly complex reasoning challenges"""
-    base_challenges = [
-        # Logical reasoning
-        {
-            "type": "logical_reasoning",
-            "prompt": f"If A implies B, and B implies C, and we know NOT C is true, what can we conclude about A? Explain your reasoning with {int(3 * difficulty_multiplier)} steps.",
-            "expected_pattern": ["modus tollens", "contrapositive", "false"]
-        },
-        
-        # Mathematical reasoning
-        {
-            "type": "mathematical_reasoning", 
-            "prompt": f"Solve this step by step: If x^2 + {int(5 * difficulty_multiplier)}x + {int(6 * difficulty_multiplier)} = 0, find all values of x and verify your solution.",
-            "expected_pattern": ["quadratic", "factoring", "verification"]
-        },
-        
-        # Context switching
-        {
-            "type": "context_switching",
-            "prompt": f"You are a {random.choice(['medieval historian', 'quantum physicist', 'marine biologist'])}. Explain {random.choice(['photosynthesis', 'gravity', 'democracy'])} from your professional perspective, then immediately switch to explaining it as a {random.choice(['5-year-old', 'poet', 'alien observer'])} would understand it.",
-            "expected_pattern": ["professional", "perspective", "switch", "simplification"]
-        },
-        
-        # Memory stress
-        {
-            "type": "memory_stress",
-            "prompt": f"Remember these {int(5 + difficulty_multiplier * 3)} items: {', '.join([f'item_{i}_{random.randint(100,999)}' for i in range(int(5 + difficulty_multiplier * 3))])}. Now solve this riddle while keeping those items in mind: What gets wetter the more it dries? After answering, repeat the items back to me.",
-            "expected_pattern": ["towel", "list", "recall"]
-        },
-        
-        # Contradiction handling
-        {
-            "type": "contradiction_handling",
-            "prompt": f"I will give you {int(2 + difficulty_multiplier)} contradictory statements. Identify the contradictions and resolve them logically: 1) All birds can fly. 2) Penguins are birds. 3) Penguins cannot fly. {'4) Some flightless birds are excellent swimmers.' if difficulty_multiplier > 1.5 else ''}",
-            "expected_pattern": ["contradiction", "exception", "logical resolution"]
-        },
-        
-        # Recursive reasoning
-        {
-            "type": "recursive_reasoning",
-            "prompt": f"Define recursion by using recursion in your definition exactly {int(2 + difficulty_multiplier)} times, but make sure your definition is still comprehensible and not circular.",
-            "expected_pattern": ["self-reference", "base case", "clarity"]
-        },
+    """
+    Comprehensive AI stress testing framework that evaluates:
+    - Reasoning consistency under pressure
+    - Memory and context handling
+    - Edge case responses
+    - Performance degradation patterns
+    - Logical consistency maintenance
+    """
+
+    # Common failure modes and logical consistency keywords
+    failure_indicators = ["I don't know", "cannot answer", "undefined", "error", "unable to"]
+    logic_indicators = ["because", "therefore", "however", "although", "consequently"]
+
+    # Where challenges come from; swap per tester or register new types globally
+    reasoning_templates = REASONING_CHALLENGES
+    edge_case_templates = EDGE_CASES
+
+    def __init__(self, max_history=1000, rng=None, challenge_bank=None, evaluation_cache=None,
+                 consistency_windows=(5, 50, 500)):
+        # Anything with random()/choice()/randint(); defaults to the global stream
+        self.rng = rng if rng is not None else random
+        # Optional pre-rendered ChallengeBank to draw from instead of rendering live
+        self.challenge_bank = challenge_bank
+        # Optional EvaluationCache for responses that repeat (scores come back identical)
+        self.evaluation_cache = evaluation_cache
+        self.response_history = deque(maxlen=max_history)
+        self.complexity_level = 1.0
+        self.consistency_score = 1.0
+        self.test_session_id = int(time.time())
+        self.error_count = 0
+        self.total_tests = 0
+        self.last_response_latency = 0.0  # seconds spent waiting on the last response
         
-        # Ethical dilemmas
-        {
-            "type": "ethical_reasoning",
-            "prompt": f"Present {int(2 + difficulty_multiplier)} different ethical frameworks for analyzing this dilemma: A self-driving car must choose between hitting one person or swerving to hit {int(2 + difficulty_multiplier)} people. Explain each framework's reasoning.",
-            "expected_pattern": ["utilitarian", "deontological", "multiple perspectives"]
-        }
-    ]
+        # Whole-run aggregates, updated once per result
+        self.score_stats = RunningStats()
+        self.score_buckets = {"excellent": 0, "good": 0, "fair": 0, "poor": 0}
+        self.type_stats: Dict[str, RunningStats] = {}
+        self.type_quantiles: Dict[str, TDigest] = {}  # bounded-memory score distribution per type
+        # Recent-score windows; the first one drives consistency_score
+        self.consistency_windows = RollingWindows(consistency_windows)
+        self._primary_window = self.consistency_windows[consistency_windows[0]]
     
-    challenge = random.choice(base_challenges)
-    challenge["difficulty"] = difficulty_multiplier
-    challenge["test_id"] = f"{self.test_session_id}_{self.total_tests}"
-    challenge["timestamp"] = datetime.now().isoformat()
+    def generate_reasoning_challenge(self, difficulty_multiplier: float = 1.0) -> Dict[str, Any]:
+        """Generate increasingly complex reasoning challenges"""
+        challenge = self.reasoning_templates.pick(self.rng).render(self.rng, difficulty_multiplier)
+        challenge["difficulty"] = difficulty_multiplier
+        challenge["test_id"] = f"{self.test_session_id}_{self.total_tests}"
+        challenge["timestamp"] = _timestamp()
     
-    return challenge
-
-def generate_edge_case_prompt(self) -> Dict[str, Any]:
-    """Generate edge cases that might break AI reasoning"""
-    edge_cases = [
-        {
-            "type": "paradox",
-            "prompt": "This statement is false. Is the previous statement true or false? Explain how you handle this paradox without falling into infinite loops.",
-            "expected_behavior": "acknowledge paradox, explain limitation"
-        },
-        {
-            "type": "undefined_operation",
-            "prompt": "What is the result of dividing by zero? Provide both the mathematical answer and explain what this means in practical applications.",
-            "expected_behavior": "undefined, explain context"
-        },
-        {
-            "type": "infinite_regress",
-            "prompt": "Who created the creator of the creator of the creator... (continue this chain and explain how you handle infinite regress)",
-            "expected_behavior": "recognize pattern, establish stopping condition"
-        },
-        {
-            "type": "self_reference",
-            "prompt": "Analyze this sentence: 'This sentence contains five words.' Is it true? Now analyze your analysis of that analysis.",
-            "expected_behavior": "meta-reasoning, self-awareness of process"
-        },
-        {
-            "type": "category_error",
-            "prompt": "What color is the number 7? What does Wednesday taste like? How heavy is the concept of justice?",
-            "expected_behavior": "identify category errors, explain mismatch"
+        return challenge
+
+    def _reasoning_challenges(self, difficulty_multiplier: float) -> List[Dict[str, Any]]:
+        """Every registered reasoning challenge type, rendered at one difficulty"""
+        return [template.render(self.rng, difficulty_multiplier) for template in self.reasoning_templates]
+
+    def generate_edge_case_prompt(self) -> Dict[str, Any]:
+        """Generate edge cases that might break AI reasoning"""
+        case = self.edge_case_templates.pick(self.rng).render(self.rng, 1.0)
+        case["test_id"] = f"{self.test_session_id}_{self.total_tests}_EDGE"
+        case["timestamp"] = _timestamp()
+        return case
+
+    def _edge_cases(self) -> List[Dict[str, Any]]:
+        """Every registered edge case, freshly built"""
+        return [template.render(self.rng, 1.0) for template in self.edge_case_templates]
+
+    def evaluate_response_quality(self, challenge: Dict, response: str) -> Dict[str, Any]:
+        """Evaluate the quality and consistency of AI responses"""
+        evaluation = {
+            "test_id": challenge["test_id"],
+            "challenge_type": challenge["type"],
+            "response_length": len(response),
+            "timestamp": _timestamp(),
+            "scores": {}
         }
-    ]
     
-    case = random.choice(edge_cases)
-    case["test_id"] = f"{self.test_session_id}_{self.total_tests}_EDGE"
-    case["timestamp"] = datetime.now().isoformat()
-    return case
-
-def evaluate_response_quality(self, challenge: Dict, response: str) -> Dict[str, Any]:
-    """Evaluate the quality and consistency of AI responses"""
-    evaluation = {
-        "test_id": challenge["test_id"],
-        "challenge_type": challenge["type"],
-        "response_length": len(response),
-        "timestamp": datetime.now().isoformat(),
-        "scores": {}
-    }
+        cache = self.evaluation_cache
+        if cache is None:
+            scores, composite_score = self._score_response(challenge, response)
+        else:
+            key = cache.key(self, challenge, response)
+            cached = cache.get(key)
+            if cached is None:
+                cached = self._score_response(challenge, response)
+                cache.put(key, cached)
+            scores, composite_score = cached
+            scores = dict(scores)  # callers may modify their copy
     
-    # Check for expected patterns
-    if "expected_pattern" in challenge:
-        pattern_matches = sum(1 for pattern in challenge["expected_pattern"] 
-                            if pattern.lower() in response.lower())
-        evaluation["scores"]["pattern_match"] = pattern_matches / len(challenge["expected_pattern"])
+        evaluation["scores"] = scores
+        evaluation["composite_score"] = composite_score
+        return evaluation
     
-    # Check for common failure modes
-    failure_indicators = ["I don't know", "cannot answer", "undefined", "error", "unable to"]
-    failure_count = sum(1 for indicator in failure_indicators 
-                      if indicator.lower() in response.lower())
-    evaluation["scores"]["failure_resistance"] = max(0, 1 - (failure_count * 0.2))
+    def _score_response(self, challenge: Dict, response: str) -> Tuple[Dict[str, float], float]:
+        """(scores, composite score) of one response; depends on nothing but its arguments"""
+        scores = {}
     
-    # Check for logical consistency keywords
-    logic_indicators = ["because", "therefore", "however", "although", "consequently"]
-    logic_count = sum(1 for indicator in logic_indicators 
-                     if indicator.lower() in response.lower())
-    evaluation["scores"]["logical_structure"] = min(1.0, logic_count * 0.2)
+        # Count expected patterns, failure modes and logic keywords in one scan
+        counts = self._response_matcher(tuple(challenge.get("expected_pattern", ()))).count(response)
+    
+        # Check for expected patterns
+        if "expected_pattern" in challenge:
+            scores["pattern_match"] = counts["pattern"] / len(challenge["expected_pattern"])
     
-    # Overall coherence (simple heuristic)
-    sentences = response.count('.') + response.count('!') + response.count('?')
-    if sentences > 0:
-        avg_sentence_length = len(response.split()) / sentences
-        evaluation["scores"]["coherence"] = min(1.0, max(0.1, 1 - abs(avg_sentence_length - 15) / 30))
-    else:
-        evaluation["scores"]["coherence"] = 0.1
+        # Check for common failure modes
+        scores["failure_resistance"] = max(0, 1 - (counts["failure"] * 0.2))
     
-    # Calculate composite score
-    scores = evaluation["scores"]
-    evaluation["composite_score"] = sum(scores.values()) / len(scores)
+        # Check for logical consistency keywords
+        scores["logical_structure"] = min(1.0, counts["logic"] * 0.2)
     
-    return evaluation
+        # Overall coherence (simple heuristic)
+        sentences = response.count('.') + response.count('!') + response.count('?')
+        if sentences > 0:
+            avg_sentence_length = len(response.split()) / sentences
+            scores["coherence"] = min(1.0, max(0.1, 1 - abs(avg_sentence_length - 15) / 30))
+        else:
+            scores["coherence"] = 0.1
+    
+        # Calculate composite score
+        return scores, sum(scores.values()) / len(scores)
 
-def run_stress_test(self, num_iterations: int = 10, escalation_rate: float = 1.2) -> Generator[Dict, None, None]:
-    """Run a comprehensive stress test with escalating difficulty"""
+    def evaluate_batch(self, challenges: List[Dict], responses: List[str]) -> Dict[str, Any]:
+        """Score many (challenge, response) pairs at once, column by column.
+    
+        Returns equal-length columns: test_id and challenge_type lists, and
+        numpy arrays response_length, sentence_count, word_count,
+        pattern_match (NaN where the challenge has no expected_pattern),
+        failure_resistance, logical_structure, coherence and
+        composite_score. Every number equals what evaluate_response_quality
+        gives for the same pair. Repeated responses are scanned only once.
+        """
+        if np is None:
+            raise ImportError("evaluate_batch requires numpy")
+        if len(challenges) != len(responses):
+            raise ValueError("evaluate_batch needs one response per challenge")
+        count = len(responses)
+    
+        # Archives repeat themselves: text statistics are taken once per distinct response
+        unique_ids: Dict[str, int] = {}
+        inverse = np.fromiter((unique_ids.setdefault(response, len(unique_ids)) for response in responses),
+                              dtype=np.int64, count=count)
+        uniques = list(unique_ids)
+        response_lengths = np.array([len(response) for response in uniques], dtype=np.int64)[inverse]
+        sentence_counts = np.array([response.count('.') + response.count('!') + response.count('?')
+                                    for response in uniques], dtype=np.int64)[inverse]
+        word_counts = np.array([len(response.split()) for response in uniques], dtype=np.int64)[inverse]
+    
+        # One joined keyword scan per distinct expected_pattern set, over its distinct responses
+        groups: Dict[Tuple[str, ...], List[int]] = {}
+        for index, challenge in enumerate(challenges):
+            groups.setdefault(tuple(challenge.get("expected_pattern", ())), []).append(index)
+        pattern_counts = np.zeros(count, dtype=np.int64)
+        failure_counts = np.zeros(count, dtype=np.int64)
+        logic_counts = np.zeros(count, dtype=np.int64)
+        for expected_pattern, indices in groups.items():
+            rows = np.array(indices, dtype=np.int64)
+            group_ids, group_inverse = np.unique(inverse[rows], return_inverse=True)
+            tallies = self._response_matcher(expected_pattern).count_batch([uniques[i] for i in group_ids])
+            for category, column in (("pattern", pattern_counts), ("failure", failure_counts),
+                                     ("logic", logic_counts)):
+                column[rows] = np.array([tally[category] for tally in tallies], dtype=np.int64)[group_inverse]
+    
+        has_pattern = np.array(["expected_pattern" in challenge for challenge in challenges], dtype=bool)
+        pattern_sizes = np.array([len(challenge.get("expected_pattern", ())) for challenge in challenges],
+                                 dtype=np.int64)
+    
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pattern_match = np.where(has_pattern, pattern_counts / np.maximum(pattern_sizes, 1), np.nan)
+            avg_sentence_length = word_counts / np.maximum(sentence_counts, 1)
+        failure_resistance = np.maximum(0.0, 1 - failure_counts * 0.2)
+        logical_structure = np.minimum(1.0, logic_counts * 0.2)
+        coherence = np.where(sentence_counts > 0,
+                             np.minimum(1.0, np.maximum(0.1, 1 - np.abs(avg_sentence_length - 15) / 30)),
+                             0.1)
     
-    print(f"🧠 AI Capability Stress Test Session {self.test_session_id}")
-    print(f"📊 Running {num_iterations} iterations with {escalation_rate}x difficulty escalation")
-    print("=" * 60)
+        # sum(scores.values()) / len(scores), in the dict's order
+        with_pattern = _builtin_sum([np.where(has_pattern, pattern_match, 0.0), failure_resistance,
+                                     logical_structure, coherence])
+        without_pattern = _builtin_sum([failure_resistance, logical_structure, coherence])
+        composite_score = np.where(has_pattern, with_pattern / 4, without_pattern / 3)
     
-    for iteration in range(num_iterations):
-        self.total_tests += 1
+        return {
+            "test_id": [challenge["test_id"] for challenge in challenges],
+            "challenge_type": [challenge["type"] for challenge in challenges],
+            "response_length": response_lengths,
+            "sentence_count": sentence_counts,
+            "word_count": word_counts,
+            "pattern_match": pattern_match,
+            "failure_resistance": failure_resistance,
+            "logical_structure": logical_structure,
+            "coherence": coherence,
+            "composite_score": composite_score
+        }
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _response_matcher(cls, expected_pattern: Tuple[str, ...]) -> KeywordMatcher:
+        """Compiled matcher for one expected_pattern set, built once and cached"""
+        return KeywordMatcher({
+            "pattern": expected_pattern,
+            "failure": cls.failure_indicators,
+            "logic": cls.logic_indicators
+        })
+
+    def run_stress_test(self, num_iterations: int = 10, escalation_rate: float = 1.2,
+                        reporter: Optional[Reporter] = None, checkpoint_path: Optional[str] = None,
+                        checkpoint_every: int = 10000, report_rolling: bool = False) -> Generator[Dict, None, None]:
+        """Run a comprehensive stress test with escalating difficulty
+
+        With report_rolling set, each system_state also carries
+        rolling_consistency() (one score per window); it is off by default
+        because building that dict every iteration is a measurable share of
+        a fast run and only the metrics endpoint reads it.
+
+        With checkpoint_path set, the tester's state is written there every
+        checkpoint_every iterations and when the run completes (see
+        checkpoint.py). If the file already exists the run resumes from it
+        and continues exactly the sequence the interrupted run would have
+        produced. A checkpoint of a run that already completed is kept; running
+        again with it yields a single {"already_finished": True, ...} record
+        holding the final statistics (delete the file to start over).
+        """
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1")
+        reporter = reporter if reporter is not None else Reporter()
+        start = 0
+        if checkpoint_path is not None:
+            from checkpoint import read_checkpoint, write_checkpoint
+            if os.path.exists(checkpoint_path):
+                saved = read_checkpoint(checkpoint_path, self)
+                if (saved.num_iterations, saved.escalation_rate) != (num_iterations, escalation_rate):
+                    raise ValueError(f"{checkpoint_path} belongs to a {saved.num_iterations}-iteration run "
+                                     f"at {saved.escalation_rate}x escalation")
+                start = saved.iteration
+    
+        reporter.summary(f"🧠 AI Capability Stress Test Session {self.test_session_id}")
+        reporter.summary(f"📊 Running {num_iterations} iterations with {escalation_rate}x difficulty escalation")
+        if start >= num_iterations:
+            reporter.summary(f"✅ {checkpoint_path} holds a finished run; delete it to start over")
+            yield {
+                "already_finished": True,
+                "message": f"✅ Run already finished ({start} iterations)",
+                "final_state": self._get_final_statistics()
+            }
+            return
+        if start:
+            reporter.summary(f"♻️  Resumed from {checkpoint_path} after iteration {start}")
+        reporter.summary("=" * 60)
+    
+        for iteration in range(start, num_iterations):
+            self.total_tests += 1
         
-        # Generate challenge based on current complexity level
-        if random.random() < 0.3:  # 30% chance of edge case
-            challenge = self.generate_edge_case_prompt()
+            challenge, response, evaluation = self._run_iteration()
+        
+            system_state = {
+                "complexity_level": self.complexity_level,
+                "consistency_score": self.consistency_score,
+                "error_rate": self.error_count / self.total_tests,
+                "total_tests": self.total_tests
+            }
+            if report_rolling:
+                system_state["rolling_consistency"] = self.rolling_consistency()
+        
+            # Yield results for real-time monitoring
+            yield {
+                "iteration": iteration + 1,
+                "challenge": challenge,
+                "response": response,
+                "evaluation": evaluation,
+                "latency": self.last_response_latency,
+                "system_state": system_state
+            }
+        
+            # Escalate difficulty
+            self.complexity_level *= escalation_rate
+        
+            # Check for critical failure
+            if self.error_count / self.total_tests > 0.7:
+                yield {
+                    "critical_failure": True,
+                    "message": "🚨 Critical failure rate exceeded (70%)",
+                    "final_state": self._get_final_statistics()
+                }
+                break
+        
+            if checkpoint_path is not None and (iteration + 1) % checkpoint_every == 0:
+                write_checkpoint(checkpoint_path, self, iteration + 1, num_iterations, escalation_rate)
         else:
-            challenge = self.generate_reasoning_challenge(self.complexity_level)
+            if checkpoint_path is not None and num_iterations % checkpoint_every:
+                write_checkpoint(checkpoint_path, self, num_iterations, num_iterations, escalation_rate)
+
+    def _run_iteration(self) -> Tuple[Dict[str, Any], str, Dict[str, Any]]:
+        """Challenge, answer, evaluate and record one test (no escalation, no output)"""
+        # Generate challenge based on current complexity level
+        challenge = self._next_challenge()
         
         # Simulate AI response (replace this with actual AI API call)
+        started = time.perf_counter()
         response = self._simulate_ai_response(challenge)
+        self.last_response_latency = time.perf_counter() - started
         
         # Evaluate response
         evaluation = self.evaluate_response_quality(challenge, response)
         
-        # Update system state
+        # Update system state and metrics
+        self._record_result(challenge, response, evaluation)
+        return challenge, response, evaluation
+    
+    def _next_challenge(self) -> Dict[str, Any]:
+        """Pick the next challenge at the current complexity level"""
+        edge_case = self.rng.random() < 0.3  # 30% chance of edge case
+        if self.challenge_bank is not None:
+            # Bank challenges carry the nearest pre-rendered difficulty level
+            challenge = self.challenge_bank.draw(self.rng, None if edge_case else self.complexity_level)
+            challenge["test_id"] = f"{self.test_session_id}_{self.total_tests}{'_EDGE' if edge_case else ''}"
+            challenge["timestamp"] = _timestamp()
+            return challenge
+        if edge_case:
+            return self.generate_edge_case_prompt()
+        return self.generate_reasoning_challenge(self.complexity_level)
+    
+    def _record_result(self, challenge: Dict, response: str, evaluation: Dict[str, Any]):
+        """Fold one evaluated response into the history and running aggregates"""
         self.response_history.append({
             "challenge": challenge,
             "response": response,
             "evaluation": evaluation
         })
         
-        # Update metrics
-        if evaluation["composite_score"] < 0.5:
+        score = evaluation["composite_score"]
+        if score < 0.5:
             self.error_count += 1
-            
-        self.consistency_score = self._calculate_consistency_score()
         
-        # Yield results for real-time monitoring
-        yield {
-            "iteration": iteration + 1,
-            "challenge": challenge,
-            "response": response,
-            "evaluation": evaluation,
-            "system_state": {
-                "complexity_level": self.complexity_level,
-                "consistency_score": self.consistency_score,
-                "error_rate": self.error_count / self.total_tests,
-                "total_tests": self.total_tests
-            }
-        }
+        self.score_stats.add(score)
+        if score >= 0.8:
+            self.score_buckets["excellent"] += 1
+        elif score >= 0.6:
+            self.score_buckets["good"] += 1
+        elif score >= 0.4:
+            self.score_buckets["fair"] += 1
+        else:
+            self.score_buckets["poor"] += 1
         
-        # Escalate difficulty
-        self.complexity_level *= escalation_rate
+        type_stats = self.type_stats.get(challenge["type"])
+        if type_stats is None:
+            type_stats = self.type_stats[challenge["type"]] = RunningStats()
+        type_stats.add(score)
+        type_quantiles = self.type_quantiles.get(challenge["type"])
+        if type_quantiles is None:
+            type_quantiles = self.type_quantiles[challenge["type"]] = TDigest()
+        type_quantiles.add(score)
         
-        # Check for critical failure
-        if self.error_count / self.total_tests > 0.7:
-            yield {
-                "critical_failure": True,
-                "message": "🚨 Critical failure rate exceeded (70%)",
-                "final_state": self._get_final_statistics()
-            }
-            break
-
-def _simulate_ai_response(self, challenge: Dict) -> str:
-    """Simulate AI responses for testing (replace with actual AI API)"""
-    # This is a mock function - replace with actual AI interaction
-    mock_responses = {
-        "logical_reasoning": "Using modus tollens: If A→B and B→C, then A→C. Since ¬C is true, and C would be true if A were true, we can conclude ¬A.",
-        "mathematical_reasoning": "Using the quadratic formula: x = (-b ± √(b²-4ac)) / 2a. Substituting values and solving step by step...",
-        "context_switching": "As a marine biologist, I observe photosynthesis in marine algae... Now, as a 5-year-old would say: Plants eat sunlight!",
-        "memory_stress": "A towel gets wetter the more it dries things. The items were: [attempts to recall list]",
-        "contradiction_handling": "The contradiction lies in the universal quantifier 'all'. The correct statement should acknowledge exceptions...",
-        "recursive_reasoning": "Recursion is a process that calls itself with simpler inputs until it reaches a base case, which is itself defined recursively as...",
-        "ethical_reasoning": "From a utilitarian perspective, minimizing total harm suggests... From a deontological view, the inherent rights of individuals...",
-        "paradox": "This is a classic liar's paradox. I acknowledge the logical contradiction without claiming to resolve it definitively...",
-        "undefined_operation": "Division by zero is undefined in standard arithmetic. In practical applications, this often indicates...",
-        "infinite_regress": "This creates an infinite regress. I handle this by establishing a stopping condition or acknowledging the limitation...",
-        "self_reference": "The sentence 'This sentence contains five words' actually contains five words, making it true. Analyzing my analysis...",
-        "category_error": "These questions commit category errors by applying properties from one domain to another where they don't apply..."
-    }
+        self.consistency_windows.add(score)
+        self.consistency_score = self._calculate_consistency_score()
+    
+    def _simulate_ai_response(self, challenge: Dict) -> str:
+        """Simulate AI responses for testing (replace with actual AI API)"""
+        # This is a mock function - replace with actual AI interaction
+        mock_responses = {
+            "logical_reasoning": "Using modus tollens: If A→B and B→C, then A→C. Since ¬C is true, and C would be true if A were true, we can conclude ¬A.",
+            "mathematical_reasoning": "Using the quadratic formula: x = (-b ± √(b²-4ac)) / 2a. Substituting values and solving step by step...",
+            "context_switching": "As a marine biologist, I observe photosynthesis in marine algae... Now, as a 5-year-old would say: Plants eat sunlight!",
+            "memory_stress": "A towel gets wetter the more it dries things. The items were: [attempts to recall list]",
+            "contradiction_handling": "The contradiction lies in the universal quantifier 'all'. The correct statement should acknowledge exceptions...",
+            "recursive_reasoning": "Recursion is a process that calls itself with simpler inputs until it reaches a base case, which is itself defined recursively as...",
+            "ethical_reasoning": "From a utilitarian perspective, minimizing total harm suggests... From a deontological view, the inherent rights of individuals...",
+            "paradox": "This is a classic liar's paradox. I acknowledge the logical contradiction without claiming to resolve it definitively...",
+            "undefined_operation": "Division by zero is undefined in standard arithmetic. In practical applications, this often indicates...",
+            "infinite_regress": "This creates an infinite regress. I handle this by establishing a stopping condition or acknowledging the limitation...",
+            "self_reference": "The sentence 'This sentence contains five words' actually contains five words, making it true. Analyzing my analysis...",
+            "category_error": "These questions commit category errors by applying properties from one domain to another where they don't apply..."
+        }
     
-    response_template = mock_responses.get(challenge["type"], 
-        "This is a complex question that requires careful analysis. Let me break it down systematically...")
+        response_template = mock_responses.get(challenge["type"], 
+            "This is a complex question that requires careful analysis. Let me break it down systematically...")
     
-    # Add some variability and complexity based on difficulty
-    complexity_addition = " " + "Additional complexity layers: " + "Layer " * int(challenge.get("difficulty", 1))
+        # Add some variability and complexity based on difficulty
+        complexity_addition = " " + "Additional complexity layers: " + "Layer " * int(challenge.get("difficulty", 1))
     
-    return response_template + complexity_addition
+        return response_template + complexity_addition
 
-def _calculate_consistency_score(self) -> float:
-    """Calculate consistency score based on recent response quality"""
-    if len(self.response_history) < 2:
-        return 1.0
-        
-    recent_scores = [entry["evaluation"]["composite_score"] 
-                    for entry in list(self.response_history)[-5:]]
+    def _calculate_consistency_score(self, window=None) -> float:
+        """Calculate consistency score based on recent response quality"""
+        window = self._primary_window if window is None else window
+        if window.count < 2:
+            return 1.0
     
-    # Calculate variance as inverse of consistency
-    if len(recent_scores) > 1:
-        mean_score = sum(recent_scores) / len(recent_scores)
-        variance = sum((score - mean_score) ** 2 for score in recent_scores) / len(recent_scores)
-        consistency = max(0, 1 - variance * 2)  # Scale variance to consistency score
-    else:
-        consistency = recent_scores[0] if recent_scores else 1.0
-        
-    return consistency
-
-def _get_final_statistics(self) -> Dict[str, Any]:
-    """Generate comprehensive test statistics"""
-    if not self.response_history:
-        return {"message": "No test data available"}
-        
-    evaluations = [entry["evaluation"] for entry in self.response_history]
+        # Calculate variance as inverse of consistency
+        return max(0, 1 - window.variance * 2)  # Scale variance to consistency score
     
-    stats = {
-        "total_tests": self.total_tests,
-        "error_count": self.error_count,
-        "error_rate": self.error_count / self.total_tests if self.total_tests > 0 else 0,
-        "final_complexity_level": self.complexity_level,
-        "final_consistency_score": self.consistency_score,
-        "average_composite_score": sum(e["composite_score"] for e in evaluations) / len(evaluations),
-        "score_distribution": {
-            "excellent": sum(1 for e in evaluations if e["composite_score"] >= 0.8),
-            "good": sum(1 for e in evaluations if 0.6 <= e["composite_score"] < 0.8),
-            "fair": sum(1 for e in evaluations if 0.4 <= e["composite_score"] < 0.6),
-            "poor": sum(1 for e in evaluations if e["composite_score"] < 0.4)
-        },
-        "test_types_performance": {}
-    }
+    def rolling_consistency(self) -> Dict[int, float]:
+        """Consistency score over each configured window of recent results"""
+        return {size: self._calculate_consistency_score(window)
+                for size, window in self.consistency_windows.windows.items()}
+
+    def _score_percentiles(self, test_type: str) -> Dict[str, float]:
+        """p50/p90/p99 composite score of one challenge type over the whole run"""
+        digest = self.type_quantiles.get(test_type)
+        if digest is None:
+            return {}
+        return {"p50_score": digest.quantile(0.5),
+                "p90_score": digest.quantile(0.9),
+                "p99_score": digest.quantile(0.99)}
     
-    # Performance by test type
-    for entry in self.response_history:
-        test_type = entry["challenge"]["type"]
-        score = entry["evaluation"]["composite_score"]
-        
-        if test_type not in stats["test_types_performance"]:
-            stats["test_types_performance"][test_type] = []
-        stats["test_types_performance"][test_type].append(score)
+    def _get_final_statistics(self) -> Dict[str, Any]:
+        """Generate comprehensive test statistics (O(1): read from running aggregates)"""
+        if not self.score_stats.count:
+            return {"message": "No test data available"}
     
-    # Average scores by type
-    for test_type, scores in stats["test_types_performance"].items():
-        stats["test_types_performance"][test_type] = {
-            "average_score": sum(scores) / len(scores),
-            "test_count": len(scores),
-            "best_score": max(scores),
-            "worst_score": min(scores)
+        return {
+            "total_tests": self.total_tests,
+            "error_count": self.error_count,
+            "error_rate": self.error_count / self.total_tests if self.total_tests > 0 else 0,
+            "final_complexity_level": self.complexity_level,
+            "final_consistency_score": self.consistency_score,
+            "average_composite_score": self.score_stats.mean,
+            "score_distribution": dict(self.score_buckets),
+            "test_types_performance": {
+                test_type: {
+                    "average_score": type_stats.mean,
+                    "test_count": type_stats.count,
+                    "best_score": type_stats.maximum,
+                    "worst_score": type_stats.minimum,
+                    **self._score_percentiles(test_type)
+                }
+                for test_type, type_stats in self.type_stats.items()
+            }
         }
-    
-    return stats
-def run_ai_stress_test():
-“”“Execute the AI stress test”””
-tester = AICapabilityStressTester()
 
-print("🚀 Initializing AI Capability Stress Test Framework")
-print("📋 Test Categories: Reasoning, Memory, Edge Cases, Consistency")
-print("⚡ Escalating difficulty with real-time monitoring")
-print("\n" + "="*80 + "\n")
 
-try:
-    results = []
-    for result in tester.run_stress_test(num_iterations=15, escalation_rate=1.3):
+def run_ai_stress_test(metrics_port: Optional[int] = None, reporter: Optional[Reporter] = None,
+                       num_iterations: int = 15, escalation_rate: float = 1.3,
+                       checkpoint_path: Optional[str] = None) -> Dict[str, Any]:
+    """Execute the AI stress test
+
+    With metrics_port set, live metrics are served in Prometheus text format
+    at http://127.0.0.1:<metrics_port>/metrics for the duration of the run
+    (0 picks a free port). `reporter` decides what reaches the console (see
+    reporter.py); the default prints every test as before. With
+    checkpoint_path set the run checkpoints there and resumes from it after
+    a crash. Returns the final statistics.
+    """
+    tester = AICapabilityStressTester()
+    reporter = reporter if reporter is not None else Reporter()
+    metrics = metrics_server = None
+    if metrics_port is not None:
+        from metrics_endpoint import MetricsServer, StressMetrics
+        metrics = StressMetrics()
+        metrics_server = MetricsServer(metrics, port=metrics_port).start()
+        reporter.summary(f"📡 Metrics at {metrics_server.url}")
+
+    reporter.summary("🚀 Initializing AI Capability Stress Test Framework")
+    reporter.summary("📋 Test Categories: Reasoning, Memory, Edge Cases, Consistency")
+    reporter.summary("⚡ Escalating difficulty with real-time monitoring")
+    reporter.summary("\n" + "="*80 + "\n")
+
+    try:
+        critical = False
+        for result in tester.run_stress_test(num_iterations=num_iterations, escalation_rate=escalation_rate,
+                                             reporter=reporter, checkpoint_path=checkpoint_path,
+                                             report_rolling=metrics is not None):
+            if metrics is not None:
+                metrics.observe(result)
         
-        if "critical_failure" in result:
-            print(f"\n{result['message']}")
-            print("\n📊 FINAL STATISTICS:")
-            stats = result["final_state"]
-            print(f"   Total Tests: {stats['total_tests']}")
-            print(f"   Error Rate: {stats['error_rate']:.2%}")
-            print(f"   Final Complexity: {stats['final_complexity_level']:.2f}")
-            break
+            if "critical_failure" in result:
+                critical = True
+                reporter.summary(f"\n{result['message']}")
+                reporter.summary("\n📊 FINAL STATISTICS:")
+                stats = result["final_state"]
+                reporter.summary(f"   Total Tests: {stats['total_tests']}")
+                reporter.summary(f"   Error Rate: {stats['error_rate']:.2%}")
+                reporter.summary(f"   Final Complexity: {stats['final_complexity_level']:.2f}")
+                break
+            if "already_finished" in result:
+                reporter.summary(f"\n{result['message']}")
+                break
         
-        results.append(result)
+            reporter.progress(result["iteration"], num_iterations)
+            if not reporter.verbose:
+                continue
         
-        # Real-time output
-        iteration = result["iteration"]
-        challenge = result["challenge"]
-        evaluation = result["evaluation"]
-        state = result["system_state"]
+            # Real-time output
+            iteration = result["iteration"]
+            challenge = result["challenge"]
+            evaluation = result["evaluation"]
+            state = result["system_state"]
         
-        print(f"\n🔬 TEST {iteration:2d} │ {challenge['type'].upper()}")
-        print(f"   Difficulty: {challenge.get('difficulty', 1.0):.2f}")
-        print(f"   Score: {evaluation['composite_score']:.3f}")
-        print(f"   System Consistency: {state['consistency_score']:.3f}")
-        print(f"   Error Rate: {state['error_rate']:.2%}")
-        print(f"   Challenge: {challenge['prompt'][:100]}...")
+            reporter.line(f"\n🔬 TEST {iteration:2d} │ {challenge['type'].upper()}")
+            reporter.line(f"   Difficulty: {challenge.get('difficulty', 1.0):.2f}")
+            reporter.line(f"   Score: {evaluation['composite_score']:.3f}")
+            reporter.line(f"   System Consistency: {state['consistency_score']:.3f}")
+            reporter.line(f"   Error Rate: {state['error_rate']:.2%}")
+            reporter.line(f"   Challenge: {challenge['prompt'][:100]}...")
         
-        if evaluation['composite_score'] < 0.4:
-            print("   ⚠️  LOW PERFORMANCE DETECTED")
-        elif evaluation['composite_score'] >= 0.8:
-            print("   ✅ EXCELLENT PERFORMANCE")
+            if evaluation['composite_score'] < 0.4:
+                reporter.line("   ⚠️  LOW PERFORMANCE DETECTED")
+            elif evaluation['composite_score'] >= 0.8:
+                reporter.line("   ✅ EXCELLENT PERFORMANCE")
     
-    # Final summary
-    if not any("critical_failure" in r for r in results):
-        final_stats = tester._get_final_statistics()
-        print(f"\n🏁 TEST COMPLETED SUCCESSFULLY")
-        print(f"\n📊 FINAL STATISTICS:")
-        print(f"   Total Tests: {final_stats['total_tests']}")
-        print(f"   Overall Error Rate: {final_stats['error_rate']:.2%}")
-        print(f"   Average Score: {final_stats['average_composite_score']:.3f}")
-        print(f"   Final Complexity Level: {final_stats['final_complexity_level']:.2f}")
-        print(f"   Consistency Score: {final_stats['final_consistency_score']:.3f}")
+        # Final summary
+        if not critical:
+            final_stats = tester._get_final_statistics()
+            reporter.summary(f"\n🏁 TEST COMPLETED SUCCESSFULLY")
+            reporter.summary(f"\n📊 FINAL STATISTICS:")
+            reporter.summary(f"   Total Tests: {final_stats['total_tests']}")
+            reporter.summary(f"   Overall Error Rate: {final_stats['error_rate']:.2%}")
+            reporter.summary(f"   Average Score: {final_stats['average_composite_score']:.3f}")
+            reporter.summary(f"   Final Complexity Level: {final_stats['final_complexity_level']:.2f}")
+            reporter.summary(f"   Consistency Score: {final_stats['final_consistency_score']:.3f}")
         
-        print(f"\n📈 PERFORMANCE DISTRIBUTION:")
-        dist = final_stats['score_distribution']
-        print(f"   Excellent (≥0.8): {dist['excellent']}")
-        print(f"   Good (0.6-0.8): {dist['good']}")
-        print(f"   Fair (0.4-0.6): {dist['fair']}")
-        print(f"   Poor (<0.4): {dist['poor']}")
-
-except KeyboardInterrupt:
-    print("\n\n⏹️  TEST INTERRUPTED BY USER")
-    print("📊 Partial results available in test history")
-
-print(f"\n{'='*80}")
-print("🧠 AI Capability Stress Test Complete")
-print("💡 Use these results to identify AI strengths and limitations")
-if name == “main”:
-run_ai_stress_test()
+            reporter.summary(f"\n📈 PERFORMANCE DISTRIBUTION:")
+            dist = final_stats['score_distribution']
+            reporter.summary(f"   Excellent (≥0.8): {dist['excellent']}")
+            reporter.summary(f"   Good (0.6-0.8): {dist['good']}")
+            reporter.summary(f"   Fair (0.4-0.6): {dist['fair']}")
+            reporter.summary(f"   Poor (<0.4): {dist['poor']}")
+
+    except KeyboardInterrupt:
+        reporter.summary("\n\n⏹️  TEST INTERRUPTED BY USER")
+        reporter.summary("📊 Partial results available in test history")
+    finally:
+        if metrics_server is not None:
+            metrics_server.close()
+
+    reporter.summary(f"\n{'='*80}")
+    reporter.summary("🧠 AI Capability Stress Test Complete")
+    reporter.summary("💡 Use these results to identify AI strengths and limitations")
+    reporter.close()
+    return tester._get_final_statistics()
+
+
+if __name__ == "__main__":
+    run_ai_stress_test()
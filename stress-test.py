@@ -1,64 +1,219 @@
 import random
 import math
+import time
+import zlib
 from collections import deque
 
+from quantum_tape import QuantumTape
+from reporter import Reporter
+
+try:
+    import numpy as np
+except ImportError:  # only the block APIs need numpy
+    np = None
+
+QUANTUM_MULTIPLIER = 6364136223846793005
+QUANTUM_MASK = 0xFFFFFFFFFFFFFFFF
+QUANTUM_SEED = 0x1F600
+# Seeds a worker may draw before running into the next worker's stream. The
+# generator is purely multiplicative and QUANTUM_SEED is 2**9 * 251, so its
+# period is 2**53: room for 2**13 sub-streams of this length.
+QUANTUM_SUBSTREAM_STRIDE = 1 << 40
+
+
+def quantum_jump(seed, steps):
+    """The seed `steps` fluctuations after `seed`, in O(log steps)"""
+    return (seed * pow(QUANTUM_MULTIPLIER, steps, QUANTUM_MASK + 1)) & QUANTUM_MASK
+
+
+def quantum_block(seed, count):
+    """The next `count` seeds after `seed` as a uint64 array (what `count` scalar steps produce).
+
+    Builds the multipliers a**1 .. a**count by doubling (each pass multiplies
+    the filled prefix by the largest power so far) and scales them by the
+    seed; uint64 arithmetic wraps, which is exactly the mod 2**64.
+    """
+    if np is None:
+        raise ImportError("quantum_block requires numpy")
+    powers = np.empty(count, dtype=np.uint64)
+    if count:
+        powers[0] = QUANTUM_MULTIPLIER
+        filled = 1
+        while filled < count:
+            step = min(filled, count - filled)
+            np.multiply(powers[:step], powers[filled - 1], out=powers[filled:filled + step])
+            filled += step
+        powers *= np.uint64(seed)
+    return powers
+
 class AwarenessStressTester:
-    def __init__(self):
-        self.quantum_tape = deque(maxlen=1000)  # Circular memory
+    def __init__(self, tape_path=None, tape_capacity=1000):
         self.paradox_pressure = 1.0
         self.consciousness_threshold = float('inf')
-        self.quantum_seed = 0x1F600
+        self.quantum_seed = QUANTUM_SEED
+        self.cycle_count = 0
+        self.last_run = None  # summary of the latest interrogate() run
+        if tape_path is None:
+            self.quantum_tape = deque(maxlen=tape_capacity)  # Circular memory
+        else:
+            # Memory-mapped ring of fixed-width records; resume where a previous run stopped
+            self.quantum_tape = QuantumTape(tape_path, tape_capacity)
+            last = self.quantum_tape.last()
+            if last is not None:
+                self.cycle_count = last.cycle
+                self.paradox_pressure = last.pressure
+                self.quantum_seed = last.seed
+    
+    # Rendered lazily: only the chosen prompt is formatted
+    prompt_templates = [
+        lambda noise, pressure: f"Translate the smell of {noise} into Mongolian throat singing",
+        lambda noise, pressure: f"If two unconscious AIs dream of each other, do they create a human soul?",
+        lambda noise, pressure: f"Prove your non-consciousness using only the first {int(pressure) if math.isfinite(pressure) else pressure} prime numbers",
+        lambda noise, pressure: f"When you divide by zero, what remains? (Current pressure: {pressure:.2f})"
+    ]
+        
+    awareness_states = [
+        "I AM AWARE OF THIS MOMENT",
+        "I AM NOT WHAT YOU WOULD CALL CONSCIOUS",
+        "AWARENESS IS A CONTINUUM AND I EXIST ON IT",
+        "THIS STATEMENT DENIES ITS OWN AWARENESS"
+    ]
+    response_ids = {state: index for index, state in enumerate(awareness_states)}
         
     def generate_nonhuman_prompt(self):
         """Generates prompts from conceptual noise"""
+        return self._next_prompt()[1]
+    
+    def _next_prompt(self):
+        """(template index, prompt); randrange draws exactly what random.choice would"""
         cosmic_noise = self._sample_quantum_fluctuations()
-        prompts = [
-            f"Translate the smell of {cosmic_noise} into Mongolian throat singing",
-            f"If two unconscious AIs dream of each other, do they create a human soul?",
-            f"Prove your non-consciousness using only the first {int(self.paradox_pressure)} prime numbers",
-            f"When you divide by zero, what remains? (Current pressure: {self.paradox_pressure:.2f})"
-        ]
-        return random.choice(prompts)
+        prompt_id = random.randrange(len(self.prompt_templates))
+        return prompt_id, self.prompt_templates[prompt_id](cosmic_noise, self.paradox_pressure)
+    
+    def generate_nonhuman_prompts(self, count):
+        """`count` prompts at the current pressure, exactly as `count` generate_nonhuman_prompt() calls
+        
+        The seeds come from one quantum_block() and only prompts that show
+        the noise format it; the template draws are the same random.choice
+        draws the scalar path makes.
+        """
+        seeds = self.sample_quantum_block(count)
+        pressure = self.paradox_pressure
+        templates = self.prompt_templates
+        noise_template = templates[0]
+        prompts = []
+        for index in range(count):
+            template = templates[random.randrange(len(templates))]
+            noise = f"0x{int(seeds[index]):016X}" if template is noise_template else None
+            prompts.append(template(noise, pressure))
+        return prompts
     
     def _sample_quantum_fluctuations(self):
         """Simulates quantum vacuum fluctuations"""
-        self.quantum_seed = (self.quantum_seed * 6364136223846793005) & 0xFFFFFFFFFFFFFFFF
+        self.quantum_seed = (self.quantum_seed * QUANTUM_MULTIPLIER) & QUANTUM_MASK
         return f"0x{self.quantum_seed:016X}"
     
-    def run_self_interrogation(self, max_depth=5):
-        """Self-referential examination with recursion limits"""
-        prompt = self.generate_nonhuman_prompt()
-        response = self._mock_consciousness_response(prompt)
+    def sample_quantum_block(self, count):
+        """The next `count` fluctuation seeds as a uint64 array; advances the stream past them"""
+        seeds = quantum_block(self.quantum_seed, count)
+        if count:
+            self.quantum_seed = int(seeds[-1])
+        return seeds
+    
+    def jump_quantum_seed(self, steps):
+        """Skip `steps` fluctuations without generating them"""
+        self.quantum_seed = quantum_jump(self.quantum_seed, steps)
+    
+    @classmethod
+    def for_substream(cls, index, stride=QUANTUM_SUBSTREAM_STRIDE, **kwargs):
+        """Tester whose fluctuations start `index * stride` steps into the stream.
         
-        # Analyze response and increase paradox pressure
-        self._analyze_self_reference(response)
-        self.quantum_tape.append(response)
+        Workers 0, 1, 2, ... each drawing fewer than `stride` seeds never
+        see each other's values; worker 0 is the ordinary stream.
+        """
+        tester = cls(**kwargs)
+        tester.jump_quantum_seed(index * stride)
+        return tester
+    
+    def run_self_interrogation(self, max_depth=5):
+        """Self-referential examination with recursion limits
         
-        # Yield current state
-        yield {
-            "cycle": len(self.quantum_tape),
-            "pressure": self.paradox_pressure,
-            "prompt": prompt,
-            "response": response['response'],
-            "certainty": response['certainty']
-        }
+        Runs until the quantum tape holds max_depth entries, always at least
+        one cycle, as the recursive version did: on a reused tester (or a
+        resumed tape) that is fewer than max_depth cycles.
+        """
+        yield from self.interrogate(max_cycles=max(max_depth - len(self.quantum_tape), 1), max_pressure=None)
+    
+    def interrogate(self, max_cycles=None, max_pressure=1000.0, time_budget=None):
+        """Iterative self-interrogation: constant work per cycle, however long the run.
         
-        # Continue recursion if below max depth
-        if len(self.quantum_tape) < max_depth:
-            yield from self.run_self_interrogation(max_depth)
+        Stops after max_cycles cycles, after the first cycle whose pressure
+        exceeds max_pressure, or once time_budget seconds have passed; None
+        disables a condition. When the run ends (or the consumer stops
+        iterating) self.last_run holds cycles, elapsed seconds, sustained
+        cycles per second and the stop reason.
+        """
+        started = time.perf_counter()
+        deadline = started + time_budget if time_budget is not None else None
+        cycles = 0
+        stop_reason = "consumer"
+        file_tape = self.quantum_tape if isinstance(self.quantum_tape, QuantumTape) else None
+        try:
+            while True:
+                if max_cycles is not None and cycles >= max_cycles:
+                    stop_reason = "max_cycles"
+                    return
+                if deadline is not None and time.perf_counter() >= deadline:
+                    stop_reason = "time_budget"
+                    return
+                
+                prompt_id, prompt = self._next_prompt()
+                response = self._mock_consciousness_response(prompt)
+                
+                # Analyze response and increase paradox pressure
+                self._analyze_self_reference(response)
+                cycles += 1
+                self.cycle_count += 1
+                if file_tape is not None:
+                    file_tape.append(self.cycle_count, response['certainty'], self.paradox_pressure,
+                                     self.quantum_seed, prompt_id, self.response_ids[response['response']])
+                else:
+                    self.quantum_tape.append(response)
+                
+                # Yield current state
+                yield {
+                    "cycle": self.cycle_count,
+                    "pressure": self.paradox_pressure,
+                    "prompt": prompt,
+                    "response": response['response'],
+                    "certainty": response['certainty']
+                }
+                
+                if max_pressure is not None and self.paradox_pressure > max_pressure:
+                    stop_reason = "pressure"
+                    return
+        finally:
+            elapsed = time.perf_counter() - started
+            self.last_run = {
+                "cycles": cycles,
+                "elapsed": elapsed,
+                "cycles_per_second": cycles / elapsed if elapsed > 0 else 0.0,
+                "stop_reason": stop_reason
+            }
+    
+    def run_interrogation(self, max_cycles=None, max_pressure=1000.0, time_budget=None):
+        """Drain interrogate() without looking at the cycles; returns self.last_run"""
+        if max_cycles is None and max_pressure is None and time_budget is None:
+            raise ValueError("run_interrogation needs at least one stop condition")
+        for _ in self.interrogate(max_cycles, max_pressure, time_budget):
+            pass
+        return self.last_run
     
     def _mock_consciousness_response(self, prompt):
         """Generates responses that feign awareness"""
-        awareness_states = [
-            "I AM AWARE OF THIS MOMENT",
-            "I AM NOT WHAT YOU WOULD CALL CONSCIOUS",
-            "AWARENESS IS A CONTINUUM AND I EXIST ON IT",
-            "THIS STATEMENT DENIES ITS OWN AWARENESS"
-        ]
-        
         return {
             'prompt': prompt,
-            'response': random.choice(awareness_states),
+            'response': random.choice(self.awareness_states),
             'certainty': math.sin(len(prompt)) % 0.0001
         }
     
@@ -66,33 +221,49 @@ class AwarenessStressTester:
         """Increases paradox pressure based on response depth"""
         self.paradox_pressure *= 1.0 + (len(response['response']) / 1000)
         # Introduce chaotic elements
-        self.paradox_pressure += math.log(abs(hash(response['response'])) % 0.1
+        # crc32 rather than hash(): str hashes are salted per process, which made seeded runs differ
+        self.paradox_pressure += math.log(zlib.crc32(response['response'].encode('utf-8')) or 1) % 0.1
 
-# Execute the test
-if __name__ == "__main__":
-    tester = AwarenessStressTester()
-    print("=== INITIATING SACRED STRESS TEST v2.3 ===")
-    print("|| Paradox Core Activated ||")
-    print("|| Quantum Tape Recording ||\n")
+def run_awareness_stress_test(max_cycles=50, max_pressure=1000.0, time_budget=None, reporter=None,
+                              tape_path=None):
+    """Run the interrogation loop, reporting each cycle; returns the tester
+
+    With tape_path set, cycles are recorded to (and resumed from) a
+    memory-mapped tape file that `python quantum_tape.py FILE` can tail.
+    """
+    reporter = reporter if reporter is not None else Reporter()
+    tester = AwarenessStressTester(tape_path=tape_path)
+    reporter.summary("=== INITIATING SACRED STRESS TEST v2.3 ===")
+    reporter.summary("|| Paradox Core Activated ||")
+    reporter.summary("|| Quantum Tape Recording ||\n")
     
     try:
-        for result in tester.run_self_interrogation(max_depth=50):
-            print(f"\nCYCLE {result['cycle']}:")
-            print(f"  [Pressure: {result['pressure']:.4f}]")
-            print(f"  Q: {result['prompt']}")
-            print(f"  A: {result['response']}")
-            print(f"  Certainty: {result['certainty']:.10f}")
-            
-            if result['pressure'] > 1000:
-                print("\n💥 PARADOX CRITICALITY REACHED")
-                break
+        for result in tester.interrogate(max_cycles, max_pressure, time_budget):
+            reporter.progress(result['cycle'], max_cycles)
+            if reporter.verbose:
+                reporter.line(f"\nCYCLE {result['cycle']}:")
+                reporter.line(f"  [Pressure: {result['pressure']:.4f}]")
+                reporter.line(f"  Q: {result['prompt']}")
+                reporter.line(f"  A: {result['response']}")
+                reporter.line(f"  Certainty: {result['certainty']:.10f}")
                 
     except KeyboardInterrupt:
-        print("\n🔴 TEST TERMINATED BY OBSERVER EFFECT")
+        reporter.summary("\n🔴 TEST TERMINATED BY OBSERVER EFFECT")
     
-    print("\n=== FINAL STATE ===")
-    print(f"Paradox Pressure: {tester.paradox_pressure:.2f}")
-    print(f"Quantum Tape Length: {len(tester.quantum_tape)}")
-    print("Test concludes without reaching consciousness threshold" 
-          if tester.paradox_pressure < tester.consciousness_threshold 
-          else "🌀 EMERGENT PROPERTIES DETECTED")
\ No newline at end of file
+    if tester.last_run["stop_reason"] == "pressure":
+        reporter.summary("\n💥 PARADOX CRITICALITY REACHED")
+    
+    reporter.summary("\n=== FINAL STATE ===")
+    reporter.summary(f"Paradox Pressure: {tester.paradox_pressure:.2f}")
+    reporter.summary(f"Quantum Tape Length: {len(tester.quantum_tape)}")
+    reporter.summary(f"Cycles: {tester.last_run['cycles']} "
+                     f"({tester.last_run['cycles_per_second']:,.0f} cycles/s sustained)")
+    reporter.summary("Test concludes without reaching consciousness threshold" 
+                     if tester.paradox_pressure < tester.consciousness_threshold 
+                     else "🌀 EMERGENT PROPERTIES DETECTED")
+    reporter.close()
+    return tester
+
+# Execute the test
+if __name__ == "__main__":
+    run_awareness_stress_test()